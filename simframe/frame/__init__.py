@@ -1,17 +1,25 @@
 """This package contains the core infrastructure of ``simframe``."""
 
 from simframe.frame.abstractgroup import AbstractGroup
+from simframe.frame.arena import Arena
 from simframe.frame.field import Field
 from simframe.frame.frame import Frame
 from simframe.frame.group import Group
 from simframe.frame.heartbeat import Heartbeat
 from simframe.frame.intvar import IntVar
+from simframe.frame.memorytracker import MemoryTracker
+from simframe.frame.profiler import Profiler
+from simframe.frame.scheduler import Scheduler
 from simframe.frame.updater import Updater
 
 __all__ = ["AbstractGroup",
+           "Arena",
            "Field",
            "Frame",
            "Group",
            "Heartbeat",
            "IntVar",
+           "MemoryTracker",
+           "Profiler",
+           "Scheduler",
            "Updater"]
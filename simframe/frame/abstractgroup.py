@@ -14,6 +14,8 @@ class AbstractGroup(object):
 
     __name__ = ""
     _description = ""
+    # Counter that is increased whenever the updater or a member is replaced
+    _generation = 0
 
     @property
     def description(self):
@@ -33,6 +35,9 @@ class AbstractGroup(object):
 
     @updater.setter
     def updater(self, value):
+        # Compiled updates can only depend on an updater that was set before
+        if "_updater" in self.__dict__:
+            self._generation += 1
         if isinstance(value, Heartbeat):
             self._updater = value
         else:
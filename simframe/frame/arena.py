@@ -0,0 +1,208 @@
+import numpy as np
+import weakref
+
+from simframe.frame.abstractgroup import AbstractGroup
+from simframe.utils.format import byteformat
+
+
+class Arena(object):
+    """Class for storing the data of all fields of a ``Frame`` in contiguous memory.
+
+    If an ``Arena`` is assigned to ``Frame.arena``, all fields that are added afterwards with ``Group.addfield()``
+    are views into large, aligned memory blocks. Copying the state of the whole ``Frame`` is then a single copy
+    per block.
+
+    Notes
+    -----
+    Fields are placed one after another into the current block. If a field does not fit into the current block,
+    a new block is allocated. Existing fields are never moved.
+
+    Fields with object data type and fields that are added with ``copy=False`` are not placed into the ``Arena``.
+
+    If ``path`` is given, the blocks are memory-mapped to the files ``<path>.0``, ``<path>.1``, etc.
+
+    The ``Arena`` is not restored from dump files. Fields of a restored ``Frame`` are independent arrays."""
+
+    __name__ = "Arena"
+
+    def __init__(self, capacity=1048576, alignment=64, path=None, description=""):
+        """Parameters
+        ----------
+        capacity : int, optional, default : 1048576
+            Size of the memory blocks in bytes. Larger fields get their own block
+        alignment : int, optional, default : 64
+            Alignment of the fields in bytes. Has to be a power of two
+        path : str or None, optional, default : None
+            If not None, the blocks are memory-mapped to files with this prefix
+        description : string, optional, default : ""
+            Descriptive string of the arena"""
+        self.capacity = capacity
+        self.alignment = alignment
+        self.path = path
+        self.description = description
+        self._blocks = []
+        self._used = []
+        self._fields = []
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The blocks are not pickled. Fields are pickled on their own.
+        state["_blocks"] = []
+        state["_used"] = []
+        state["_fields"] = []
+        return state
+
+    def __str__(self):
+        return AbstractGroup.__str__(self)
+
+    def __repr__(self):
+        ret = self.__str__()+"\n"
+        ret += f"""{"-" * (len(self.__str__()))}\n"""
+        ret += f"""    Blocks    : {len(self._blocks)}\n"""
+        ret += f"""    Used      : {byteformat(self.nbytes)}\n"""
+        ret += f"""    Allocated : {byteformat(sum(block.nbytes for block in self._blocks))}"""
+        return ret
+
+    @property
+    def alignment(self):
+        '''Alignment of the fields in bytes.'''
+        return self._alignment
+
+    @alignment.setter
+    def alignment(self, value):
+        if not isinstance(value, int):
+            raise TypeError("<alignment> has to be of type int.")
+        if value < 1 or value & (value-1):
+            raise ValueError("<alignment> has to be a power of two.")
+        self._alignment = value
+
+    @property
+    def blocks(self):
+        '''List with the used parts of the memory blocks.'''
+        return [block[:used] for block, used in zip(self._blocks, self._used)]
+
+    @property
+    def capacity(self):
+        '''Size of the memory blocks in bytes.'''
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value):
+        if not isinstance(value, int):
+            raise TypeError("<capacity> has to be of type int.")
+        if value < 1:
+            raise ValueError("<capacity> has to be positive.")
+        self._capacity = value
+
+    @property
+    def description(self):
+        '''Description of ``Arena``.'''
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        if not isinstance(value, str):
+            raise TypeError("<description> has to be of type str.")
+        self._description = value
+
+    @property
+    def nbytes(self):
+        '''Number of used bytes.'''
+        return int(sum(self._used))
+
+    @property
+    def path(self):
+        '''Prefix of the files to which the blocks are memory-mapped or ``None``.'''
+        return self._path
+
+    @path.setter
+    def path(self, value):
+        if value is not None and not isinstance(value, str):
+            raise TypeError("<path> has to be of type str or None.")
+        self._path = value
+
+    def snapshot(self):
+        """Copies the content of the ``Arena``.
+
+        Returns
+        -------
+        snapshot : list
+            List with copies of the used parts of all blocks"""
+        return [block.copy() for block in self.blocks]
+
+    def restore(self, snapshot):
+        """Writes a snapshot back into the ``Arena``.
+
+        Parameters
+        ----------
+        snapshot : list
+            Snapshot that was created with ``Arena.snapshot()``
+
+        Notes
+        -----
+        The versions of all fields in the ``Arena`` are increased."""
+        if len(snapshot) > len(self._blocks):
+            raise ValueError("Snapshot does not match arena.")
+        for block, used, data in zip(self._blocks, self._used, snapshot):
+            if data.nbytes > used:
+                raise ValueError("Snapshot does not match arena.")
+            block[:data.nbytes] = data
+        for ref in self._fields:
+            field = ref()
+            if field is not None:
+                field.touch()
+
+    def _register(self, field):
+        """Registers a field whose data is placed into the ``Arena``.
+
+        Parameters
+        ----------
+        field : Field
+            Field that is a view into the arena"""
+        self._fields.append(weakref.ref(field))
+
+    def _allocate(self, value):
+        """Places a value into the ``Arena``.
+
+        Parameters
+        ----------
+        value : number, array, string
+            Value to be placed into the arena
+
+        Returns
+        -------
+        arr : ndarray or None
+            View into the arena that contains a copy of value. None if value cannot be placed into the arena"""
+        value = np.asarray(value)
+        if value.dtype.hasobject:
+            return None
+        nbytes = value.nbytes
+        i = len(self._blocks) - 1
+        if i >= 0:
+            offset = -(-self._used[i] // self.alignment) * self.alignment
+        if i < 0 or offset + nbytes > self._blocks[i].nbytes:
+            self._addblock(max(nbytes, self.capacity))
+            i += 1
+            offset = 0
+        arr = self._blocks[i][offset:offset+nbytes].view(
+            value.dtype).reshape(value.shape)
+        arr[...] = value
+        self._used[i] = offset + nbytes
+        return arr
+
+    def _addblock(self, nbytes):
+        """Allocates a new aligned block.
+
+        Parameters
+        ----------
+        nbytes : int
+            Minimal size of the block in bytes"""
+        size = nbytes + self.alignment
+        if self.path is None:
+            buf = np.zeros(size, dtype=np.uint8)
+        else:
+            buf = np.memmap("{}.{}".format(self.path, len(self._blocks)),
+                            dtype=np.uint8, mode="w+", shape=(size,))
+        start = -buf.ctypes.data % self.alignment
+        self._blocks.append(buf[start:start+nbytes])
+        self._used.append(0)
@@ -18,9 +18,14 @@ class Field(np.ndarray, AbstractGroup):
     -----
     When ``Field.update()`` is called ``Field`` will be updated according return value of the ``updater`` of the
     ``Heartbeat`` object assigned to the ``Field``. The function that is updating ``Field`` needs the parent ``Frame``
-    object as first positional argument."""
+    object as first positional argument.
+
+    Every ``Field`` carries a ``version`` counter that is increased whenever the ``Field`` is updated by its
+    ``updater`` or by the integrator. Updaters with declared inputs use it to skip unnecessary updates."""
 
     __name__ = "Field"
+    _version = 0
+    _viewof = None
 
     def __new__(cls, owner, value, updater=None, differentiator=None, jacobinator=None, description="", constant=False, save=True, copy=False):
         """Parameters
@@ -62,14 +67,18 @@ class Field(np.ndarray, AbstractGroup):
     def __array_finalize__(self, obj):
         if obj is None:
             return
+        # Private attributes are set directly to not invalidate compiled updates of the frame.
         self._owner = getattr(obj, "_owner", None)
-        self.updater = getattr(obj, "updater", Heartbeat(None))
-        self.differentiator = getattr(obj, "differentiator", Heartbeat(None))
-        self.jacobinator = getattr(obj, "jacobinator", Heartbeat(None))
-        self.description = getattr(obj, "description", "")
-        self.constant = getattr(obj, "constant", False)
+        self._updater = getattr(obj, "_updater", None) or Heartbeat(None)
+        self._differentiator = getattr(
+            obj, "_differentiator", None) or Heartbeat(None)
+        self._jacobinator = getattr(
+            obj, "_jacobinator", None) or Heartbeat(None)
+        self._description = getattr(obj, "_description", "")
+        self._constant = getattr(obj, "_constant", False)
         self._save = getattr(obj, "_save", True)
         self._buffer = getattr(obj, "_buffer", None)
+        self._version = getattr(obj, "_version", 0)
 
     def __str__(self):
         ret = AbstractGroup.__str__(self)
@@ -87,6 +96,9 @@ class Field(np.ndarray, AbstractGroup):
         Custom ``__reduce__`` function that carries extra information about
         custom attributes of ``Field`` class.
         """
+        # Views are rebuilt from their parent to keep sharing memory.
+        if self._viewof is not None:
+            return (_rebuildview, (type(self),) + self._viewof, self.__dict__)
         pickled_state = super(Field, self).__reduce__()
         new_state = pickled_state[2] + (self.__dict__,)
         return (pickled_state[0], pickled_state[1], new_state)
@@ -96,6 +108,10 @@ class Field(np.ndarray, AbstractGroup):
         Custom ``__setstate__`` function that adds extra
         custom attributes of ``Field`` class.
         """
+        # Dump files with out-of-band data only carry the attributes
+        if isinstance(state, dict):
+            self.__dict__.update(state)
+            return
         self.__dict__.update(state[-1])
         super(Field, self).__setstate__(state[0:-1])
 
@@ -138,6 +154,33 @@ class Field(np.ndarray, AbstractGroup):
     def buffer(self, value):
         raise RuntimeError("Do not set buffer directly.")
 
+    @property
+    def viewof(self):
+        '''Parent ``Field`` if ``Field`` is a view of another ``Field``. ``None`` otherwise.'''
+        return self._viewof[0] if self._viewof is not None else None
+
+    @viewof.setter
+    def viewof(self, value):
+        raise RuntimeError("Do not set viewof directly.")
+
+    @property
+    def version(self):
+        '''Counter that is increased whenever the value of ``Field`` is set.'''
+        return self._version
+
+    @version.setter
+    def version(self, value):
+        raise RuntimeError("Do not set version directly.")
+
+    def touch(self):
+        """Increases the ``version`` of the ``Field``.
+
+        Notes
+        -----
+        This has to be called after the ``Field`` was modified directly, e.g., with ``Field[...] = value``,
+        if other fields have updaters that depend on it."""
+        self._version += 1
+
     @property
     def differentiator(self):
         '''``Heartbeat`` object with instructions for calculating the derivative of ``Field``'''
@@ -198,7 +241,9 @@ class Field(np.ndarray, AbstractGroup):
         integration variable ``IntVar`` as second positional, and the ``Field`` itself as third positional argument.
 
         The ``differentiator`` is not set, it will try to calculate the derivative from the Jacobian.
-        If ``jacobinator`` is also not set, it will return ``False``"""
+        If ``jacobinator`` is also not set, it will return ``False``
+
+        Intermediate results can be shared within a stage via ``Integrator.memo``."""
         if x is None:
             if self._owner.integrator is None:
                 raise RuntimeError("x not given and no integrator set.")
@@ -207,12 +252,43 @@ class Field(np.ndarray, AbstractGroup):
                     "x not given and no integration variable set in integrator.")
             x = self._owner.integrator.var
         Y = Y if Y is not None else self
+        integrator = getattr(self._owner, "integrator", None)
+        if integrator is None:
+            return self._derivative(x, Y, None, *args, **kwargs)
+        previous = integrator.memo._enter(Y is self and x is integrator.var)
+        try:
+            return self._derivative(x, Y, integrator, *args, **kwargs)
+        finally:
+            integrator.memo._exit(previous)
+
+    def _derivative(self, x, Y, integrator, *args, **kwargs):
+        """Evaluates the differentiator or the jacobinator.
+
+        Parameters
+        ----------
+        x : IntVar
+            Integration variable
+        Y : Field
+            Value at which the derivative is evaluated
+        integrator : Integrator or None
+            Integrator of the parent frame
+        args : additional positional arguments
+        kwargs : additional keyword arguments
+
+        Returns
+        -------
+        deriv : derivative of the field"""
         deriv = self.differentiator.beat(self._owner, x, Y, *args, **kwargs)
         if deriv is not None:
-            return deriv
+            # Only evaluations of the differentiator are counted
+            if integrator is not None:
+                integrator.stats.nfev += 1
+            return self._cast(deriv)
         jac = self.jacobinator.beat(self._owner, x)
         if jac is not None:
-            return np.dot(jac, Y)
+            if integrator is not None:
+                integrator.stats.njev += 1
+            return np.dot(self._cast(jac), Y)
         else:
             # If no differentiator or jacobian is set we return zeros.
             return np.zeros_like(self)
@@ -239,7 +315,30 @@ class Field(np.ndarray, AbstractGroup):
                 raise RuntimeError(
                     "x not given and no integration variable set in integrator.")
             x = self._owner.integrator.var
-        return self.jacobinator.beat(self._owner, x, *args, **kwargs)
+        integrator = getattr(self._owner, "integrator", None)
+        if integrator is None:
+            return self._cast(self.jacobinator.beat(self._owner, x, *args, **kwargs))
+        integrator.stats.njev += 1
+        previous = integrator.memo._enter(x is integrator.var)
+        try:
+            return self._cast(self.jacobinator.beat(self._owner, x, *args, **kwargs))
+        finally:
+            integrator.memo._exit(previous)
+
+    def _cast(self, value):
+        """Casts a value to the data type of the ``Field``, if the parent ``Frame`` has a ``dtype``.
+
+        Parameters
+        ----------
+        value : array or None
+            Value to be cast
+
+        Returns
+        -------
+        value : Value with data type of the ``Field``"""
+        if value is None or getattr(self._owner, "dtype", None) is None or self.dtype.kind != "f":
+            return value
+        return np.asarray(value, dtype=self.dtype)
 
     def _setvalue(self, value):
         """Function to set a value to the field. Direct assignement of values does overwrite the Field object.
@@ -254,3 +353,84 @@ class Field(np.ndarray, AbstractGroup):
         if value.shape == ():
             value = np.array([value])
         self.setfield(value, self.dtype)
+        self._version += 1
+
+
+def _normalizeindex(index):
+    """Checks if an index is a basic index that creates views and converts it into a tuple.
+
+    Parameters
+    ----------
+    index : int, slice, Ellipsis, or tuple
+        Index to be checked
+
+    Returns
+    -------
+    index : tuple
+        Index as tuple containing Ellipsis"""
+    if not isinstance(index, tuple):
+        index = (index,)
+    ret = []
+    for idx in index:
+        if isinstance(idx, (int, np.integer)) and not isinstance(idx, bool):
+            ret.append(int(idx))
+        elif isinstance(idx, slice):
+            for val in [idx.start, idx.stop, idx.step]:
+                if val is not None and not isinstance(val, (int, np.integer)):
+                    raise ValueError("Slices can only contain integers.")
+            ret.append(slice(*[None if val is None else int(val)
+                               for val in [idx.start, idx.stop, idx.step]]))
+        elif idx is Ellipsis:
+            ret.append(idx)
+        else:
+            raise ValueError(
+                "<view> can only contain integers, slices, and Ellipsis.")
+    # Ellipsis makes sure that integer indices return views, not scalars
+    if Ellipsis not in ret:
+        ret.append(Ellipsis)
+    return tuple(ret)
+
+
+def _view(parent, index, shape=None):
+    """Returns a view into the data of an array.
+
+    Parameters
+    ----------
+    parent : array
+        Array into which the view is created
+    index : tuple
+        Normalized index
+    shape : tuple or None, optional, default : None
+        New shape of the view
+
+    Returns
+    -------
+    view : numpy.ndarray
+        View into parent"""
+    ret = np.asarray(parent)[index]
+    if shape is not None:
+        ret = ret.reshape(shape)
+    if ret.size == 1:
+        ret = ret.squeeze()
+    return ret
+
+
+def _rebuildview(cls, parent, index, shape):
+    """Helper function that rebuilds a view ``Field`` from its parent.
+
+    Parameters
+    ----------
+    cls : type
+        Class of the view
+    parent : Field
+        Parent field
+    index : tuple
+        Normalized index
+    shape : tuple or None
+        Shape of the view
+
+    Returns
+    -------
+    obj : cls
+        View into parent"""
+    return _view(parent, index, shape).view(cls)
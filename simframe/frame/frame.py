@@ -1,16 +1,23 @@
 from datetime import timedelta
+from functools import partial
 import inspect
 import numpy as np
 import signal
 from time import monotonic
 
+from simframe.frame.arena import Arena
+from simframe.frame.field import Field
 from simframe.frame.group import Group
+from simframe.frame.group import _compileupdate
 from simframe.frame.intvar import IntVar
+from simframe.frame.memorytracker import MemoryTracker
+from simframe.frame.profiler import Profiler
 
 from simframe.integration.integrator import Integrator
 from simframe.io.writer import Writer
 from simframe.io.progress import Progressbar
 from simframe.utils.color import colorize
+from simframe.utils.simplenamespace import SimpleNamespace
 from simframe.utils.signalhandler import Listener
 from simframe.utils.signalhandler import events
 
@@ -24,8 +31,13 @@ class Frame(Group):
     ``Frame`` has additional functionality for writing output files and for integration."""
 
     __name__ = "Frame"
+    _arena = None
+    _compiled = None
+    _dtype = None
+    _memorytracker = None
+    _profiler = None
 
-    def __init__(self, integrator=None, listener=None, writer=None, updater=None, verbosity=2, progressbar=None, description=""):
+    def __init__(self, integrator=None, listener=None, writer=None, updater=None, verbosity=2, progressbar=None, profiler=None, arena=None, dtype=None, memorytracker=None, description=""):
         """
         The parent Frame object.
 
@@ -43,9 +55,23 @@ class Frame(Group):
             Level of verbosity
         progressbar : Progresbar or None, optional, default : None
             Progressbar. If None, standard is used
+        profiler : Profiler or None, optional, default : None
+            Profiler for measuring execution times. If None, no profiling is done
+        arena : Arena or None, optional, default : None
+            Arena in which the fields are stored. If None, every field is allocated separately
+        dtype : data type or None, optional, default : None
+            Floating point precision of the fields. If None, the data types of the values are kept
+        memorytracker : MemoryTracker or None, optional, default : None
+            Tracker for measuring the memory consumption. If None, no memory tracing is done
         description : string, optional, default : ""
             Descriptive string of the frame object"""
         super().__init__(self, updater=updater, description=description)
+        if arena is not None:
+            self.arena = arena
+        if dtype is not None:
+            self.dtype = dtype
+        if memorytracker is not None:
+            self.memorytracker = memorytracker
         self.integrator = integrator
         # Setting up the default listener
         if listener is None:
@@ -61,9 +87,42 @@ class Frame(Group):
         else:
             self.listener = listener
         self.progressbar = progressbar
+        if profiler is not None:
+            self.profiler = profiler
         self.verbosity = verbosity
         self.writer = writer
 
+    @property
+    def arena(self):
+        '''``Arena`` in which all fields are stored that are added afterwards or ``None``.'''
+        return self._arena
+
+    @arena.setter
+    def arena(self, value):
+        if value is not None and not isinstance(value, Arena):
+            raise TypeError("<arena> has to be of type Arena or None.")
+        self._arena = value
+
+    @property
+    def dtype(self):
+        '''Floating point data type of all fields that are added afterwards or ``None``.
+
+        If set, floating point values of new fields, their derivatives and Jacobians, and the step sizes
+        passed to the integration schemes are cast to this data type. The integration variable keeps its
+        own data type.'''
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value):
+        if value is not None:
+            try:
+                value = np.dtype(value)
+            except TypeError:
+                raise TypeError("<dtype> has to be a data type or None.")
+            if value.kind != "f":
+                raise ValueError("<dtype> has to be a floating point type.")
+        self._dtype = value
+
     @property
     def integrator(self):
         '''``Integrator`` that controls the simulation.'''
@@ -86,6 +145,17 @@ class Frame(Group):
             raise TypeError("listener has to be of type Listener or None.")
         self._listener = listener
 
+    @property
+    def memorytracker(self):
+        '''``MemoryTracker`` for measuring the memory consumption during ``Frame.run()`` or ``None``.'''
+        return self._memorytracker
+
+    @memorytracker.setter
+    def memorytracker(self, value):
+        if value is not None and not isinstance(value, MemoryTracker):
+            raise TypeError("<memorytracker> has to be of type MemoryTracker or None.")
+        self._memorytracker = value
+
     @property
     def progressbar(self):
         '''``Progressbar`` for displaying current status.'''
@@ -100,6 +170,21 @@ class Frame(Group):
                 raise TypeError("<progressbar> has to be of type Progressbar.")
             self._progressbar = value
 
+    @property
+    def profiler(self):
+        '''``Profiler`` for measuring the execution times of all ``Heartbeat`` objects.'''
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, value):
+        if value is not None and not isinstance(value, Profiler):
+            raise TypeError("<profiler> has to be of type Profiler or None.")
+        if self._profiler is not None:
+            self._profiler._release()
+        self._profiler = value
+        if value is not None:
+            value._instrument(self)
+
     @property
     def verbosity(self):
         '''Verbosity of the ``Frame`` objects.'''
@@ -141,6 +226,38 @@ class Frame(Group):
         if self.writer is not None:
             self.writer.write(self, i, forceoverwrite, filename, **kwargs)
 
+    def restart(self, i):
+        """Loads the values of all ``Field`` and ``IntVar`` objects of output number ``i`` into the ``Frame``.
+
+        Parameters
+        ----------
+        i : int
+            Number of output
+
+        Notes
+        -----
+        The ``Frame`` has to be set up beforehand with the same structure that was used to write the output.
+        The values are read with ``Writer.read.output()``, for example from the files of the ``hdf5writer``, and
+        are written into the existing fields in place. Constant fields and attributes that are not of type
+        ``Field`` are not changed. Since the integration variable is restored as well, ``Frame.run()`` will
+        continue the simulation with the next snapshot and output number ``i+1``.
+        This can be used instead of dump files to restart a simulation."""
+
+        if self.writer is None or self.writer.read is None:
+            raise RuntimeError("No writer with reader set.")
+
+        data = self.writer.read.output(i)
+
+        # The integration variable is checked before any value is written into the frame
+        if self.integrator is not None and isinstance(self.integrator.var, IntVar):
+            snapshots = self.integrator.var.snapshots
+            x = _findinnamespace(self, data, self.integrator.var)
+            if snapshots.size and x is not None and x >= snapshots[-1]:
+                raise RuntimeError(
+                    "Integration variable of output already passed the largest snapshot.")
+
+        _restorefromnamespace(self, data)
+
     def run(self):
         """This method starts the simulation. An ``Integrator`` has to be set beforehand."""
 
@@ -162,46 +279,74 @@ class Frame(Group):
             raise RuntimeError(
                 "Integration variable already passed the largest snapshot.")
 
+        # Instrument Heartbeats that might have been set after assigning the profiler
+        if self.profiler is not None:
+            self.profiler._instrument(self)
+
+        # Wrap the phases of the integration if memory is tracked
+        tracker = self.memorytracker
+        integrate = self.integrator.integrate
+        update = self._update
+        writeoutput = self.writeoutput
+        if tracker is not None:
+            tracker._start()
+            integrate = partial(tracker._track, "scheme", integrate)
+            update = partial(tracker._track, "updater", update)
+            writeoutput = partial(tracker._track, "writer", writeoutput)
+
         # Timekeeping
         tini = monotonic()
 
-        # Write initial conditions if at first given snapshot
-        if self.integrator.var == self.integrator.var.snapshots[0]:
-            self.writeoutput(0)
+        try:
+            # Write initial conditions if at first given snapshot
+            if self.integrator.var == self.integrator.var.snapshots[0]:
+                writeoutput(0)
+                if tracker is not None:
+                    tracker._snapshot(0, self.integrator.var)
 
-        # Staring index of snapshots
-        starting_index = np.argmin(
-            self.integrator.var >= self.integrator.var.snapshots)
-        # Starting value of integration variable
-        startingvalue = self.integrator.var.copy()
-        for i in range(starting_index, len(self.integrator.var.snapshots)):
+            # Staring index of snapshots
+            starting_index = np.argmin(
+                self.integrator.var >= self.integrator.var.snapshots)
+            # Starting value of integration variable
+            startingvalue = self.integrator.var.copy()
+            for i in range(starting_index, len(self.integrator.var.snapshots)):
 
-            # Nextsnapshot cannot be referenced directly, because it dynamically changes.
-            nextsnapshot = self.integrator.var.nextsnapshot
-            prevsnapshot = self.integrator.var.prevsnapshot if self.integrator.var.prevsnapshot is not None else startingvalue
+                # Nextsnapshot cannot be referenced directly, because it dynamically changes.
+                nextsnapshot = self.integrator.var.nextsnapshot
+                prevsnapshot = self.integrator.var.prevsnapshot \
+                    if self.integrator.var.prevsnapshot is not None else startingvalue
 
-            while self.integrator.var < nextsnapshot:
+                while self.integrator.var < nextsnapshot:
 
-                # Listen for signals if listener is set.
-                if self.listener is not None:
-                    self.listener.listen()
+                    # Listen for signals if listener is set.
+                    if self.listener is not None:
+                        self.listener.listen()
 
-                if self.verbosity > 1:
-                    self.progressbar(self.integrator.var,
-                                     prevsnapshot,
-                                     nextsnapshot,
-                                     startingvalue,
-                                     self.integrator.var.snapshots[-1])
+                    if self.verbosity > 1:
+                        self.progressbar(self.integrator.var,
+                                         prevsnapshot,
+                                         nextsnapshot,
+                                         startingvalue,
+                                         self.integrator.var.snapshots[-1])
 
-                self.integrator.integrate()
-                self.integrator.var += self.integrator.var._prevstepsize
+                    integrate()
+                    self.integrator.var += self.integrator.var._prevstepsize
+                    self.integrator.var.touch()
 
-                self.update()
+                    update()
 
-            if self.verbosity > 1:
-                self.progressbar._reset()
+                    if tracker is not None:
+                        tracker._step(self.integrator.var)
 
-            self.writeoutput(i)
+                if self.verbosity > 1:
+                    self.progressbar._reset()
+
+                writeoutput(i)
+                if tracker is not None:
+                    tracker._snapshot(i, self.integrator.var)
+        finally:
+            if tracker is not None:
+                tracker._stop()
 
         # Timekeeping
         tfin = monotonic()
@@ -209,3 +354,78 @@ class Frame(Group):
         if self.verbosity > 0:
             msg = "Execution time: {}".format(colorize(t_exec, color="blue"))
             print(msg)
+            if self.verbosity > 1:
+                print(repr(self.integrator.stats))
+
+    def _update(self):
+        """Updates the ``Frame`` with a flat list of update operations.
+
+        Notes
+        -----
+        This is equivalent to ``Frame.update()``. Nested updaters that were created from lists of attribute
+        names are flattened and null operations are removed. The list is compiled again if any update
+        instruction, the inputs of any ``Updater``, or any member of a compiled ``Group`` of this ``Frame``
+        changed."""
+        if self._compiled is None or any(dep._generation != gen for dep, gen in self._compiled[0]):
+            ops, deps = [], []
+            _compileupdate(self, ops, deps)
+            self.__dict__["_compiled"] = (deps, ops)
+        for func, Y in self._compiled[1]:
+            ret = func()
+            if Y is not None and ret is not None:
+                Y[...] = ret
+                Y._version += 1
+
+
+def _restorefromnamespace(grp, ns):
+    """Writes the values of a namespace into the fields of a group. Function is called recursively.
+
+    Parameters
+    ----------
+    grp : Group
+        Group into which the values should be written
+    ns : SimpleNamespace
+        Namespace with the values"""
+    for key, val in ns.__dict__.items():
+        if key not in grp.__dict__:
+            continue
+        obj = grp.__dict__[key]
+        if isinstance(obj, Group):
+            if isinstance(val, SimpleNamespace):
+                _restorefromnamespace(obj, val)
+        elif isinstance(obj, Field):
+            if obj.constant:
+                continue
+            val = np.asarray(val)
+            # HDF5 returns strings as byte literals
+            if val.dtype.kind == "S" and obj.dtype.kind == "U":
+                val = val.astype(str)
+            obj._setvalue(val)
+
+
+def _findinnamespace(grp, ns, obj):
+    """Returns the value in a namespace at the location of an object in a group. Function is called recursively.
+
+    Parameters
+    ----------
+    grp : Group
+        Group that contains the object
+    ns : SimpleNamespace
+        Namespace with the values
+    obj : object
+        Object whose value is requested
+
+    Returns
+    -------
+    val : object or None
+        Value at the location of the object or None if not found"""
+    for key, val in ns.__dict__.items():
+        if key not in grp.__dict__:
+            continue
+        if grp.__dict__[key] is obj:
+            return val
+        if isinstance(grp.__dict__[key], Group) and isinstance(val, SimpleNamespace):
+            ret = _findinnamespace(grp.__dict__[key], val, obj)
+            if ret is not None:
+                return ret
+    return None
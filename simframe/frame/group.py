@@ -3,8 +3,12 @@ import numpy as _np
 
 from simframe.frame.abstractgroup import AbstractGroup
 from simframe.frame.field import Field
+from simframe.frame.field import _normalizeindex
+from simframe.frame.field import _view
 from simframe.frame.intvar import IntVar
 from simframe.frame.heartbeat import Heartbeat
+from simframe.frame.scheduler import Scheduler
+from simframe.frame.updater import Updater
 from simframe.utils.color import colorize
 from simframe.utils.format import byteformat
 
@@ -32,7 +36,10 @@ class Group(AbstractGroup):
         Notes
         -----
         The updater of groups can take a list of string with the attribute names that should be updated
-        in the order in which they should be updated. It will create a callable function from that list."""
+        in the order in which they should be updated. It will create a callable function from that list.
+
+        The updater can also take a ``Scheduler`` or a dictionary that maps attribute names to lists of
+        attribute names they depend on. Independent attributes are then updated concurrently."""
         self._description = description
         self._owner = owner
         self._updateorder = None
@@ -44,6 +51,9 @@ class Group(AbstractGroup):
         if name in self.__dict__ and isinstance(self.__dict__[name], Field):
             self.__dict__[name]._setvalue(value)
         else:
+            # Replacing members invalidates compiled updates
+            if not name.startswith("_") and name in self.__dict__:
+                self._generation += 1
             super().__setattr__(name, value)
 
     def __repr__(self):
@@ -129,7 +139,7 @@ class Group(AbstractGroup):
 
     @property
     def updateorder(self):
-        '''Update order if updater was set with list of strings. ``None`` otherwise.'''
+        '''Update order if updater was set with list of strings, dictionary, or ``Scheduler``. ``None`` otherwise.'''
         return self._updateorder
 
     @updateorder.setter
@@ -143,11 +153,15 @@ class Group(AbstractGroup):
         '''``Heartbeat`` object with update instructions.
 
         You can either set a ``Heartbeat`` object directly, a callable functions that will be automatically transformed into
-        a ``Heartbeat`` object, or a list of attribute names of the ``Group`` that will be updated in that order.'''
+        a ``Heartbeat`` object, or a list of attribute names of the ``Group`` that will be updated in that order.
+        A ``Scheduler`` or a dictionary of dependencies updates the attributes concurrently where possible.'''
         return self._updater
 
     @updater.setter
     def updater(self, value):
+        # Compiled updates can only depend on an updater that was set before
+        if "_updater" in self.__dict__:
+            self._generation += 1
         if isinstance(value, Heartbeat):
             self._updater = value
             self._updateorder = None
@@ -155,6 +169,12 @@ class Group(AbstractGroup):
             self._checkupdatelist(value)
             self._updater = Heartbeat(self._createupdatefromlist(value))
             self._updateorder = value.copy()
+        elif isinstance(value, (dict, Scheduler)):
+            if isinstance(value, dict):
+                value = Scheduler(value)
+            value._bind(self)
+            self._updater = Heartbeat(value)
+            self._updateorder = value.order
         else:
             self._updater = Heartbeat(value)
             self._updateorder = None
@@ -168,7 +188,7 @@ class Group(AbstractGroup):
     def toc(self, value):
         pass
 
-    def addfield(self, name, value, updater=None, differentiator=None, description="", constant=False, save=True, copy=True):
+    def addfield(self, name, value, updater=None, differentiator=None, description="", constant=False, save=True, copy=True, view=None, shape=None):
         """Function to add a new ``Field`` to the object.
 
         Parameters
@@ -189,9 +209,50 @@ class Group(AbstractGroup):
             If True field will be stored in output files
         copy : boolean, optional, default : True
             If True <value> will be copied, not referenced
+        view : int, slice, tuple, or None, optional, default : None
+            If not None, <value> has to be a ``Field`` and the new field is a view into it with this index
+        shape : tuple or None, optional, default : None
+            If not None, <value> has to be a ``Field`` and the view into it is reshaped to this shape
+
+        Notes
+        -----
+        If the parent ``Frame`` has a ``dtype``, copied floating point values are cast to it.
+        If the parent ``Frame`` has an ``Arena``, copied values are placed into the arena.
+
+        Views share memory with their parent field. Only basic indexing with integers, slices, and Ellipsis
+        is possible. Writers store the data of the parent only once.
         """
-        self.__dict__[name] = Field(self._owner, value, updater=updater,
-                                    differentiator=differentiator, description=description, constant=constant, save=save, copy=copy)
+        if view is not None or shape is not None:
+            if not isinstance(value, Field):
+                raise TypeError("<value> has to be of type Field to create a view.")
+            if value.viewof is not None:
+                raise ValueError("Views of views are not supported.")
+            index = _normalizeindex(slice(None) if view is None else view)
+            shape = None if shape is None else tuple(shape)
+            arr = _view(value, index, shape)
+            if not _np.shares_memory(arr, value):
+                raise ValueError("<view> and <shape> do not create a view.")
+            field = Field(self._owner, arr, updater=updater, differentiator=differentiator,
+                          description=description, constant=constant, save=save, copy=False)
+            field._viewof = (value, index, shape)
+            self._addmember(name, field)
+            return
+        dtype = getattr(self._owner, "dtype", None)
+        if copy and dtype is not None:
+            value = _np.asarray(value)
+            if value.dtype.kind == "f":
+                value = value.astype(dtype)
+        arena = getattr(self._owner, "arena", None)
+        arr = None
+        if copy and arena is not None:
+            arr = arena._allocate(value)
+            if arr is not None:
+                value, copy = arr, False
+        field = Field(self._owner, value, updater=updater,
+                      differentiator=differentiator, description=description, constant=constant, save=save, copy=copy)
+        self._addmember(name, field)
+        if arr is not None:
+            arena._register(field)
 
     def addgroup(self, name, updater=None, description=""):
         """Function to add a new ``Group`` to the object.
@@ -205,8 +266,8 @@ class Group(AbstractGroup):
         description : string, optional, default : ""
             Descriptive string for the group
         """
-        self.__dict__[name] = Group(
-            self._owner, updater=updater, description=description)
+        self._addmember(name, Group(
+            self._owner, updater=updater, description=description))
 
     def addintegrationvariable(self, name, value, snapshots=[], updater=None, description="", copy=True):
         """Function to add a new integration variable ``IntVar`` to the object.
@@ -226,8 +287,26 @@ class Group(AbstractGroup):
         copy : boolean, optional, default : True
             If True <value> will be copied, not referenced
         """
-        self.__dict__[name] = IntVar(
-            self._owner, value, updater=updater, snapshots=snapshots, description=description, copy=copy)
+        self._addmember(name, IntVar(
+            self._owner, value, updater=updater, snapshots=snapshots, description=description, copy=copy))
+
+    def _addmember(self, name, obj):
+        """Adds a member to the group without the checks of ``__setattr__``.
+
+        Parameters
+        ----------
+        name : string
+            Name of the member
+        obj : object
+            The member
+
+        Notes
+        -----
+        Replacing a member invalidates the compiled updates. New names cannot be part of compiled updates,
+        since update lists only accept existing members."""
+        if name in self.__dict__:
+            self._generation += 1
+        self.__dict__[name] = obj
 
     def _checkupdatelist(self, ls):
         """This function checks if a list is suitable to be used as update.
@@ -363,3 +442,47 @@ def _dummyupdatewithlist(grp, ls, owner, *args, **kwargs):
     args and kwargs are only passed to the updater of the Heartbeat, NOT systole or diastole."""
     for val in ls:
         grp.__dict__[val].update(*args, **kwargs)
+
+
+def _compileupdate(obj, ops, deps):
+    """Appends the non-null update operations of an object to a list. Function is called recursively.
+
+    Parameters
+    ----------
+    obj : Group or Field
+        Object whose update operations are compiled
+    ops : list
+        List of tuples ``(func, Y)``. ``func`` is called without arguments. If ``Y`` is not None,
+        the return value of ``func`` is written into ``Y``
+    deps : list
+        List of tuples ``(obj, generation)`` of all objects the compiled operations depend on. The operations
+        have to be compiled again if the generation of any of these objects changed
+
+    Notes
+    -----
+    Updaters that were created from lists of attribute names are replaced by the update operations of the
+    attributes. Everything else is called as it is."""
+    hb = obj.updater
+    owner = obj._owner
+    for dep in [obj, hb, hb.systole, hb.updater, hb.diastole]:
+        deps.append((dep, dep._generation))
+    if hb.systole._func is not None:
+        ops.append((partial(hb.systole.update, owner), None))
+    upd = hb.updater
+    func = upd._func
+    if (isinstance(func, partial) and func.func is _dummyupdatewithlist and not func.keywords
+            and type(upd) is Updater and upd.inputs is None and "update" not in upd.__dict__):
+        grp, ls = func.args
+        for name in ls:
+            member = grp.__dict__[name]
+            if isinstance(member, IntVar) or not isinstance(member, (Group, Field)):
+                ops.append((member.update, None))
+            elif type(member).update in (AbstractGroup.update, Field.update):
+                _compileupdate(member, ops, deps)
+            else:
+                ops.append((member.update, None))
+    elif func is not None:
+        Y = obj if isinstance(obj, Field) else None
+        ops.append((partial(upd.update, owner), Y))
+    if hb.diastole._func is not None:
+        ops.append((partial(hb.diastole.update, owner), None))
@@ -15,6 +15,8 @@ class Heartbeat(object):
     """
 
     __name__ = "Heartbeat"
+    # Counter that is increased whenever an update instruction of the heartbeat changes
+    _generation = 0
 
     def __init__(self, updater=None, systole=None, diastole=None):
         """``Heartbeat`` class
@@ -66,6 +68,7 @@ class Heartbeat(object):
 
     @systole.setter
     def systole(self, value):
+        self._generation += 1
         if isinstance(value, Updater):
             self._systole = value
         elif hasattr(value, "__call__") or value is None:
@@ -81,6 +84,7 @@ class Heartbeat(object):
 
     @updater.setter
     def updater(self, value):
+        self._generation += 1
         if isinstance(value, Updater):
             self._updater = value
         elif hasattr(value, "__call__") or value is None:
@@ -96,6 +100,7 @@ class Heartbeat(object):
 
     @diastole.setter
     def diastole(self, value):
+        self._generation += 1
         if isinstance(value, Updater):
             self._diastole = value
         elif hasattr(value, "__call__") or value is None:
@@ -132,6 +137,8 @@ class Heartbeat(object):
         # The new field value needs to be set here, so the diastole has access to the new value.
         if Y is not None and ret is not None:
             Y[...] = ret
+            if hasattr(Y, "_version"):
+                Y._version += 1
 
         # Perform diastole operation.
         self.diastole.update(owner)
@@ -0,0 +1,212 @@
+import json
+import os
+import tracemalloc
+
+from simframe.frame.abstractgroup import AbstractGroup
+from simframe.utils.color import colorize
+from simframe.utils.format import byteformat
+
+
+class MemoryTracker(object):
+    """Class for measuring the memory consumption of a running ``Frame``.
+
+    If a ``MemoryTracker`` is assigned to ``Frame.memorytracker``, the memory allocations during ``Frame.run()``
+    are traced with ``tracemalloc``. The peak memory of every integration step is recorded and the allocations
+    are attributed to the integration schemes, the updaters, and the writer. At every snapshot an entry is added
+    to the memory log, which is optionally written as JSON line to ``filename``.
+
+    Notes
+    -----
+    The memory of a phase is the peak of the traced memory during the phase minus the traced memory at the
+    beginning of the phase, i.e., the additional memory that was needed by temporary arrays or buffers. The
+    values of a log entry are the maxima since the previous snapshot.
+
+    ``tracemalloc`` only traces memory that is allocated by Python and ``numpy``. If tracing was not started
+    before ``Frame.run()``, it is stopped again after the simulation. Tracing slows down the simulation
+    considerably and should only be used for diagnostics."""
+
+    __name__ = "MemoryTracker"
+
+    def __init__(self, filename=None, description=""):
+        """Parameters
+        ----------
+        filename : str or None, optional, default : None
+            If not None, the log entries are appended as JSON lines to this file
+        description : string, optional, default : ""
+            Descriptive string of the memory tracker"""
+        self.filename = filename
+        self.description = description
+        self._log = []
+        self._peaks = []
+        self._started = False
+        self._reset()
+
+    def __str__(self):
+        return AbstractGroup.__str__(self)
+
+    def __repr__(self):
+        return self.__str__()
+
+    @property
+    def description(self):
+        '''Description of ``MemoryTracker``.'''
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        if not isinstance(value, str):
+            raise TypeError("<description> has to be of type str.")
+        self._description = value
+
+    @property
+    def filename(self):
+        '''File to which the log is written or ``None``.'''
+        return self._filename
+
+    @filename.setter
+    def filename(self, value):
+        if value is not None and not isinstance(value, str):
+            raise TypeError("<filename> has to be of type str or None.")
+        self._filename = value
+
+    @property
+    def log(self):
+        '''List with one dictionary per written snapshot.'''
+        return self._log
+
+    @property
+    def peaks(self):
+        '''List of tuples ``(x, peak)`` with the value of the integration variable after every step and the peak
+        of the traced memory in bytes during this step.'''
+        return self._peaks
+
+    def reset(self):
+        """Removes all recorded steps and log entries."""
+        self._log = []
+        self._peaks = []
+        self._reset()
+
+    def report(self, print_output=True):
+        """Returns the memory log.
+
+        Parameters
+        ----------
+        print_output : boolean, optional, default : True
+            If True, the log is printed on screen
+
+        Returns
+        -------
+        log : list
+            List of dictionaries with the keys ``snapshot``, ``x``, ``steps``, ``current``, ``peak``, ``scheme``,
+            ``updater``, and ``writer``. Memory is given in bytes"""
+        if print_output:
+            print(_formatlog(self._log))
+        return self._log
+
+    def _reset(self):
+        """Resets the maxima since the previous snapshot."""
+        self._steps = 0
+        self._steppeak = 0
+        self._peak = 0
+        self._phases = {"scheme": 0, "updater": 0, "writer": 0}
+
+    def _start(self):
+        """Starts tracing memory allocations if not already done."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        self._reset()
+
+    def _stop(self):
+        """Stops tracing memory allocations if they were started by ``MemoryTracker._start()``."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def _track(self, phase, func, *args, **kwargs):
+        """Calls a function and measures its memory consumption.
+
+        Parameters
+        ----------
+        phase : str
+            Phase to which the memory is attributed. Either "scheme", "updater", or "writer"
+        func : callable
+            Function to be called
+        args : additional positional arguments
+        kwargs : additional keyword arguments
+
+        Returns
+        -------
+        ret : Return value of function"""
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            self._phases[phase] = max(self._phases[phase], peak - current)
+            self._steppeak = max(self._steppeak, peak)
+
+    def _step(self, x):
+        """Records the peak memory of an integration step.
+
+        Parameters
+        ----------
+        x : IntVar
+            Integration variable after the step"""
+        self._peaks.append((float(x), self._steppeak))
+        self._peak = max(self._peak, self._steppeak)
+        self._steppeak = 0
+        self._steps += 1
+
+    def _snapshot(self, i, x):
+        """Adds an entry to the memory log.
+
+        Parameters
+        ----------
+        i : int
+            Number of the snapshot
+        x : IntVar
+            Integration variable"""
+        current, _ = tracemalloc.get_traced_memory()
+        entry = {
+            "snapshot": int(i),
+            "x": float(x),
+            "steps": self._steps,
+            "current": current,
+            "peak": max(self._peak, self._steppeak),
+            "scheme": self._phases["scheme"],
+            "updater": self._phases["updater"],
+            "writer": self._phases["writer"],
+        }
+        self._log.append(entry)
+        if self.filename is not None:
+            directory = os.path.dirname(self.filename)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.filename, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        self._reset()
+
+
+def _formatlog(log):
+    """Formats a memory log as table.
+
+    Parameters
+    ----------
+    log : list
+        List of log entries
+
+    Returns
+    -------
+    table : str
+        Formatted table"""
+    header = "{:>8s} {:>12s} {:>8s} {:>12s} {:>12s} {:>12s} {:>12s} {:>12s}".format(
+        "Snapshot", "x", "Steps", "Current", "Peak", "Scheme", "Updater", "Writer")
+    ret = colorize(header, "blue") + "\n"
+    ret += "-" * len(header)
+    for entry in log:
+        ret += "\n{:8d} {:12.4e} {:8d} {:>12s} {:>12s} {:>12s} {:>12s} {:>12s}".format(
+            entry["snapshot"], entry["x"], entry["steps"],
+            *[byteformat(entry[key]) for key in ["current", "peak", "scheme", "updater", "writer"]])
+    return ret
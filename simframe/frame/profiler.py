@@ -0,0 +1,201 @@
+from functools import partial
+from time import perf_counter
+
+from simframe.frame.abstractgroup import AbstractGroup
+from simframe.frame.field import Field
+from simframe.frame.group import Group
+from simframe.utils.color import colorize
+
+
+class Profiler(object):
+    """Class for measuring the execution times of the ``Heartbeat`` objects of a ``Frame``.
+
+    If a ``Profiler`` is assigned to ``Frame.profiler``, the ``systole``, ``updater``, and ``diastole`` of every
+    ``Heartbeat`` in the ``Frame`` are timed separately and attributed to the ``Group`` or ``Field`` that owns the
+    ``Heartbeat``. The ``Frame`` is instrumented again at the beginning of every ``Frame.run()`` to include
+    ``Heartbeat`` objects that were assigned later.
+
+    Notes
+    -----
+    Times are inclusive. If a ``Group`` is updating its members, the time of the group updater contains the times
+    of the member updates.
+
+    An ``Updater`` that is shared between several ``Heartbeat`` objects is only attributed to the first one.
+
+    The ``Profiler`` is adding instance attributes to the ``Updater`` objects. Setting ``Frame.profiler`` to
+    ``None`` removes them again, such that there is no overhead if profiling is disabled."""
+
+    __name__ = "Profiler"
+
+    def __init__(self, description=""):
+        """Parameters
+        ----------
+        description : string, optional, default : ""
+            Descriptive string of the profiler"""
+        self.description = description
+        self._instrumented = []
+        self._records = {}
+
+    @property
+    def description(self):
+        '''Description of ``Profiler``.'''
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        if not isinstance(value, str):
+            raise TypeError("<description> has to be of type str.")
+        self._description = value
+
+    def __str__(self):
+        return AbstractGroup.__str__(self)
+
+    def __repr__(self):
+        return self.__str__()
+
+    def reset(self):
+        """Resets all measured times."""
+        for record in self._records.values():
+            for slot in record.values():
+                slot[0] = 0
+                slot[1] = 0.
+
+    def report(self, print_output=True):
+        """Returns the measured execution times sorted by total time.
+
+        Parameters
+        ----------
+        print_output : boolean, optional, default : True
+            If True, the report is printed on screen
+
+        Returns
+        -------
+        report : list
+            List of tuples ``(name, calls, systole, updater, diastole, total)`` with the times in seconds"""
+        ret = []
+        for name, record in self._records.items():
+            calls = max(slot[0] for slot in record.values())
+            if calls == 0:
+                continue
+            tsys = record["systole"][1]
+            tupd = record["updater"][1]
+            tdia = record["diastole"][1]
+            ret.append((name, calls, tsys, tupd, tdia, tsys+tupd+tdia))
+        ret = sorted(ret, key=lambda r: r[5], reverse=True)
+        if print_output:
+            print(_formatreport(ret))
+        return ret
+
+    def _instrument(self, frame):
+        """Adds timing instructions to all ``Heartbeat`` objects of a ``Frame``.
+
+        Parameters
+        ----------
+        frame : Frame
+            ``Frame`` to be instrumented"""
+        self._release()
+        self._instrumentheartbeat(frame.updater, "Frame (updater)")
+        _walk(frame, "", self._instrumentheartbeat)
+        if frame.integrator is not None:
+            for role in ["preparator", "finalizer", "failop"]:
+                self._instrumentheartbeat(
+                    getattr(frame.integrator, role), "Integrator ({})".format(role))
+
+    def _instrumentheartbeat(self, heartbeat, name):
+        """Adds timing instructions to a single ``Heartbeat``.
+
+        Parameters
+        ----------
+        heartbeat : Heartbeat
+            ``Heartbeat`` to be instrumented
+        name : str
+            Name under which the times are stored"""
+        record = self._records.setdefault(
+            name, {"systole": [0, 0.], "updater": [0, 0.], "diastole": [0, 0.]})
+        for slot in ["systole", "updater", "diastole"]:
+            upd = getattr(heartbeat, slot)
+            # Null operations and already instrumented updaters are skipped.
+            if upd._func is None or "update" in upd.__dict__:
+                continue
+            upd.update = partial(_timedupdate, upd, record[slot])
+            upd._generation += 1
+            self._instrumented.append(upd)
+
+    def _release(self):
+        """Removes all timing instructions."""
+        for upd in self._instrumented:
+            upd.__dict__.pop("update", None)
+            upd._generation += 1
+        self._instrumented = []
+
+
+def _timedupdate(upd, slot, owner, *args, **kwargs):
+    """Calls ``Updater.update`` and measures its execution time.
+
+    Parameters
+    ----------
+    upd : Updater
+        ``Updater`` to be called
+    slot : list
+        List with number of calls and total time
+    owner : Frame
+        Parent ``Frame`` object
+    args : additional positional arguments
+    kwargs : additional keyword arguments
+
+    Returns
+    -------
+    ret : Return value of updater"""
+    t0 = perf_counter()
+    try:
+        return type(upd).update(upd, owner, *args, **kwargs)
+    finally:
+        slot[0] += 1
+        slot[1] += perf_counter() - t0
+
+
+def _walk(grp, prefix, func):
+    """Calls a function for every ``Heartbeat`` in a ``Group``. Function is called recursively.
+
+    Parameters
+    ----------
+    grp : Group
+        Group to walk through
+    prefix : str
+        Location of the group within the ``Frame``
+    func : callable
+        Function that is called with the ``Heartbeat`` and its name"""
+    for key, val in grp.__dict__.items():
+        if key.startswith("_"):
+            continue
+        name = ".".join(filter(None, [prefix, key]))
+        if isinstance(val, Group):
+            func(val.updater, "{} (updater)".format(name))
+            _walk(val, name, func)
+        elif isinstance(val, Field):
+            for role in ["updater", "differentiator", "jacobinator"]:
+                func(getattr(val, role), "{} ({})".format(name, role))
+
+
+def _formatreport(report):
+    """Formats a profiling report as table.
+
+    Parameters
+    ----------
+    report : list
+        List of tuples ``(name, calls, systole, updater, diastole, total)``
+
+    Returns
+    -------
+    table : str
+        Formatted table"""
+    header = "{:40s} {:>10s} {:>12s} {:>12s} {:>12s} {:>12s}".format(
+        "Heartbeat", "Calls", "Systole", "Updater", "Diastole", "Total")
+    ret = colorize(header, "blue") + "\n"
+    ret += "-" * len(header)
+    for name, calls, tsys, tupd, tdia, ttot in report:
+        if len(name) > 40:
+            name = name[:37] + "..."
+        ret += "\n{:40s} {:10d} {:11.6f}s {:11.6f}s {:11.6f}s {:11.6f}s".format(
+            name, calls, tsys, tupd, tdia, ttot)
+    return ret
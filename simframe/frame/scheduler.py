@@ -0,0 +1,191 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+from simframe.frame.abstractgroup import AbstractGroup
+
+
+class Scheduler(object):
+    """Class for updating the members of a ``Group`` according to their dependencies.
+
+    The dependencies are given as dictionary that maps the attribute name of every member that should be updated
+    to a list of attribute names of members that have to be updated before. Members that do not depend on each
+    other are updated concurrently in a thread pool. Members with dependencies are always updated after all
+    of their dependencies.
+
+    Notes
+    -----
+    The ``Scheduler`` has to be assigned to ``Group.updater``. Assigning a dictionary to ``Group.updater``
+    creates a ``Scheduler`` with default settings.
+
+    Updates are grouped into levels. All members of a level only depend on members of previous levels. The levels
+    are executed one after another, the members within a level concurrently. Within a level the members are
+    submitted in the order in which they appear in the dictionary. If any update raises an exception, the exception
+    of the first member in that order is raised after all updates of the level finished.
+
+    Only use concurrent updates for updaters that are thread-safe, e.g., updaters that do not write to other
+    fields than their own. ``numpy`` releases the GIL for most operations on large arrays."""
+
+    __name__ = "Scheduler"
+
+    def __init__(self, dependencies, workers=None, description=""):
+        """Parameters
+        ----------
+        dependencies : dict
+            Dictionary with attribute names as keys and lists of attribute names they depend on as values
+        workers : int or None, optional, default : None
+            Maximum number of threads. If None, the default of ``concurrent.futures.ThreadPoolExecutor`` is used.
+            If 1, all updates are performed sequentially
+        description : string, optional, default : ""
+            Descriptive string of the scheduler"""
+        self.dependencies = dependencies
+        self.workers = workers
+        self.description = description
+        self._group = None
+        self._pool = None
+
+    def __del__(self):
+        if getattr(self, "_pool", None) is not None:
+            self._pool.shutdown(wait=False)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Thread pools cannot be pickled.
+        state["_pool"] = None
+        return state
+
+    def __str__(self):
+        return AbstractGroup.__str__(self)
+
+    def __repr__(self):
+        return type(self).__name__
+
+    @property
+    def dependencies(self):
+        '''Dictionary with the dependencies of the members.'''
+        return self._dependencies
+
+    @dependencies.setter
+    def dependencies(self, value):
+        if not isinstance(value, dict):
+            raise TypeError("<dependencies> has to be of type dict.")
+        for key, val in value.items():
+            if not isinstance(key, str):
+                raise ValueError("Keys of <dependencies> have to be strings.")
+            if not isinstance(val, (list, tuple)) or not all(isinstance(v, str) for v in val):
+                raise ValueError(
+                    "Values of <dependencies> have to be lists of strings.")
+            for v in val:
+                if v not in value:
+                    raise ValueError(
+                        "Dependency {} of {} is not in <dependencies>.".format(v, key))
+        self._levels = _levels(value)
+        self._dependencies = {key: list(val) for key, val in value.items()}
+
+    @property
+    def description(self):
+        '''Description of ``Scheduler``.'''
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        if not isinstance(value, str):
+            raise TypeError("<description> has to be of type str.")
+        self._description = value
+
+    @property
+    def levels(self):
+        '''List of lists of attribute names that can be updated concurrently.'''
+        return [level.copy() for level in self._levels]
+
+    @property
+    def order(self):
+        '''List of attribute names in the order in which they are submitted.'''
+        return [name for level in self._levels for name in level]
+
+    @property
+    def workers(self):
+        '''Maximum number of threads.'''
+        return self._workers
+
+    @workers.setter
+    def workers(self, value):
+        if value is not None:
+            if not isinstance(value, int):
+                raise TypeError("<workers> has to be of type int or None.")
+            if value < 1:
+                raise ValueError("<workers> has to be larger than 0.")
+        self._workers = value
+        self._shutdown()
+
+    def __call__(self, owner, *args, **kwargs):
+        """Updates the members of the group.
+
+        Parameters
+        ----------
+        owner : Frame
+            Parent frame object
+        args : additional positional arguments
+        kwargs : additional keyword arguments
+
+        Notes
+        -----
+        args and kwargs are passed to the updates of the members."""
+        if self._group is None:
+            raise RuntimeError("Scheduler is not assigned to a Group.")
+        members = self._group.__dict__
+        for level in self._levels:
+            if self.workers == 1 or len(level) == 1:
+                for name in level:
+                    members[name].update(*args, **kwargs)
+                continue
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+            futures = [self._pool.submit(members[name].update, *args, **kwargs)
+                       for name in level]
+            wait(futures)
+            for future in futures:
+                future.result()
+
+    def _bind(self, grp):
+        """Assigns the ``Scheduler`` to a ``Group``.
+
+        Parameters
+        ----------
+        grp : Group
+            Group whose members are updated"""
+        grp._checkupdatelist(list(self.dependencies.keys()))
+        self._shutdown()
+        self._group = grp
+
+    def _shutdown(self):
+        """Shuts down the thread pool. A new pool is created with the next concurrent update."""
+        if getattr(self, "_pool", None) is not None:
+            self._pool.shutdown()
+        self._pool = None
+
+
+def _levels(dependencies):
+    """Sorts the keys of a dependency dictionary into levels that can be executed concurrently.
+
+    Parameters
+    ----------
+    dependencies : dict
+        Dictionary with names as keys and lists of names they depend on as values
+
+    Returns
+    -------
+    levels : list
+        List of lists of names"""
+    remaining = dict(dependencies)
+    done = set()
+    levels = []
+    while remaining:
+        level = [key for key, val in remaining.items()
+                 if all(v in done for v in val)]
+        if level == []:
+            raise ValueError("Dependencies are cyclic.")
+        for key in level:
+            del remaining[key]
+        done.update(level)
+        levels.append(level)
+    return levels
@@ -3,18 +3,50 @@ from simframe.utils.color import colorize
 
 
 class Updater():
-    """Class that manages how a ``Group`` or ``Field`` is updated."""
+    """Class that manages how a ``Group`` or ``Field`` is updated.
+
+    Notes
+    -----
+    If ``inputs`` is given, the function is only called if the ``version`` of any of the input fields changed
+    since the last call. Otherwise the update is skipped and ``None`` is returned, which leaves the ``Field`` unchanged.
+    The versions of fields are only increased by the updater of the field, by the integrator, and by
+    ``Field.touch()``. Fields that are modified otherwise have to be touched for dependent updates to take place."""
 
     __name__ = "Updater"
+    # Counter that is increased whenever the inputs or the update function change
+    _generation = 0
+    _inputs = None
+    _versions = None
 
-    def __init__(self, func=None):
+    def __init__(self, func=None, inputs=None):
         """Contains update instructions.
 
         Parameter
         ---------
         func : callable, optional, default : None
-            Function that is called when update function is called. None is a null operation."""
+            Function that is called when update function is called. None is a null operation.
+        inputs : list or None, optional, default : None
+            List of fields the function depends on. If None, the function is called on every update."""
         self._func = func
+        self.inputs = inputs
+
+    @property
+    def inputs(self):
+        '''List of fields the ``Updater`` depends on or ``None``.'''
+        return self._inputs
+
+    @inputs.setter
+    def inputs(self, value):
+        if value is not None:
+            if not isinstance(value, (list, tuple)):
+                raise TypeError("<inputs> has to be a list or None.")
+            for val in value:
+                if not hasattr(val, "version"):
+                    raise TypeError("<inputs> can only contain fields.")
+            value = list(value)
+        self._inputs = value
+        self._versions = None
+        self._generation += 1
 
     def update(self, owner, *args, **kwargs):
         """Function that is called when ``Group`` or ``Field`` to which ``Updater`` belongs is being updated.
@@ -25,8 +57,16 @@ class Updater():
             Parent ``Frame`` object
         args : additional positional arguments
         kwargs : additonal keyword arguments"""
-        if self._func is not None:
+        if self._func is None:
+            return
+        if self._inputs is None:
             return self._func(owner, *args, **kwargs)
+        versions = [val.version for val in self._inputs]
+        if versions == self._versions:
+            return
+        ret = self._func(owner, *args, **kwargs)
+        self._versions = versions
+        return ret
 
     def __str__(self):
         s = "{}".format(str(self.__name__)) + "\n"
@@ -1,14 +1,22 @@
 """This package contains infrastructure for solving differential equations within ``simframe``. The ``Integrator`` class
 is the basic class that advances the simulation from snapshot to snapshot by executing one integration ``Instruction`` at
 a time. Instructions contain a list of integration ``Scheme``. The ``schemes`` package contains pre-defined integration
-schemes that are ready to use in ``simframe``."""
+schemes that are ready to use in ``simframe``. ``Statistics`` counts the evaluations and steps of an ``Integrator``.
+``Memo`` shares intermediate results between derivative evaluations. ``ErrorNorm`` combines the errors of adaptive
+instructions."""
 
+from simframe.integration.errornorm import ErrorNorm
 from simframe.integration.instruction import Instruction
 from simframe.integration.integrator import Integrator
+from simframe.integration.memo import Memo
 from simframe.integration.scheme import Scheme
+from simframe.integration.statistics import Statistics
 import simframe.integration.schemes as schemes
 
-__all__ = ["Instruction",
+__all__ = ["ErrorNorm",
+           "Instruction",
            "Integrator",
+           "Memo",
            "Scheme",
+           "Statistics",
            "schemes"]
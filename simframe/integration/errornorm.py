@@ -0,0 +1,240 @@
+import numpy as np
+
+from simframe.frame.abstractgroup import AbstractGroup
+
+
+class ErrorNorm(object):
+    """Class for combining the error estimates of all adaptive integration ``Instruction`` objects.
+
+    If an ``ErrorNorm`` is assigned to ``Integrator.errornorm``, the adaptive schemes do not decide on their own
+    whether the step was successful. They register their error estimates instead. After all instructions were
+    executed, the ``Integrator`` combines the errors with a single norm. The step is accepted if the norm is not
+    larger than one. The suggested step sizes are calculated from the combined norm.
+
+    Notes
+    -----
+    The error of every element is weighted with ``atol + rtol * Yscale``, where ``Yscale`` is the scale of the
+    scheme. If ``rtol`` is None, the desired relative error ``eps`` of the scheme is used. At zero crossings the
+    elements are only weighted with ``atol``. The norm ``"max"`` with the default values reproduces the step size
+    control of a single adaptive instruction.
+
+    ``atol`` and ``rtol`` can be overwritten for individual instructions by adding them to the controller of
+    the ``Instruction``. There, they can also be arrays with the shape of the integrated ``Field``."""
+
+    __name__ = "ErrorNorm"
+
+    def __init__(self, norm="max", atol=0., rtol=None, description=""):
+        """Parameters
+        ----------
+        norm : str, optional, default : "max"
+            Norm that combines the errors. Either "max" or "rms"
+        atol : float, optional, default : 0.
+            Absolute tolerance
+        rtol : float or None, optional, default : None
+            Relative tolerance. If None, the desired relative error of the schemes is used
+        description : string, optional, default : ""
+            Descriptive string of the error norm"""
+        self.norm = norm
+        self.atol = atol
+        self.rtol = rtol
+        self.description = description
+        self._registered = []
+        self._value = None
+
+    def __str__(self):
+        return AbstractGroup.__str__(self)
+
+    def __repr__(self):
+        ret = self.__str__()+"\n"
+        ret += f"""{"-" * (len(self.__str__()))}\n"""
+        ret += f"""    Norm       : {self.norm}\n"""
+        ret += f"""    atol       : {self.atol}\n"""
+        ret += f"""    rtol       : {self.rtol if self.rtol is not None else "eps of schemes"}\n"""
+        ret += f"""    Last value : {self.value}"""
+        return ret
+
+    @property
+    def atol(self):
+        '''Absolute tolerance.'''
+        return self._atol
+
+    @atol.setter
+    def atol(self, value):
+        if not isinstance(value, (int, float)):
+            raise TypeError("<atol> has to be a number.")
+        if value < 0.:
+            raise ValueError("<atol> must not be negative.")
+        self._atol = value
+
+    @property
+    def description(self):
+        '''Description of ``ErrorNorm``.'''
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        if not isinstance(value, str):
+            raise TypeError("<description> has to be of type str.")
+        self._description = value
+
+    @property
+    def norm(self):
+        '''Norm that combines the errors. Either "max" or "rms".'''
+        return self._norm
+
+    @norm.setter
+    def norm(self, value):
+        if not isinstance(value, str):
+            raise TypeError("<norm> has to be of type str.")
+        if value not in ["max", "rms"]:
+            raise ValueError("<norm> has to be \"max\" or \"rms\".")
+        self._norm = value
+
+    @property
+    def rtol(self):
+        '''Relative tolerance or ``None``.'''
+        return self._rtol
+
+    @rtol.setter
+    def rtol(self, value):
+        if value is not None:
+            if not isinstance(value, (int, float)):
+                raise TypeError("<rtol> has to be a number or None.")
+            if value <= 0.:
+                raise ValueError("<rtol> has to be positive.")
+        self._rtol = value
+
+    @property
+    def value(self):
+        '''Combined error of the last integration attempt or ``None``.'''
+        return self._value
+
+    def _reset(self):
+        """Removes all registered errors."""
+        self._registered = []
+
+    def _register(self, e, Yscale, dx, eps, econ, pgrow, pshrink, safety, atol=None, rtol=None):
+        """Registers the error estimate of an adaptive scheme.
+
+        Parameters
+        ----------
+        e : array
+            Error estimate
+        Yscale : array
+            Scale of the variable
+        dx : IntVar
+            Step size of the scheme
+        eps : float
+            Desired maximum relative error of the scheme
+        econ : float
+            Error control parameter of the scheme
+        pgrow : float
+            Power for increasing step size
+        pshrink : float
+            Power for decreasing step size
+        safety : float
+            Safety factor when changing step size
+        atol : float, array, or None, optional, default : None
+            Absolute tolerance of the instruction. If None, ``ErrorNorm.atol`` is used
+        rtol : float, array, or None, optional, default : None
+            Relative tolerance of the instruction. If None, ``ErrorNorm.rtol`` is used"""
+        atol = self.atol if atol is None else atol
+        rtol = self.rtol if rtol is None else rtol
+        rtol = eps if rtol is None else rtol
+        scale = atol + rtol*Yscale
+        # Elements without scale, e.g., zero crossings without absolute tolerance, are not controlled
+        r = np.abs(np.divide(e, scale, out=np.zeros(np.shape(e)), where=scale > 0.))
+        self._registered.append((r, dx, econ, pgrow, pshrink, safety))
+
+    def _accept(self, var):
+        """Combines the registered errors and suggests step sizes.
+
+        Parameters
+        ----------
+        var : IntVar
+            Integration variable
+
+        Returns
+        -------
+        status : boolean
+            True if the step is accepted"""
+        if self._registered == []:
+            return True
+        if self.norm == "max":
+            E = max(np.max(r) for r, *_ in self._registered)
+        else:
+            N = sum(np.size(r) for r, *_ in self._registered)
+            E = np.sqrt(sum(np.sum(r**2) for r, *_ in self._registered) / N)
+        self._value = float(E)
+        for r, dx, econ, pgrow, pshrink, safety in self._registered:
+            if E <= 1.:
+                dxnew = safety*dx*E**pgrow if econ < E else 5.*dx
+            else:
+                dxnew = np.maximum(safety*dx*E**pshrink, 0.1*dx)
+            var.suggest(dxnew)
+        self._reset()
+        return E <= 1.
+
+
+def _geterrornorm(x0):
+    """Returns the ``ErrorNorm`` of the ``Integrator`` of the parent ``Frame`` of an integration variable.
+
+    Parameters
+    ----------
+    x0 : IntVar
+        Integration variable
+
+    Returns
+    -------
+    errornorm : ErrorNorm or None"""
+    integrator = getattr(getattr(x0, "_owner", None), "integrator", None)
+    return getattr(integrator, "errornorm", None)
+
+
+def _errornormdelta(x0, Y0, k0, dx, error, delta, eps, econ, pgrow, pshrink, safety, atol=None, rtol=None):
+    """Registers the error estimate of an adaptive scheme if the ``Integrator`` has an ``ErrorNorm``.
+
+    Parameters
+    ----------
+    x0 : IntVar
+        Integration variable at beginning of scheme
+    Y0 : Field
+        Variable to be integrated at the beginning of scheme
+    k0 : array
+        Derivative at the beginning of scheme
+    dx : IntVar
+        Step size of the scheme
+    error : array or callable
+        Error estimate or function without arguments that returns it
+    delta : callable
+        Function without arguments that returns the delta of the variable
+    eps : float
+        Desired maximum relative error of the scheme
+    econ : float
+        Error control parameter of the scheme
+    pgrow : float
+        Power for increasing step size
+    pshrink : float
+        Power for decreasing step size
+    safety : float
+        Safety factor when changing step size
+    atol : float, array, or None, optional, default : None
+        Absolute tolerance of the instruction
+    rtol : float, array, or None, optional, default : None
+        Relative tolerance of the instruction
+
+    Returns
+    -------
+    dY : array or None
+        Delta of the variable or None if the scheme controls the step size on its own
+
+    Notes
+    -----
+    The scale is not modified at zero crossings. Elements with zero scale are only controlled by ``atol``."""
+    errornorm = _geterrornorm(x0)
+    if errornorm is None:
+        return None
+    Yscale = np.abs(Y0) + np.abs(dx*k0)
+    e = error() if callable(error) else error
+    errornorm._register(e, Yscale, dx, eps, econ, pgrow, pshrink, safety, atol=atol, rtol=rtol)
+    return delta()
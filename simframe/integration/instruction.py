@@ -67,7 +67,11 @@ class Instruction(Scheme):
             New value of the variable to be integrated"""
         x0 = self.Y._owner.integrator.var
         Y0 = self.Y
-        ret = self.scheme(x0, Y0, self.fstep*dx, **self.controller)
+        dx = self.fstep*dx
+        # The step size must not promote fields with lower precision
+        if getattr(Y0._owner, "dtype", None) is not None and Y0.dtype.kind == "f":
+            dx = np.asarray(dx, dtype=Y0.dtype)
+        ret = self.scheme(x0, Y0, dx, **self.controller)
         if ret is False:
             return False
         if ret is True:
@@ -4,8 +4,11 @@ import numpy as np
 from simframe.frame.abstractgroup import AbstractGroup
 from simframe.frame.heartbeat import Heartbeat
 from simframe.frame.intvar import IntVar
+from simframe.integration.errornorm import ErrorNorm
 from simframe.integration.instruction import Instruction
+from simframe.integration.memo import Memo
 from simframe.integration.schemes import update
+from simframe.integration.statistics import Statistics
 
 
 class Integrator:
@@ -13,7 +16,12 @@ class Integrator:
 
     __name__ = "Integrator"
 
-    def __init__(self, var, instructions=[], failop=None, preparator=None, finalizer=None, maxit=500, description=""):
+    # Defaults for objects that were pickled before these attributes existed
+    _errornorm = None
+    _memo = None
+    _stats = None
+
+    def __init__(self, var, instructions=[], failop=None, preparator=None, finalizer=None, maxit=500, errornorm=None, description=""):
         """Integrator
 
         Parameters
@@ -30,15 +38,21 @@ class Integrator:
             Heartbeat that will be executed after the integration
         maxit : int, optional, default : 5000
             Maximum number of integration iterations
+        errornorm : ErrorNorm or None, optional, default : None
+            Norm that combines the errors of all adaptive instructions. If None, every adaptive
+            instruction controls the step size on its own
         description : str, optional, default : ""
             Description of integrator"""
         self.description = description
+        self.errornorm = errornorm
         self.failop = failop
         self.finalizer = finalizer
         self.instructions = instructions
         self.maxit = maxit
         self.preparator = preparator
         self.var = var
+        self.stats = Statistics()
+        self.memo = Memo()
 
     def __str__(self):
         return AbstractGroup.__str__(self)
@@ -57,6 +71,17 @@ class Integrator:
             raise TypeError("<value> has to be of type str.")
         self._description = value
 
+    @property
+    def errornorm(self):
+        '''``ErrorNorm`` that decides on the success of adaptive instructions or ``None``.'''
+        return self._errornorm
+
+    @errornorm.setter
+    def errornorm(self, value):
+        if value is not None and not isinstance(value, ErrorNorm):
+            raise TypeError("<errornorm> has to be of type ErrorNorm or None.")
+        self._errornorm = value
+
     @property
     def failop(self):
         '''``Heartbeat`` objects that is called if any integration ``Instruction`` returned ``False``'''
@@ -109,6 +134,19 @@ class Integrator:
             raise ValueError("maxit has to be larger 0.")
         self._maxit = value
 
+    @property
+    def memo(self):
+        '''``Memo`` for sharing intermediate results between derivative evaluations of the same stage.'''
+        if self._memo is None:
+            self._memo = Memo()
+        return self._memo
+
+    @memo.setter
+    def memo(self, value):
+        if not isinstance(value, Memo):
+            raise TypeError("<memo> has to be of type Memo.")
+        self._memo = value
+
     @property
     def preparator(self):
         '''``Heartbeat`` object that is called before the integration instructions will be executed.'''
@@ -121,6 +159,19 @@ class Integrator:
         else:
             self._preparator = Heartbeat(value)
 
+    @property
+    def stats(self):
+        '''``Statistics`` with the number of evaluations and steps of the integration.'''
+        if self._stats is None:
+            self._stats = Statistics()
+        return self._stats
+
+    @stats.setter
+    def stats(self, value):
+        if not isinstance(value, Statistics):
+            raise TypeError("<stats> has to be of type Statistics.")
+        self._stats = value
+
     @property
     def var(self):
         '''The integration variable ``IntVar`` that is associated with this ``Integrator``.'''
@@ -151,12 +202,24 @@ class Integrator:
                     "Maximum number of integration attempts exceeded.")
             # Safe all return values in list
             ret = deque([])
-            for inst in self.instructions:
-                ret.append(inst(stepsize))
+            # Memoized quantities are only valid during a single attempt
+            self.memo._start()
+            if self.errornorm is not None:
+                self.errornorm._reset()
+            try:
+                for inst in self.instructions:
+                    ret.append(inst(stepsize))
+            finally:
+                self.memo._stop()
+            # The combined error of adaptive instructions decides on the success
+            if self.errornorm is not None and not self.errornorm._accept(self.var):
+                ret.append(False)
             # If no instruction returned False, Integration was successful. Exit the loop.
             if not np.any(np.array(ret) == False):
                 status = True
+                self.stats.naccepted += 1
             else:
+                self.stats.nrejected += 1
                 # Reset buffers if integration failed
                 for inst in self.instructions:
                     inst.Y._buffer = None
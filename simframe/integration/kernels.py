@@ -0,0 +1,211 @@
+"""Kernels for the linear combinations of explicit Runge-Kutta stages.
+
+If ``numba`` is installed, the stage combinations and the error estimate are computed in single compiled loops
+that pass over the data only once. Otherwise, or if the arrays are not suitable, i.e., not contiguous or of
+different data types or shapes, the kernels fall back to ``numpy``. ``backend`` contains the name of the
+backend that is used if possible. ``numba`` is installed with the optional extra ``simframe[numba]``."""
+
+import numpy as np
+
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+backend = "numba" if _numba is not None else "numpy"
+
+
+def _stageloop(out, Y0, dx, coeffs, ks):
+    """Loop that computes ``Y0 + dx * sum(coeffs*ks)``.
+
+    Parameters
+    ----------
+    out : array
+        Flat output array
+    Y0 : array
+        Flat array with the value at the beginning of the step
+    dx : float
+        Step size
+    coeffs : array
+        Coefficients of the linear combination
+    ks : tuple
+        Tuple of flat arrays with the stage derivatives"""
+    for j in range(out.shape[0]):
+        s = 0.
+        for i in range(len(ks)):
+            s += coeffs[i]*ks[i][j]
+        out[j] = Y0[j] + s*dx
+
+
+def _deltaloop(out, dx, coeffs, ks):
+    """Loop that computes ``dx * sum(coeffs*ks)``.
+
+    Parameters
+    ----------
+    out : array
+        Flat output array
+    dx : float
+        Step size
+    coeffs : array
+        Coefficients of the linear combination
+    ks : tuple
+        Tuple of flat arrays with the stage derivatives"""
+    for j in range(out.shape[0]):
+        s = 0.
+        for i in range(len(ks)):
+            s += coeffs[i]*ks[i][j]
+        out[j] = dx*s
+
+
+def _errorloop(Y0, k0, dx, coeffs, ks):
+    """Loop that computes the maximum relative error ``max(|dx * sum(coeffs*ks)| / (|Y0| + |dx*k0|))``.
+
+    Parameters
+    ----------
+    Y0 : array
+        Flat array with the value at the beginning of the step
+    k0 : array
+        Flat array with the derivative at the beginning of the step
+    dx : float
+        Step size
+    coeffs : array
+        Error coefficients
+    ks : tuple
+        Tuple of flat arrays with the stage derivatives
+
+    Returns
+    -------
+    emax : float
+        Maximum relative error. Elements with zero scale are ignored"""
+    emax = 0.
+    for j in range(Y0.shape[0]):
+        scale = abs(Y0[j]) + abs(dx*k0[j])
+        if scale == 0.:
+            continue
+        s = 0.
+        for i in range(len(ks)):
+            s += coeffs[i]*ks[i][j]
+        err = abs(dx*s) / scale
+        if err > emax:
+            emax = err
+    return emax
+
+
+if _numba is not None:
+    _stageloop = _numba.njit(cache=True)(_stageloop)
+    _deltaloop = _numba.njit(cache=True)(_deltaloop)
+    _errorloop = _numba.njit(cache=True)(_errorloop)
+
+
+def _fusable(Y0, ks):
+    """Checks if the compiled loops can be used.
+
+    Parameters
+    ----------
+    Y0 : array
+        Value at the beginning of the step
+    ks : tuple
+        Stage derivatives
+
+    Returns
+    -------
+    fusable : boolean
+        True if all arrays are contiguous floating point arrays of the same data type and shape"""
+    if _numba is None:
+        return False
+    if not isinstance(Y0, np.ndarray) or Y0.dtype.kind != "f" or not Y0.flags.c_contiguous:
+        return False
+    for k in ks:
+        if not isinstance(k, np.ndarray) or k.dtype != Y0.dtype or k.shape != Y0.shape or not k.flags.c_contiguous:
+            return False
+    return True
+
+
+def stage(Y0, dx, coeffs, ks):
+    """Computes the value of a stage ``Y0 + dx * sum(coeffs*ks)``.
+
+    Parameters
+    ----------
+    Y0 : Field
+        Value at the beginning of the step
+    dx : IntVar
+        Step size
+    coeffs : tuple
+        Coefficients of the linear combination
+    ks : tuple
+        Stage derivatives
+
+    Returns
+    -------
+    Y : Field
+        Value of the stage"""
+    if _fusable(Y0, ks):
+        out = np.empty_like(Y0)
+        _stageloop(out.reshape(-1), Y0.reshape(-1), float(dx),
+                   np.asarray(coeffs, dtype=np.float64), tuple(k.reshape(-1) for k in ks))
+        return out
+    s = coeffs[0]*ks[0]
+    for c, k in zip(coeffs[1:], ks[1:]):
+        s = s + c*k
+    return Y0 + s*dx
+
+
+def delta(Y0, dx, coeffs, ks):
+    """Computes the increment of a step ``dx * sum(coeffs*ks)``.
+
+    Parameters
+    ----------
+    Y0 : Field
+        Value at the beginning of the step
+    dx : IntVar
+        Step size
+    coeffs : tuple
+        Weights of the stages
+    ks : tuple
+        Stage derivatives
+
+    Returns
+    -------
+    dY : Field
+        Increment of the step"""
+    if _fusable(Y0, ks):
+        out = np.empty_like(Y0)
+        _deltaloop(out.reshape(-1), float(dx),
+                   np.asarray(coeffs, dtype=np.float64), tuple(k.reshape(-1) for k in ks))
+        return out
+    s = coeffs[0]*ks[0]
+    for c, k in zip(coeffs[1:], ks[1:]):
+        s = s + c*k
+    return dx*s
+
+
+def errormax(Y0, k0, dx, coeffs, ks):
+    """Computes the maximum relative error of an embedded method.
+
+    Parameters
+    ----------
+    Y0 : Field
+        Value at the beginning of the step
+    k0 : Field
+        Derivative at the beginning of the step
+    dx : IntVar
+        Step size
+    coeffs : tuple
+        Error coefficients
+    ks : tuple
+        Stage derivatives
+
+    Returns
+    -------
+    emax : float
+        Maximum of ``|e| / (|Y0| + |dx*k0|)``, where ``e = dx * sum(coeffs*ks)`` is the error estimate.
+        Elements with zero scale are ignored"""
+    if _fusable(Y0, (k0,) + tuple(ks)):
+        return _errorloop(Y0.reshape(-1), k0.reshape(-1), float(dx),
+                          np.asarray(coeffs, dtype=np.float64), tuple(k.reshape(-1) for k in ks))
+    Yscale = np.abs(Y0) + np.abs(dx*k0)
+    Yscale[Yscale == 0.] = min(1.e100, float(np.finfo(Yscale.dtype).max))  # Deactivate for zero crossings
+    s = coeffs[0]*ks[0]
+    for c, k in zip(coeffs[1:], ks[1:]):
+        s = s + c*k
+    return np.max(np.abs(dx*s/Yscale))
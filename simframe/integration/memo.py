@@ -0,0 +1,120 @@
+from simframe.frame.abstractgroup import AbstractGroup
+
+
+class Memo(object):
+    """Class for storing intermediate results that are shared between derivative evaluations.
+
+    ``Memo`` behaves like a dictionary whose content is only valid for the current stage of the integration.
+    Differentiators and jacobinators can store quantities like fluxes or rates in ``Integrator.memo`` and fetch them
+    again instead of recomputing them.
+
+    Notes
+    -----
+    A stage is defined by the state at which ``Field.derivative()`` or ``Field.jacobian()`` is evaluated.
+
+    During ``Integrator.integrate()`` all evaluations at the beginning of the step, i.e., with the integration
+    variable of the integrator and the ``Field`` itself, share the same content. This is the case for the first
+    stage of all integration schemes. This content is valid for all fields until the integration attempt is
+    finished.
+
+    Every other evaluation, e.g., at intermediate stages or outside of the integration, starts with an empty
+    ``Memo``, whose content is discarded when the evaluation is finished. Here, the content is only shared
+    within the differentiator and the jacobinator of the evaluated ``Field``.
+
+    Do not store quantities that depend on the stage values of other fields than the one that is evaluated."""
+
+    __name__ = "Memo"
+
+    def __init__(self, description=""):
+        """Parameters
+        ----------
+        description : string, optional, default : ""
+            Descriptive string of the memo"""
+        self.description = description
+        self._active = False
+        self._base = {}
+        self._current = {}
+
+    @property
+    def description(self):
+        '''Description of ``Memo``.'''
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        if not isinstance(value, str):
+            raise TypeError("<description> has to be of type str.")
+        self._description = value
+
+    def __str__(self):
+        return AbstractGroup.__str__(self)
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __contains__(self, key):
+        return key in self._current
+
+    def __getitem__(self, key):
+        return self._current[key]
+
+    def __setitem__(self, key, value):
+        self._current[key] = value
+
+    def __len__(self):
+        return len(self._current)
+
+    def get(self, key, default=None):
+        """Returns a stored value.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the value
+        default : optional, default : None
+            Value that is returned if key is not stored
+
+        Returns
+        -------
+        value : Stored value or default"""
+        return self._current.get(key, default)
+
+    def clear(self):
+        """Removes the content of the current stage and of the beginning of the step."""
+        self._base.clear()
+        self._current.clear()
+
+    def _enter(self, base):
+        """Starts a new stage.
+
+        Parameters
+        ----------
+        base : boolean
+            True if the stage is at the beginning of the step
+
+        Returns
+        -------
+        previous : dict
+            Content of the previous stage"""
+        previous = self._current
+        self._current = self._base if (base and self._active) else {}
+        return previous
+
+    def _exit(self, previous):
+        """Finishes the current stage.
+
+        Parameters
+        ----------
+        previous : dict
+            Content of the previous stage that is restored"""
+        self._current = previous
+
+    def _start(self):
+        """Activates the ``Memo`` for an integration attempt."""
+        self.clear()
+        self._active = True
+
+    def _stop(self):
+        """Deactivates the ``Memo`` after the integration."""
+        self._active = False
+        self.clear()
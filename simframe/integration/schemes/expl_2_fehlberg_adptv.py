@@ -1,3 +1,4 @@
+from simframe.integration.errornorm import _errornormdelta
 from simframe.integration.scheme import Scheme
 
 import numpy as np
@@ -57,9 +58,16 @@ def _f_expl_2_fehlberg_adptv(x0, Y0, dx, *args, dYdx=None, econ=0.0324, eps=0.1,
     k2 = Y0.derivative(x0 + dx, Y0 + (a20*k0 + a21*k1)*dx)
 
     Yscale = np.abs(Y0) + np.abs(dx*k0)
-    Yscale[Yscale == 0.] = 1.e100       # Deactivate for zero crossings
+    Yscale[Yscale == 0.] = min(1.e100, float(np.finfo(Yscale.dtype).max))  # Deactivate for zero crossings
 
     e = dx*(e0*k0 + e1*k1 + e2*k2)
+
+    # Returns None if the integrator has no error norm
+    dY = _errornormdelta(x0, Y0, k0, dx, e, lambda: dx*(b0*k0 + b1*k1 + b2*k2),
+                         eps, econ, pgrow, pshrink, safety, atol=kwargs.get("atol"), rtol=kwargs.get("rtol"))
+    if dY is not None:
+        return dY
+
     emax = np.max(np.abs(e/Yscale)) / eps
 
     # Integration successful
@@ -1,3 +1,4 @@
+from simframe.integration.errornorm import _errornormdelta
 from simframe.integration.scheme import Scheme
 
 import numpy as np
@@ -68,9 +69,16 @@ def _f_expl_5_cash_karp_adptv(x0, Y0, dx, *args, dYdx=None, econ=0.0001889568, e
                                          k1 + a52*k2 + a53*k3 + a54*k4)*dx)
 
     Yscale = np.abs(Y0) + np.abs(dx*k0)
-    Yscale[Yscale == 0.] = 1.e100       # Deactivate for zero crossings
+    Yscale[Yscale == 0.] = min(1.e100, float(np.finfo(Yscale.dtype).max))  # Deactivate for zero crossings
 
     e = dx*(e0*k0 + e2*k2 + e3*k3 + e4*k4 + e5*k5)
+
+    # Returns None if the integrator has no error norm
+    dY = _errornormdelta(x0, Y0, k0, dx, e, lambda: dx*(b0*k0 + b2*k2 + b3*k3 + b5*k5),
+                         eps, econ, pgrow, pshrink, safety, atol=kwargs.get("atol"), rtol=kwargs.get("rtol"))
+    if dY is not None:
+        return dY
+
     emax = np.max(np.abs(e/Yscale)) / eps
 
     # Integration successful
@@ -1,3 +1,5 @@
+from simframe.integration import kernels
+from simframe.integration.errornorm import _errornormdelta
 from simframe.integration.scheme import Scheme
 
 import numpy as np
@@ -62,27 +64,35 @@ def _f_expl_5_dormand_prince_adptv(x0, Y0, dx, *args, dYdx=None, econ=0.00018895
           | 5179/57600       0      7571/16695  393/640 −92097/339200 187/2100 1/40
     """
     k0 = Y0.derivative(x0, Y0) if dYdx is None else dYdx
-    k1 = Y0.derivative(x0 + c1*dx, Y0 + a10*k0 * dx)
-    k2 = Y0.derivative(x0 + c2*dx, Y0 + (a20*k0 + a21*k1)*dx)
-    k3 = Y0.derivative(x0 + c3*dx, Y0 + (a30*k0 + a31*k1 + a32*k2)*dx)
-    k4 = Y0.derivative(x0 + dx, Y0 + (a40*k0 + a41*k1 + a42*k2 + a43*k3)*dx)
-    k5 = Y0.derivative(x0 + dx, Y0 + (a50*k0 + a51 *
-                       k1 + a52*k2 + a53*k3 + a54*k4)*dx)
-    k6 = Y0.derivative(x0 + dx, Y0 + (a60*k0 + a62 *
-                       k2 + a63*k3 + a64*k4 + a65*k5)*dx)
+    k1 = Y0.derivative(x0 + c1*dx, kernels.stage(Y0, dx, (a10,), (k0,)))
+    k2 = Y0.derivative(x0 + c2*dx, kernels.stage(Y0, dx,
+                       (a20, a21), (k0, k1)))
+    k3 = Y0.derivative(x0 + c3*dx, kernels.stage(Y0, dx,
+                       (a30, a31, a32), (k0, k1, k2)))
+    k4 = Y0.derivative(x0 + dx, kernels.stage(Y0, dx,
+                       (a40, a41, a42, a43), (k0, k1, k2, k3)))
+    k5 = Y0.derivative(x0 + dx, kernels.stage(Y0, dx,
+                       (a50, a51, a52, a53, a54), (k0, k1, k2, k3, k4)))
+    k6 = Y0.derivative(x0 + dx, kernels.stage(Y0, dx,
+                       (a60, a62, a63, a64, a65), (k0, k2, k3, k4, k5)))
 
-    Yscale = np.abs(Y0) + np.abs(dx*k0)
-    Yscale[Yscale == 0.] = 1.e100       # Deactivate for zero crossings
+    # Returns None if the integrator has no error norm
+    dY = _errornormdelta(x0, Y0, k0, dx,
+                         lambda: dx*(e0*k0 + e2*k2 + e3*k3 + e4*k4 + e5*k5 + e6*k6),
+                         lambda: kernels.delta(Y0, dx, (b0, b2, b3, b5), (k0, k2, k3, k5)),
+                         eps, econ, pgrow, pshrink, safety, atol=kwargs.get("atol"), rtol=kwargs.get("rtol"))
+    if dY is not None:
+        return dY
 
-    e = dx*(e0*k0 + e2*k2 + e3*k3 + e4*k4 + e5*k5 + e6*k6)
-    emax = np.max(np.abs(e/Yscale)) / eps
+    emax = kernels.errormax(Y0, k0, dx, (e0, e2, e3, e4, e5, e6),
+                            (k0, k2, k3, k4, k5, k6)) / eps
 
     # Integration successful
     if emax <= 1.:
         # Suggest new stepsize
         dxnew = safety*dx*emax**pgrow if econ < emax else 5.*dx
         x0.suggest(dxnew)
-        return dx*(b0*k0 + b2*k2 + b3*k3 + b5*k5)
+        return kernels.delta(Y0, dx, (b0, b2, b3, b5), (k0, k2, k3, k5))
     else:
         # Suggest new stepsize
         dxnew = np.maximum(safety*dx*emax**pshrink, 0.1*dx)
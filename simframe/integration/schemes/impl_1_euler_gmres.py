@@ -1,4 +1,5 @@
 from simframe.integration.scheme import Scheme
+from simframe.integration.statistics import _count
 
 import numpy as np
 from scipy.sparse import linalg
@@ -35,9 +36,10 @@ def _f_impl_1_euler_gmres(x0, Y0, dx, jac=None, gmres_opt={"atol": 0.}, *args, *
     """
     jac = Y0.jacobian(x0 + dx) if jac is None else jac  # Jacobain
     N = jac.shape[0] if jac.ndim else 1                 # Problem size
-    eye = np.eye(N)                                     # Identity matrix
+    eye = np.eye(N, dtype=jac.dtype)                    # Identity matrix
 
     A = eye - dx*jac
+    _count(x0._owner, "nsolve")
     b = Y0[None] if Y0.shape == () else Y0
     res, state = linalg.gmres(A, b, **gmres_opt)
     if state != 0:
@@ -1,4 +1,5 @@
 from simframe.integration.scheme import Scheme
+from simframe.integration.statistics import _count
 
 import numpy as np
 
@@ -32,9 +33,10 @@ def _f_impl_2_midpoint_direct(x0, Y0, dx, jac=None, *args, **kwargs):
     """
     jac = Y0.jacobian(x0 + dx) if jac is None else jac  # Jacobain
     N = jac.shape[0] if jac.ndim else 1                 # Problem size
-    eye = np.eye(N)                                     # Identity matrix
+    eye = np.eye(N, dtype=jac.dtype)                    # Identity matrix
 
     A = eye - 0.5*dx*jac
+    _count(x0._owner, "nsolve")
     Ainv = np.linalg.inv(A)
     k1 = np.dot(Ainv, np.dot(jac, Y0))
 
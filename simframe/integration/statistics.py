@@ -0,0 +1,67 @@
+from simframe.frame.abstractgroup import AbstractGroup
+
+
+class Statistics(object):
+    """Class that counts the work done by an ``Integrator``.
+
+    The counters are increased by ``Integrator.integrate()``, ``Field.derivative()``, ``Field.jacobian()``, and
+    the implicit integration schemes. They are accumulated over all calls of ``Frame.run()`` until
+    ``Statistics.reset()`` is called."""
+
+    __name__ = "Statistics"
+
+    def __init__(self, description=""):
+        """Parameters
+        ----------
+        description : string, optional, default : ""
+            Descriptive string of the statistics"""
+        self.description = description
+        self.reset()
+
+    @property
+    def description(self):
+        '''Description of ``Statistics``.'''
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        if not isinstance(value, str):
+            raise TypeError("<description> has to be of type str.")
+        self._description = value
+
+    def __str__(self):
+        return AbstractGroup.__str__(self)
+
+    def __repr__(self):
+        ret = self.__str__()+"\n"
+        ret += f"""{"-" * (len(self.__str__()))}\n"""
+        ret += f"""    Derivative evaluations : {self.nfev}\n"""
+        ret += f"""    Jacobian evaluations   : {self.njev}\n"""
+        ret += f"""    Accepted steps         : {self.naccepted}\n"""
+        ret += f"""    Rejected steps         : {self.nrejected}\n"""
+        ret += f"""    Linear solves          : {self.nsolve}"""
+        return ret
+
+    def reset(self):
+        """Sets all counters to zero."""
+        self.nfev = 0
+        self.njev = 0
+        self.naccepted = 0
+        self.nrejected = 0
+        self.nsolve = 0
+
+
+def _count(owner, counter):
+    """Increases a counter of the ``Statistics`` of the ``Integrator`` of a ``Frame`` by one, if an
+    ``Integrator`` is set.
+
+    Parameters
+    ----------
+    owner : Frame
+        Parent ``Frame`` object
+    counter : str
+        Name of the counter"""
+    integrator = getattr(owner, "integrator", None)
+    if integrator is not None:
+        stats = integrator.stats
+        setattr(stats, counter, getattr(stats, counter) + 1)
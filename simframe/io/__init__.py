@@ -1,15 +1,20 @@
 """This package is for input/output operations. It contains template ``Writer`` and ``Reader`` classes that can be used
 to create customized writing and reading methods. The package ``writers`` contains pre-defined ``Writer`` instances for
 writing and reading ``simframe`` data. The package furthermore contains a method for reading dump files and for printing
-a progress bar in an interactive shell."""
+a progress bar in an interactive shell. The ``Checkpoint`` class controls how often a ``Writer`` writes dump files.
+A ``LazySequence`` is returned by ``Reader.all(lazy=True)`` and reads the data of a field only on access."""
 
+from simframe.io.checkpoint import Checkpoint
+from simframe.io.lazysequence import LazySequence
 from simframe.io.reader import Reader
 from simframe.io.writer import Writer
 from simframe.io import writers
 from simframe.io.dump import readdump
 from simframe.io.progress import Progressbar
 
-__all__ = ["Reader",
+__all__ = ["Checkpoint",
+           "LazySequence",
+           "Reader",
            "Writer",
            "writers",
            "readdump",
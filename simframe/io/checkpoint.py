@@ -0,0 +1,146 @@
+from time import monotonic
+
+from simframe.frame.abstractgroup import AbstractGroup
+
+
+class Checkpoint(object):
+    """Class that controls how often a ``Writer`` writes dump files.
+
+    By default a dump file is written with every output. A dump file can also be written only every ``every``
+    outputs or only if at least ``interval`` seconds of wall clock time have passed since the last dump file.
+    If both are set, a dump file is written if any of the two conditions is met. If neither is set, a dump file
+    is written with every output. Dumping with the outputs can be switched off with ``Writer.dumping``.
+
+    To write dump files only on demand, set ``Writer.dumping`` to False. The default ``Listener`` of the
+    ``Frame`` still writes a dump file if the file ``DUMP`` is found in the data directory. ``keep`` and
+    ``outofband`` apply to these dump files as well.
+
+    The ``Writer`` keeps ``keep`` rotating dump files. The most recent one is always ``frame.dmp``, older ones
+    are renamed to ``frame.dmp.1``, ``frame.dmp.2``, and so on.
+
+    With ``outofband=True`` dump files store the data of all ``Field`` objects as raw buffers separated from the
+    pickled object graph. These dump files are faster to write and can be memory-mapped by ``readdump``."""
+
+    __name__ = "Checkpoint"
+
+    def __init__(self, every=None, interval=None, keep=1, outofband=False, description=""):
+        """Parameters
+        ----------
+        every : int or None, optional, default : None
+            Dump file is written every <every> outputs. If <every> and <interval> are None, dump
+            file is written with every output
+        interval : float or None, optional, default : None
+            Dump file is written if <interval> seconds passed since the last dump file
+        keep : int, optional, default : 1
+            Number of rotating dump files that are kept
+        outofband : boolean, optional, default : False
+            If True, dump files are written with out-of-band array data
+        description : string, optional, default : ""
+            Descriptive string of the checkpoint policy"""
+        self.every = every
+        self.interval = interval
+        self.keep = keep
+        self.outofband = outofband
+        self.description = description
+        self.reset()
+
+    @property
+    def description(self):
+        '''Description of ``Checkpoint``.'''
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        if not isinstance(value, str):
+            raise TypeError("<description> has to be of type str.")
+        self._description = value
+
+    @property
+    def every(self):
+        '''Number of outputs between two dump files. ``None`` if not used.'''
+        return self._every
+
+    @every.setter
+    def every(self, value):
+        if value is not None:
+            if not isinstance(value, int):
+                raise TypeError("<every> has to be of type int or None.")
+            if value < 1:
+                raise ValueError("<every> has to be larger than 0.")
+        self._every = value
+
+    @property
+    def interval(self):
+        '''Wall clock time in seconds between two dump files. ``None`` if not used.'''
+        return self._interval
+
+    @interval.setter
+    def interval(self, value):
+        if value is not None:
+            if not isinstance(value, (int, float)):
+                raise TypeError("<interval> has to be a number or None.")
+            if value < 0:
+                raise ValueError("<interval> cannot be negative.")
+        self._interval = value
+
+    @property
+    def keep(self):
+        '''Number of rotating dump files that are kept.'''
+        return self._keep
+
+    @keep.setter
+    def keep(self, value):
+        if not isinstance(value, int):
+            raise TypeError("<keep> has to be of type int.")
+        if value < 1:
+            raise ValueError("<keep> has to be larger than 0.")
+        self._keep = value
+
+    @property
+    def outofband(self):
+        '''If ``True`` dump files are written with out-of-band array data.'''
+        return self._outofband
+
+    @outofband.setter
+    def outofband(self, value):
+        if not isinstance(value, int):
+            raise TypeError("<outofband> has to be of type bool.")
+        if value:
+            self._outofband = True
+        else:
+            self._outofband = False
+
+    def __str__(self):
+        return AbstractGroup.__str__(self)
+
+    def __repr__(self):
+        ret = self.__str__()+"\n"
+        ret += f"""{"-" * (len(self.__str__()))}\n"""
+        ret += f"""    Every       : {self.every}\n"""
+        ret += f"""    Interval    : {self.interval}\n"""
+        ret += f"""    Keep        : {self.keep}\n"""
+        ret += f"""    Out-of-band : {self.outofband}"""
+        return ret
+
+    def due(self):
+        """Function that is called with every output and that returns if a dump file should be written.
+
+        Returns
+        -------
+        due : boolean
+            True if a dump file should be written"""
+        self._count += 1
+        due = self.every is None and self.interval is None
+        if self.every is not None and self._count >= self.every:
+            due = True
+        if self.interval is not None and monotonic() - self._tlast >= self.interval:
+            due = True
+        if due:
+            self._count = 0
+            self._tlast = monotonic()
+        return due
+
+    def reset(self):
+        """Resets the output counter and the wall clock timer."""
+        self._count = 0
+        self._tlast = monotonic()
@@ -1,7 +1,17 @@
 import dill
+import io
+import numpy as np
+import os
+import pickle
+import struct
 
+# Magic bytes that identify dump files with out-of-band array data
+_MAGIC = b"SFDUMP05"
+# Alignment of the array data in bytes
+_ALIGN = 64
 
-def writedump(object, filename="frame.dmp"):
+
+def writedump(object, filename="frame.dmp", outofband=False):
     """Writes object to dump file
 
     Parameters
@@ -9,18 +19,40 @@ def writedump(object, filename="frame.dmp"):
     object : object
         object to be written to file
     filename : str, optional, default : "frame.dmp"
-        path to file to be written"""
-    with open(filename, "wb") as dumpfile:
-        dill.dump(object, dumpfile)
+        path to file to be written
+    outofband : boolean, optional, default : False
+        If True, array data is written as raw aligned buffers separated from the pickled object graph
+
+    Notes
+    -----
+    The dump file is first written to a temporary file that is renamed afterwards.
+    An existing dump file is therefore never left in a corrupted state.
+
+    With ``outofband=True`` the object graph is pickled with protocol 5 and the data of all contiguous arrays,
+    including ``Field`` objects, is written as raw buffers behind it. The arrays are never copied into the pickle
+    stream, which avoids the peak memory of a full in-memory copy and allows ``readdump`` to memory-map them."""
+    tmpfile = str(filename) + ".tmp"
+    try:
+        with open(tmpfile, "wb") as dumpfile:
+            if outofband:
+                _writeoutofband(object, dumpfile)
+            else:
+                dill.dump(object, dumpfile)
+        os.replace(tmpfile, filename)
+    finally:
+        if os.path.exists(tmpfile):
+            os.remove(tmpfile)
 
 
-def readdump(filename):
+def readdump(filename, mmap=True):
     """Reads dumpfile and returns ``Frame`` object
 
     Parameters
     ----------
     filename : str
         Path to file to be read
+    mmap : boolean, optional, default : True
+        If True, array data of dump files with out-of-band buffers is memory-mapped instead of read into memory
 
     Returns
     -------
@@ -30,7 +62,139 @@ def readdump(filename):
     Notes
     -----
     Only read dump files from sources you trust.
-    Malware can be injected."""
+    Malware can be injected.
+
+    Memory-mapped arrays are opened copy-on-write. Changing them does not alter the dump file."""
     with open(filename, "rb") as dumpfile:
+        if dumpfile.read(len(_MAGIC)) == _MAGIC:
+            return _readoutofband(dumpfile, filename, mmap=mmap)
+        dumpfile.seek(0)
         obj = dill.load(dumpfile)
     return obj
+
+
+class _OutOfBandPickler(dill.Pickler):
+    """Pickler that writes the data of contiguous arrays out-of-band.
+
+    Arrays, including subclasses like ``Field``, are reduced to their type, their data as ``pickle.PickleBuffer``,
+    and their attributes. The buffers are passed to the buffer callback. ``dill`` would otherwise copy the data
+    into the pickle stream."""
+
+    def reducer_override(self, obj):
+        if not isinstance(obj, np.ndarray) or isinstance(obj, np.memmap):
+            return NotImplemented
+        if obj.dtype.hasobject or not (obj.flags.c_contiguous or obj.flags.f_contiguous):
+            return NotImplemented
+        # Views of fields are rebuilt from their parents
+        if getattr(obj, "_viewof", None) is not None:
+            return NotImplemented
+        order = "C" if obj.flags.c_contiguous else "F"
+        args = (type(obj), pickle.PickleBuffer(obj.view(np.ndarray)), obj.dtype.str, obj.shape, order)
+        return (_rebuildarray, args, getattr(obj, "__dict__", None))
+
+
+def _rebuildarray(cls, buffer, dtype, shape, order):
+    """Helper function that rebuilds an ``numpy.ndarray`` or its subclass from its data.
+
+    Parameters
+    ----------
+    cls : type
+        ``numpy.ndarray`` or subclass of it
+    buffer : buffer
+        Raw data of the array. Memory-mapped buffers are not copied
+    dtype : str
+        Data type of the array
+    shape : tuple
+        Shape of the array
+    order : str
+        Memory layout of the data, "C" or "F"
+
+    Returns
+    -------
+    obj : cls
+        View of the data as <cls>"""
+    data = buffer if isinstance(buffer, np.ndarray) else np.frombuffer(buffer, dtype=np.uint8)
+    data = data.view(dtype).reshape(shape, order=order)
+    return data.view(cls)
+
+
+def _writeoutofband(object, dumpfile):
+    """Writes object to open file with array data as out-of-band buffers.
+
+    Parameters
+    ----------
+    object : object
+        object to be written to file
+    dumpfile : file
+        File opened for binary writing
+
+    Notes
+    -----
+    File layout: magic bytes, length of pickled object graph, pickled object graph, aligned raw buffers,
+    pickled buffer table of offsets and lengths, length of buffer table."""
+    buffers = []
+    graph = io.BytesIO()
+    _OutOfBandPickler(graph, protocol=5,
+                      buffer_callback=buffers.append).dump(object)
+    dumpfile.write(_MAGIC)
+    dumpfile.write(struct.pack("<Q", graph.getbuffer().nbytes))
+    dumpfile.write(graph.getbuffer())
+    table = []
+    for buf in buffers:
+        raw = buf.raw()
+        offset = dumpfile.tell()
+        padding = -offset % _ALIGN
+        dumpfile.write(b"\0" * padding)
+        table.append((offset + padding, raw.nbytes))
+        dumpfile.write(raw)
+    table = dill.dumps(table)
+    dumpfile.write(table)
+    dumpfile.write(struct.pack("<Q", len(table)))
+
+
+def _readoutofband(dumpfile, filename, mmap=True):
+    """Reads object from open dump file with out-of-band buffers.
+
+    Parameters
+    ----------
+    dumpfile : file
+        File opened for binary reading positioned behind magic bytes
+    filename : str
+        Path to file
+    mmap : boolean, optional, default : True
+        If True, buffers are memory-mapped
+
+    Returns
+    -------
+    obj : object
+        object read from dump file"""
+    n = struct.unpack("<Q", dumpfile.read(8))[0]
+    graph = dumpfile.read(n)
+    table = _readtable(dumpfile)
+    if mmap and len(table) > 0:
+        data = np.memmap(filename, dtype=np.uint8, mode="c")
+        buffers = [data[offset:offset+nbytes] for offset, nbytes in table]
+    else:
+        buffers = []
+        for offset, nbytes in table:
+            dumpfile.seek(offset)
+            buffers.append(bytearray(dumpfile.read(nbytes)))
+    return dill.loads(graph, buffers=buffers)
+
+
+def _readtable(dumpfile):
+    """Reads the buffer table of a dump file with out-of-band buffers.
+
+    Parameters
+    ----------
+    dumpfile : file
+        File opened for binary reading
+
+    Returns
+    -------
+    table : list
+        List of tuples with offsets and lengths of the buffers in bytes"""
+    dumpfile.seek(-8, os.SEEK_END)
+    n = struct.unpack("<Q", dumpfile.read(8))[0]
+    dumpfile.seek(-8-n, os.SEEK_END)
+    return dill.loads(dumpfile.read(n))
@@ -0,0 +1,149 @@
+from collections import OrderedDict
+import numpy as np
+
+
+class LazySequence(object):
+    """Array-like proxy for the sequence of a field that reads the data only on access.
+
+    ``LazySequence`` objects are returned by ``Reader.all(lazy=True)``. The first axis is the output number.
+    Shape and data type are taken from the first output. Indexing reads only the selected outputs and only the
+    selected part of the field with ``Reader._readitem()``. Recently read parts are cached.
+
+    Notes
+    -----
+    The first element of the index always selects the outputs. All remaining elements are applied to the field of
+    every selected output. The cache is keyed by output and index of the field. It holds at most ``cachesize``
+    parts. Returned values are copies of the cached parts. ``np.asarray()`` reads the entire sequence."""
+
+    __name__ = "LazySequence"
+
+    def __init__(self, reader, outputs, field, shape, dtype, cachesize=16):
+        """Parameters
+        ----------
+        reader : Reader
+            Reader that reads the data
+        outputs : list
+            Filenames or numbers of the outputs
+        field : str
+            Location of the field
+        shape : tuple
+            Shape of the field in a single output
+        dtype : data type
+            Data type of the field
+        cachesize : int, optional, default : 16
+            Maximum number of cached parts. If 0, nothing is cached"""
+        if not isinstance(cachesize, int):
+            raise TypeError("<cachesize> has to be of type int.")
+        if cachesize < 0:
+            raise ValueError("<cachesize> must not be negative.")
+        self._reader = reader
+        self._outputs = list(outputs)
+        self._field = field
+        self._shape = (len(self._outputs),) + tuple(shape)
+        self._dtype = np.dtype(dtype)
+        self._cachesize = cachesize
+        self._cache = OrderedDict()
+
+    def __str__(self):
+        return "{} ({})".format(self.__name__, self._field)
+
+    def __repr__(self):
+        return "{}(shape={}, dtype={})".format(self.__str__(), self.shape, self.dtype)
+
+    def __len__(self):
+        return self._shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        ret = self[:]
+        return ret if dtype is None else ret.astype(dtype)
+
+    @property
+    def dtype(self):
+        '''Data type of the field in the first output.'''
+        return self._dtype
+
+    @property
+    def field(self):
+        '''Location of the field.'''
+        return self._field
+
+    @property
+    def ndim(self):
+        '''Number of dimensions including the output axis.'''
+        return len(self._shape)
+
+    @property
+    def shape(self):
+        '''Shape of the sequence including the output axis.'''
+        return self._shape
+
+    @property
+    def size(self):
+        '''Number of elements of the sequence.'''
+        return int(np.prod(self._shape))
+
+    def clear(self):
+        """Removes all cached parts."""
+        self._cache.clear()
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        if key == () or key[0] is Ellipsis:
+            select, index = slice(None), key
+        else:
+            select, index = key[0], key[1:]
+        js = np.arange(len(self))[select]
+        scalar = np.ndim(js) == 0
+        js = np.atleast_1d(js)
+        ckey = _cachekey(index)
+
+        values = {}
+        missing = []
+        for j in js.tolist():
+            if (j, ckey) in self._cache:
+                self._cache.move_to_end((j, ckey))
+                values[j] = self._cache[(j, ckey)]
+            elif j not in missing:
+                missing.append(j)
+        outputs = [self._outputs[j] for j in missing]
+        for j, val in zip(missing, self._reader._map(self._reader._readitem, outputs, self._field, index)):
+            values[j] = val
+            if self._cachesize > 0:
+                self._cache[(j, ckey)] = val
+                if len(self._cache) > self._cachesize:
+                    self._cache.popitem(last=False)
+
+        # Cached parts are never returned themselves
+        if scalar:
+            return np.array(values[int(js[0])])
+        if js.size == 0:
+            shape = np.empty(self._shape[1:], dtype=self._dtype)[index].shape
+            return np.empty((0,) + shape, dtype=self._dtype)
+        return np.array([values[j] for j in js.tolist()])
+
+
+def _cachekey(index):
+    """Converts an index into a hashable key.
+
+    Parameters
+    ----------
+    index : tuple
+        Index of a part of the field
+
+    Returns
+    -------
+    key : tuple
+        Hashable key that is equal for equal indices"""
+    ret = []
+    for idx in index:
+        if isinstance(idx, slice):
+            ret.append(("slice", idx.start, idx.stop, idx.step))
+        elif isinstance(idx, (bool, np.bool_)):
+            ret.append(("bool", bool(idx)))
+        elif idx is None or idx is Ellipsis or isinstance(idx, (int, np.integer)):
+            ret.append(idx if idx is None or idx is Ellipsis else int(idx))
+        else:
+            # Arrays are compared by their content
+            arr = np.asarray(idx)
+            ret.append(("array", arr.dtype.str, arr.shape, arr.tobytes()))
+    return tuple(ret)
@@ -1,7 +1,15 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
 import glob
+import json
+import numpy as np
 import os
+import re
 
 from simframe.frame.abstractgroup import AbstractGroup
+from simframe.io.lazysequence import LazySequence
 from simframe.utils.simplenamespace import SimpleNamespace
 
 
@@ -18,7 +26,9 @@ class Reader(object):
 
     __name__ = "Reader"
 
-    def __init__(self, writer, description=""):
+    _manifestcache = None
+
+    def __init__(self, writer, description="", workers=1, executor="thread"):
         """General ``Reader`` class
 
         Parameters
@@ -26,8 +36,16 @@ class Reader(object):
         writer : Writer
             The writer object to which the reader belongs
         description : str, optional, default = ""
-            Descriptive string of reader."""
+            Descriptive string of reader.
+        workers : int, optional, default : 1
+            Number of files that are read concurrently. If 1, files are read one after another
+        executor : str, optional, default : "thread"
+            Pool that reads the files concurrently, "thread" or "process". Only used if workers is larger than 1.
+            Threads only help if the reading functions release the GIL. h5py holds a global lock for all calls,
+            so HDF5 files should be read with processes"""
         self.description = description
+        self.workers = workers
+        self.executor = executor
         self._writer = writer
 
     @property
@@ -41,6 +59,32 @@ class Reader(object):
             raise ValueError("<value> has to be of type str.")
         self._description = value
 
+    @property
+    def executor(self):
+        '''Pool that reads files concurrently. Either "thread" or "process".'''
+        return self._executor
+
+    @executor.setter
+    def executor(self, value):
+        if not isinstance(value, str):
+            raise TypeError("<executor> has to be of type str.")
+        if value not in ["thread", "process"]:
+            raise ValueError("<executor> has to be \"thread\" or \"process\".")
+        self._executor = value
+
+    @property
+    def workers(self):
+        '''Number of files that are read concurrently.'''
+        return self._workers
+
+    @workers.setter
+    def workers(self, value):
+        if not isinstance(value, int):
+            raise TypeError("<workers> has to be of type int.")
+        if value < 1:
+            raise ValueError("<workers> has to be positive.")
+        self._workers = value
+
     def __str__(self):
         return AbstractGroup.__str__(self)
 
@@ -61,13 +105,17 @@ class Reader(object):
             Data set of a single output file."""
         raise NotImplementedError("<read.output> is not implemented.")
 
-    def sequence(self, field):
+    def sequence(self, field, snapshots=None, index=None):
         """Function that returns the entire sequence of a specific field.
 
         Parameters
         ----------
         field : str
             String with location of requested field
+        snapshots : int, slice, list, or None, optional, default : None
+            Outputs to be read. If None, all outputs are read
+        index : int, slice, tuple, or None, optional, default : None
+            Index of the requested part of the field. If None, the entire field is read
 
         Returns
         -------
@@ -77,7 +125,9 @@ class Reader(object):
         Notes
         -----
         ``field`` is addressing the values just as in the parent frame object.
-        E.g. ``"groupA.groupB.fieldC"`` is addressing ``Frame.groupA.groupB.fieldC``."""
+        E.g. ``"groupA.groupB.fieldC"`` is addressing ``Frame.groupA.groupB.fieldC``.
+        ``snapshots`` indexes the list of outputs, e.g., ``slice(0, None, 10)`` reads every tenth output.
+        The returned array always has the output axis as first axis."""
         raise NotImplementedError("<read.sequence> is not implemented.")
 
     def listfiles(self):
@@ -86,23 +136,78 @@ class Reader(object):
         Returns
         -------
         files : list
-            List of strings of all found data files sorted alphanumerically.
+            List of strings of all found data files sorted by output number.
 
         Notes
         -----
-        Function only searches for files that match the pattern specified by the ``Writer``'s
-        ``filename`` and ``extension`` attributes."""
+        Function only lists files that match the pattern specified by the ``Writer``'s
+        ``filename`` and ``extension`` attributes. If the data directory contains a manifest, the files
+        are taken from the manifest without searching the data directory. Only the file of the last entry
+        and the file of the next output number are checked. If the file of the last entry is missing or the
+        next output exists, e.g., written with ``Writer.manifest`` set to False, the manifest is stale.
+        Then, or if there is no manifest, the data directory is searched and the files are sorted by the
+        numbers in their names."""
         datadir = self._writer.datadir
         ext = self._writer.extension if self._writer.extension != "" else "." + \
             self._writer.extension
-        wildcard = os.path.join(datadir, self._writer.filename + "*" + ext)
-        files = glob.glob(wildcard)
-        files = sorted(files, key=str.casefold)
-        return files
+        pattern = self._writer.filename + "*" + ext
+        entries = [entry for entry in self.manifest() if fnmatch(entry["file"], pattern)]
+        if entries != []:
+            files = [os.path.join(datadir, entry["file"]) for entry in entries]
+            nextfile = self._writer._getfilename(entries[-1]["output"] + 1)
+            if os.path.exists(files[-1]) and not os.path.exists(nextfile):
+                return files
+        wildcard = os.path.join(datadir, pattern)
+        manifestname = str(self._writer._getmanifestname())
+        files = [f for f in glob.glob(wildcard) if f != manifestname]
+        return sorted(files, key=_naturalkey)
+
+    def manifest(self):
+        """Method that reads the manifest of the data directory.
+
+        Returns
+        -------
+        entries : list
+            List of dictionaries with the keys ``output``, ``file``, ``x``, ``time``, and ``fields``
+            sorted by output number. Empty if there is no manifest.
+
+        Notes
+        -----
+        If an output was written several times, only the last entry is returned. Incomplete lines,
+        e.g., from an interrupted simulation, are ignored. The manifest is only parsed again if its
+        size or modification time changed."""
+        filename = self._writer._getmanifestname()
+        try:
+            stat = os.stat(filename)
+        except FileNotFoundError:
+            return []
+        key = (str(filename), stat.st_size, stat.st_mtime_ns)
+        if self._manifestcache is not None and self._manifestcache[0] == key:
+            return [entry.copy() for entry in self._manifestcache[1]]
+        entries = {}
+        with open(filename, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                entries[entry["output"]] = entry
+        entries = [entries[i] for i in sorted(entries)]
+        self._manifestcache = (key, entries)
+        return [entry.copy() for entry in entries]
 
-    def all(self):
+    def all(self, lazy=False, cachesize=16, snapshots=None):
         """Functions that reads all output files and combines them into a single ``SimpleNamespace``.
 
+        Parameters
+        ----------
+        lazy : boolean, optional, default : False
+            If True, the fields are not read but returned as ``LazySequence`` that reads the data on access
+        cachesize : int, optional, default : 16
+            Number of parts every ``LazySequence`` keeps in its cache. Only used if lazy is True
+        snapshots : int, slice, list, or None, optional, default : None
+            Outputs to be read. If None, all outputs are read
+
         Returns
         -------
         dataset : SimpleNamespace
@@ -115,24 +220,203 @@ class Reader(object):
         files = self.listfiles()
         if files == []:
             raise RuntimeError("Data directory does not exist or is empty.")
+        selected = _select(files, snapshots)
         # Read first file to get structure
-        data0 = self.output(files[0])
-        return self._expand(data0)
+        data0 = self.output(selected[0])
+        if lazy:
+            return self._expandlazy(data0, selected, cachesize)
+        return self._expand(data0, snapshots=snapshots)
+
+    def _readitem(self, output, field, index=()):
+        """Reads a part of a field from a single output.
 
-    def _expand(self, ns, prefix=""):
+        Parameters
+        ----------
+        output : str or int
+            Filename or number of output
+        field : str
+            String with location of requested field
+        index : tuple, optional, default : ()
+            Index of the requested part of the field
+
+        Returns
+        -------
+        data : array
+            Requested part of the field
+
+        Notes
+        -----
+        This reads the entire output. Customized ``Reader`` should read only the requested part."""
+        data = self.output(output)
+        for key in field.split("."):
+            data = data.__dict__[key]
+        return np.asarray(data)[index]
+
+    def _map(self, func, files, *args):
+        """Calls a function for every file and yields the results in the order of the files.
+
+        Parameters
+        ----------
+        func : callable
+            Function that is called with the filename and args. Has to be picklable for process pools
+        files : list
+            List of filenames
+        args : additional positional arguments
+
+        Returns
+        -------
+        results : generator
+            Results of the function calls in the order of the files
+
+        Notes
+        -----
+        If ``Reader.workers`` is larger than 1, the files are read concurrently. If reading fails, the exception
+        of the first failing file in the order of the files is raised, independent of the order in which the
+        files were read. The name of the file is added to the exception as note."""
+        if self.workers == 1 or len(files) < 2:
+            for f in files:
+                try:
+                    ret = func(f, *args)
+                except Exception as e:
+                    _addnote(e, f)
+                    raise
+                yield ret
+            return
+        Executor = ThreadPoolExecutor if self.executor == "thread" else ProcessPoolExecutor
+        # Files are read at most twice as many ahead as there are workers
+        ahead = 2*self.workers
+        with Executor(max_workers=self.workers) as pool:
+            pending = deque((f, pool.submit(func, f, *args)) for f in files[:ahead])
+            try:
+                for j in range(len(files)):
+                    f, future = pending.popleft()
+                    try:
+                        ret = future.result()
+                    except Exception as e:
+                        _addnote(e, f)
+                        raise
+                    if j + ahead < len(files):
+                        pending.append(
+                            (files[j+ahead], pool.submit(func, files[j+ahead], *args)))
+                    # Results are released as soon as they are passed on
+                    del future
+                    yield ret
+            finally:
+                for f, future in pending:
+                    future.cancel()
+
+    def _expand(self, ns, prefix="", snapshots=None):
         """This is a function that get recursively called to fill a data structure with sequences.
 
         Parameters
         ----------
         ns : SimpleNamespace
             Name space to read sequences from
+        prefix : string, optional default: ""
+            prefix of data to get into depth of the structure
+        snapshots : int, slice, list, or None, optional, default : None
+            Outputs to be read. If None, all outputs are read"""
+        ret = {}
+        for key, val in ns.__dict__.items():
+            new_prefix = ".".join(filter(None, [prefix, key]))
+            if isinstance(val, SimpleNamespace):
+                ret[key] = self._expand(
+                    val, prefix=new_prefix, snapshots=snapshots)
+            elif snapshots is None:
+                # Customized readers might not support the selection of outputs
+                ret[key] = self.sequence(new_prefix)
+            else:
+                ret[key] = self.sequence(new_prefix, snapshots=snapshots)
+        return SimpleNamespace(**ret)
+
+    def _expandlazy(self, ns, outputs, cachesize, prefix=""):
+        """This is a function that get recursively called to fill a data structure with ``LazySequence`` objects.
+
+        Parameters
+        ----------
+        ns : SimpleNamespace
+            Name space of the first output
+        outputs : list
+            Filenames or numbers of the outputs
+        cachesize : int
+            Cache size of the ``LazySequence`` objects
         prefix : string, optional default: ""
             prefix of data to get into depth of the structure"""
         ret = {}
         for key, val in ns.__dict__.items():
             new_prefix = ".".join(filter(None, [prefix, key]))
             if isinstance(val, SimpleNamespace):
-                ret[key] = self._expand(val, prefix=new_prefix)
+                ret[key] = self._expandlazy(
+                    val, outputs, cachesize, prefix=new_prefix)
             else:
-                ret[key] = self.sequence(new_prefix)
+                val = np.asarray(val)
+                ret[key] = LazySequence(
+                    self, outputs, new_prefix, val.shape, val.dtype, cachesize=cachesize)
         return SimpleNamespace(**ret)
+
+
+def _naturalkey(filename):
+    """Returns a key for sorting filenames by the numbers they contain.
+
+    Parameters
+    ----------
+    filename : str
+        Filename
+
+    Returns
+    -------
+    key : list
+        List of strings and integers"""
+    return [int(t) if t.isdigit() else t.casefold() for t in re.split(r"(\d+)", filename)]
+
+
+def _select(outputs, snapshots):
+    """Selects outputs.
+
+    Parameters
+    ----------
+    outputs : list
+        Filenames or numbers of all outputs
+    snapshots : int, slice, list, or None
+        Index of the outputs to be selected. If None, all outputs are selected
+
+    Returns
+    -------
+    selected : list
+        Selected outputs"""
+    if snapshots is None:
+        return list(outputs)
+    selected = np.atleast_1d(np.arange(len(outputs))[snapshots])
+    if selected.size == 0:
+        raise RuntimeError("No outputs selected.")
+    return [outputs[j] for j in selected.tolist()]
+
+
+def _index(index):
+    """Converts an index expression into a tuple.
+
+    Parameters
+    ----------
+    index : int, slice, tuple, or None
+        Index expression. None selects the entire field
+
+    Returns
+    -------
+    index : tuple
+        Index as tuple"""
+    if index is None:
+        return ()
+    return index if isinstance(index, tuple) else (index,)
+
+
+def _addnote(e, filename):
+    """Adds the name of the file that could not be read to an exception.
+
+    Parameters
+    ----------
+    e : Exception
+        Exception that was raised while reading the file
+    filename : str
+        Name of the file"""
+    if hasattr(e, "add_note"):
+        e.add_note("Error while reading file {}.".format(filename))
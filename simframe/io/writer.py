@@ -1,8 +1,13 @@
+import json
+import os
 from pathlib import Path
+import time
 
+from simframe.io.checkpoint import Checkpoint
 from simframe.io.reader import Reader
 from simframe.io.dump import writedump
 from simframe.frame.abstractgroup import AbstractGroup
+from simframe.frame.field import Field
 from simframe.utils.color import colorize
 
 
@@ -12,7 +17,7 @@ class Writer(object):
     __name__ = "Writer"
 
     def __init__(self, func, datadir="data", filename="data", zfill=4, extension="out", overwrite=False, dumping=True,
-                 reader=None, verbosity=1, description="", options={}):
+                 checkpoint=None, reader=None, verbosity=1, description="", options={}, manifest=True):
         """Parameters
         ----------
         func : callable
@@ -28,13 +33,18 @@ class Writer(object):
         overwrite : boolean, optional, default : False
             If existing files should be overwritten
         dumping : boolean, optional, default : True
-            If True dump files will be written
+            If True dump files will be written with the outputs. Dump files requested with the file ``DUMP``
+            in the data directory are written regardless
+        checkpoint : Checkpoint, optional, default : None
+            Policy that controls how often dump files are written. If None, a dump file is written with every output
         reader : Reader, optional, default : None
             reader to read files
         verbosity : int, optional, default : 1
             Verbosity of writer
         options : dict, optional, default : {}
-            Optional keyword arguments that need to be passed to writing algorithm"""
+            Optional keyword arguments that need to be passed to writing algorithm
+        manifest : boolean, optional, default : True
+            If True, every output is recorded in the manifest file ``<filename>.manifest.jsonl`` in the data directory"""
         self._func = func
         self.datadir = datadir
         self.filename = filename
@@ -42,11 +52,27 @@ class Writer(object):
         self.extension = extension
         self.overwrite = overwrite
         self.dumping = dumping
+        self.checkpoint = checkpoint
         self.description = description
         self.options = options
         self.verbosity = verbosity
+        self.manifest = manifest
         self.read = reader(self) if reader is not None else None
 
+    @property
+    def checkpoint(self):
+        '''``Checkpoint`` policy that controls how often dump files are written.'''
+        return self._checkpoint
+
+    @checkpoint.setter
+    def checkpoint(self, value):
+        if value is None:
+            self._checkpoint = Checkpoint()
+        else:
+            if not isinstance(value, Checkpoint):
+                raise TypeError("<checkpoint> has to be of type Checkpoint or None.")
+            self._checkpoint = value
+
     @property
     def datadir(self):
         '''Data directory of output files.'''
@@ -93,6 +119,20 @@ class Writer(object):
             raise ValueError("filename cannot be empty.")
         self._filename = value
 
+    @property
+    def manifest(self):
+        '''If ``True`` every output is recorded in the manifest file of the data directory.'''
+        return self._manifest
+
+    @manifest.setter
+    def manifest(self, value):
+        if not isinstance(value, int):
+            raise TypeError("<manifest> has to be of type bool.")
+        if value:
+            self._manifest = True
+        else:
+            self._manifest = False
+
     @property
     def options(self):
         '''Dictionary of keyword arguments passed to customized writing routine.'''
@@ -132,7 +172,7 @@ class Writer(object):
 
     @property
     def dumping(self):
-        '''If ``True`` dump files will be written.'''
+        '''If ``True`` dump files will be written with the outputs.'''
         return self._dumping
 
     @dumping.setter
@@ -204,6 +244,14 @@ class Writer(object):
             self.overwrite, "yellow") if not self.overwrite else self.overwrite}\n"""
         ret += f"""    Dumping        : {
             colorize(self.dumping, "yellow") if not self.dumping else self.dumping}\n"""
+        ret += f"""    Manifest       : {self.manifest}\n"""
+        due = []
+        if self.checkpoint.every is not None:
+            due.append(f"every {self.checkpoint.every} outputs")
+        if self.checkpoint.interval is not None:
+            due.append(f"every {self.checkpoint.interval} s")
+        due = " or ".join(due) if due else "every output"
+        ret += f"""    Checkpoint     : {due}, keep {self.checkpoint.keep}\n"""
         ret += f"""    Options        : {self.options}\n"""
         ret += f"""    Verbosity      : {self.verbosity}"""
         return ret
@@ -232,6 +280,48 @@ class Writer(object):
 
         return self.datadir.joinpath(filename)
 
+    def _getmanifestname(self):
+        """This function returns the path to the manifest file.
+
+        Returns
+        -------
+        filename : Path
+            Path to manifest file
+
+        Notes
+        -----
+        The manifest is named after ``Writer.filename``. Writers with different filenames
+        can therefore share a data directory."""
+        return self.datadir.joinpath(self.filename + ".manifest.jsonl")
+
+    def _appendmanifest(self, owner, i, filename):
+        """Appends an output to the manifest file.
+
+        Parameters
+        ----------
+        owner : Frame
+            Parent ``Frame`` object
+        i : int
+            Number of output
+        filename : Path
+            Path to the output file
+
+        Notes
+        -----
+        Every line of the manifest is a JSON object with the number of the output, the name of the file, the value
+        of the integration variable, the wall time, and the shapes and data types of all saved fields."""
+        integrator = getattr(owner, "integrator", None)
+        x = getattr(integrator, "var", None)
+        entry = {
+            "output": int(i),
+            "file": Path(filename).name,
+            "x": float(x) if x is not None else None,
+            "time": time.time(),
+            "fields": _fieldinfo(owner),
+        }
+        with open(self._getmanifestname(), "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
     def writedump(self, frame, filename=None):
         """Writes the ``Frame`` to dump file
 
@@ -241,17 +331,50 @@ class Writer(object):
             object to be written to file
         filename : str, optional, default : ""
             path to file to be written
-            if not set, filename will be <writer.datadir>/frame.dmp."""
+            if not set, filename will be <writer.datadir>/frame.dmp.
 
-        filename = self.datadir.joinpath(
-            "frame.dmp") if filename is None else Path(filename)
+        Notes
+        -----
+        If no filename is given, the ``Writer`` keeps ``Checkpoint.keep`` rotating dump files."""
+
+        if filename is None:
+            filename = self.datadir.joinpath("frame.dmp")
+            rotate = True
+        else:
+            filename = Path(filename)
+            rotate = False
         self.checkdatadir(createdir=True)
 
         if self.verbosity > 0:
             msg = f"Writing dump file {colorize(filename, 'blue')}"
             print(msg)
 
-        writedump(frame, filename)
+        if rotate:
+            self._rotatedumps(filename)
+        writedump(frame, filename, outofband=self.checkpoint.outofband)
+
+    def _rotatedumps(self, filename):
+        """This function renames existing dump files to make room for a new one.
+
+        Parameters
+        ----------
+        filename : Path
+            Path to the most recent dump file"""
+        keep = self.checkpoint.keep
+        for j in range(keep-1, 0, -1):
+            src = filename if j == 1 else Path(f"{filename}.{j-1}")
+            if src.exists():
+                os.replace(src, f"{filename}.{j}")
+
+    def _dumpifdue(self, owner):
+        """Writes a dump file if dumping is enabled and the ``Checkpoint`` policy says it is due.
+
+        Parameters
+        ----------
+        owner : Frame
+            Parent ``Frame`` object"""
+        if self.dumping and self.checkpoint.due():
+            self.writedump(owner)
 
     def write(self, owner, i, forceoverwrite, filename=None):
         """Writes output to file
@@ -267,7 +390,8 @@ class Writer(object):
         filename : string
             If this is not "" the writer will use this filename instead of the standard scheme"""
 
-        if filename is None:
+        standard = filename is None
+        if standard:
             filename = self._getfilename(i)
         else:
             filename = Path(filename)
@@ -281,5 +405,34 @@ class Writer(object):
             msg = f"Writing file {colorize(filename, 'blue')}"
             print(msg)
         self._func(owner, filename, **self.options)
-        if self.dumping:
-            self.writedump(owner)
+        # Only outputs of the standard scheme are recorded
+        if self.manifest and standard:
+            self._appendmanifest(owner, i, filename)
+        self._dumpifdue(owner)
+
+
+def _fieldinfo(grp, prefix=""):
+    """Returns the shapes and data types of all saved fields. Function is called recursively.
+
+    Parameters
+    ----------
+    grp : Group
+        Group whose fields are collected
+    prefix : str, optional, default : ""
+        Location of the group within the ``Frame``
+
+    Returns
+    -------
+    info : dict
+        Dictionary with the locations of the fields as keys and dictionaries with shape and data type as values"""
+    ret = {}
+    for key, val in grp.__dict__.items():
+        if key.startswith("_"):
+            continue
+        name = ".".join(filter(None, [prefix, key]))
+        if isinstance(val, Field):
+            if val.save:
+                ret[name] = {"shape": list(val.shape), "dtype": val.dtype.str}
+        elif isinstance(val, AbstractGroup):
+            ret.update(_fieldinfo(val, prefix=name))
+    return ret
@@ -1,9 +1,17 @@
 """This package contains pre-defined ``Writer`` instances that can be used for writing and reading ``Frame`` objects.
-The ``hdf5writer`` writes data files in the HDF5 file format. The ``namespacewriter`` does not write output files
-(except for dump files if required). The data is stored locally in the ``Writer`` object itself."""
+The ``hdf5writer`` writes data files in the HDF5 file format. The ``hdf5serieswriter`` writes all outputs into a
+single HDF5 file. The ``binarywriter`` writes raw binary files for fast output of scratch data. The
+``zarrwriter`` writes chunked directory stores with the layout of Zarr. The ``namespacewriter`` does not write
+output files (except for dump files if required). The data is stored locally in the ``Writer`` object itself."""
 
+from simframe.io.writers.binarywriter import binarywriter
+from simframe.io.writers.hdf5serieswriter import hdf5serieswriter
 from simframe.io.writers.hdf5writer import hdf5writer
 from simframe.io.writers.namespacewriter import namespacewriter
+from simframe.io.writers.zarrwriter import zarrwriter
 
-__all__ = ["hdf5writer",
-           "namespacewriter"]
+__all__ = ["binarywriter",
+           "hdf5serieswriter",
+           "hdf5writer",
+           "namespacewriter",
+           "zarrwriter"]
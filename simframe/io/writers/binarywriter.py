@@ -0,0 +1,336 @@
+import json
+import numpy as np
+import os
+
+from simframe.io.reader import Reader
+from simframe.io.reader import _index
+from simframe.io.reader import _select
+from simframe.io.writer import Writer
+from simframe.io.writers.collect import _collect
+from simframe.io.writers.collect import _decodeindex
+from simframe.frame.field import _view
+from simframe.utils.simplenamespace import SimpleNamespace
+
+
+# Identifier at the beginning of every file
+_MAGIC = b"SIMFRAME"
+# Alignment of the header and of the data blocks in bytes
+_ALIGNMENT = 64
+
+
+class binarywriter(Writer):
+    """Class for writing raw binary output files.
+
+    Every output is written into a single flat file. The file starts with an identifier, the length of the header,
+    and a JSON header with the offsets, shapes, and data types of all values. The data blocks follow aligned to
+    64 bytes. Strings are stored in the header. The description of the frame is stored in the header under its
+    own key and is not part of the data.
+
+    Notes
+    -----
+    The files are not portable. They are meant for fast writing of scratch data. The reader returns memory-mapped
+    views into the files without copying the data. Fields that are views of other fields are stored in the header
+    with the location of their parent, the index, and the shape of the view."""
+
+    def __init__(self, *args, **kwargs):
+        filename = kwargs.pop("filename", "data")
+        extension = kwargs.pop("extension", "bin")
+        description = kwargs.pop(
+            "description", "Raw binary file format with JSON header")
+        super().__init__(
+            _binarywrapper,
+            filename=filename,
+            extension=extension,
+            description=description,
+            reader=binaryreader,
+            *args, **kwargs
+        )
+
+
+def _binarywrapper(obj, filename, stats=False):
+    """Wrapper to write object to binary file.
+
+    Parameters
+    ----------
+    obj : object
+        the object to be stored in a file
+    filename : string
+        path to file
+
+    Keywords
+    --------
+    stats : boolean
+        If True, the statistics of the integrator are written into the group `integrator`
+    """
+    values, views, _ = _collect(obj, ".", "Binary files", "binarywriter", stats=stats)
+    items = []
+    strings = {}
+    for name, val in values:
+        arr = np.asarray(val)
+        if arr.dtype.kind in "US":
+            strings[name] = arr.tolist()
+        elif arr.dtype.hasobject:
+            raise ValueError(
+                "Binary files cannot store objects in {}.".format(name))
+        else:
+            items.append((name, np.ascontiguousarray(arr).reshape(arr.shape)))
+
+    # Offsets relative to the beginning of the data section
+    fields = {}
+    offset = 0
+    for name, val in items:
+        offset = _align(offset)
+        fields[name] = {"offset": offset,
+                        "shape": list(val.shape), "dtype": val.dtype.str}
+        offset += val.nbytes
+    header = {"fields": fields, "strings": strings, "views": dict(views)}
+    if getattr(obj, "_description", None) is not None:
+        header["description"] = obj._description
+    header = json.dumps(header).encode()
+    start = _align(len(_MAGIC) + 8 + len(header))
+
+    with open(filename, "wb") as f:
+        f.write(_MAGIC)
+        f.write(np.uint64(len(header)).tobytes())
+        f.write(header)
+        position = len(_MAGIC) + 8 + len(header)
+        for name, val in items:
+            pos = start + fields[name]["offset"]
+            f.write(b"\0" * (pos - position))
+            f.write(val.reshape(-1).view(np.uint8))
+            position = pos + val.nbytes
+
+
+def _align(offset):
+    """Returns the next aligned offset.
+
+    Parameters
+    ----------
+    offset : int
+        Offset in bytes
+
+    Returns
+    -------
+    offset : int
+        Smallest multiple of the alignment that is not smaller than offset"""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _readheader(filename):
+    """Reads the header of a binary file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to file
+
+    Returns
+    -------
+    header : dict
+        Header with the fields, the strings, the views, and the description
+    start : int
+        Position of the data section in bytes"""
+    with open(filename, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise RuntimeError("{} is not a binary simframe file.".format(filename))
+        length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+        header = json.loads(f.read(length).decode())
+    return header, _align(len(_MAGIC) + 8 + length)
+
+
+def _mapfield(mm, spec, start):
+    """Returns a view of a field into a memory-mapped binary file.
+
+    Parameters
+    ----------
+    mm : memmap
+        Memory-mapped file with data type uint8
+    spec : dict
+        Offset, shape, and data type of the field
+    start : int
+        Position of the data section in bytes
+
+    Returns
+    -------
+    data : memmap
+        Read-only view of the field"""
+    dtype = np.dtype(spec["dtype"])
+    shape = tuple(spec["shape"])
+    offset = start + spec["offset"]
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    return mm[offset:offset+nbytes].view(dtype).reshape(shape)
+
+
+def _mapview(parent, spec):
+    """Returns a view of a field into the memory-mapped data of its parent.
+
+    Parameters
+    ----------
+    parent : memmap
+        Memory-mapped data of the parent
+    spec : dict
+        Location of the parent, index, and shape of the view
+
+    Returns
+    -------
+    data : memmap
+        Read-only view of the field"""
+    shape = None if spec["shape"] is None else tuple(spec["shape"])
+    return _view(parent, _decodeindex(spec["index"]), shape)
+
+
+def _readbinaryfield(filename, field, index=()):
+    """Reads a part of a field from a binary file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to file
+    field : str
+        Location of the field
+    index : tuple, optional, default : ()
+        Index of the requested part of the field
+
+    Returns
+    -------
+    data : array
+        Copy of the requested part"""
+    header, start = _readheader(filename)
+    if field in header["strings"]:
+        return np.array(np.asarray(header["strings"][field])[index])
+    views = header.get("views", {})
+    if field not in header["fields"] and field not in views:
+        raise KeyError("Requested <field> {} does not exist.".format(field))
+    mm = np.memmap(filename, dtype=np.uint8, mode="r")
+    if field in views:
+        spec = views[field]
+        data = _mapview(_mapfield(mm, header["fields"][spec["parent"]], start), spec)
+    else:
+        data = _mapfield(mm, header["fields"][field], start)
+    return np.array(np.asarray(data)[index])
+
+
+class binaryreader(Reader):
+    """Reader class for the binary writer."""
+
+    def __init__(self, writer):
+        """Binary reader
+
+        Parameters
+        ----------
+        writer : Writer
+            Writer object to which the reader belongs."""
+        super().__init__(writer)
+
+    def output(self, output):
+        """Reads a single output file.
+
+        Parameters
+        ----------
+        output : str or int
+            Path to filename to be read or number of output
+
+        Returns
+        -------
+        data : SimpleNamespace
+            Namespace of data in file. Numerical values are read-only memory-mapped views into the file."""
+
+        if not isinstance(output, str):
+            output = self._writer._getfilename(output)
+
+        if not os.path.isfile(output):
+            raise RuntimeError("File does not exist.")
+
+        header, start = _readheader(output)
+        mm = np.memmap(output, dtype=np.uint8, mode="r")
+        values = {name: _mapfield(mm, spec, start)
+                  for name, spec in header["fields"].items()}
+        for name, spec in header.get("views", {}).items():
+            values[name] = _mapview(values[spec["parent"]], spec)
+        values.update(header["strings"])
+        return _nest(values)
+
+    def sequence(self, field, snapshots=None, index=None):
+        """Reading the entire sequence of a specific field.
+
+        Parameters
+        ----------
+        field : string
+            String with location of requested field
+        snapshots : int, slice, list, or None, optional, default : None
+            Outputs to be read. If None, all outputs are read
+        index : int, slice, tuple, or None, optional, default : None
+            Index of the requested part of the field. If None, the entire field is read
+
+        Returns
+        -------
+        seq : array
+            Array with requested values
+
+        Notes
+        -----
+        ``field`` is addressing the values just as in the parent frame object.
+        E.g. ``"groupA.groupB.fieldC"`` is addressing ``Frame.groupA.groupB.fieldC``."""
+        files = self.listfiles()
+        if files == []:
+            raise RuntimeError("<datadir> does not exist or is empty.")
+        if not isinstance(field, str):
+            raise TypeError("<field> has to be of type string.")
+        files = _select(files, snapshots)
+        ret = list(self._map(_readbinaryfield, files, field, _index(index)))
+        return np.array(ret)
+
+    def _readitem(self, output, field, index=()):
+        """Reads a part of a field from a single output file.
+
+        Parameters
+        ----------
+        output : str
+            Path to file
+        field : str
+            String with location of requested field
+        index : tuple, optional, default : ()
+            Index of the requested part of the field
+
+        Returns
+        -------
+        data : array
+            Requested part of the field"""
+        return _readbinaryfield(output, field, index)
+
+
+def _nest(values):
+    """Converts a flat dictionary with locations as keys into a nested namespace.
+
+    Parameters
+    ----------
+    values : dict
+        Values by their locations, e.g., "groupA.fieldB"
+
+    Returns
+    -------
+    data : SimpleNamespace
+        Nested namespace"""
+    ret = {}
+    for name, val in values.items():
+        d = ret
+        keys = name.split(".")
+        for key in keys[:-1]:
+            d = d.setdefault(key, {})
+        d[keys[-1]] = val
+    return _tonamespace(ret)
+
+
+def _tonamespace(d):
+    """Converts nested dictionaries into nested namespaces. Function is called recursively.
+
+    Parameters
+    ----------
+    d : dict
+        Nested dictionaries
+
+    Returns
+    -------
+    data : SimpleNamespace
+        Nested namespace"""
+    return SimpleNamespace(**{key: _tonamespace(val) if isinstance(val, dict) else val for key, val in d.items()})
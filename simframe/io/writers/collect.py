@@ -0,0 +1,160 @@
+"""Helper functions shared by the writers that collect the values of a ``Frame`` before writing them."""
+
+import numbers
+import numpy as np
+
+from simframe.frame.field import Field
+
+
+def _collect(obj, sep, fmt, writer, stats=False):
+    """Collects the values of an object that are written to file.
+
+    By default all attributes of the object are collected, excluding the ones that start with an underscore.
+    Fields with attribute Field.save == False will be skipped. Fields that are views of other fields are not
+    collected as values, but as the location of their parent, the index, and the shape of the view. If the parent
+    is not written, the view is collected as value with its own data.
+
+    Parameters
+    ----------
+    obj : object
+        the object to be stored in a file
+    sep : str
+        Separator of the locations of the groups and their members, e.g., "/" or "."
+    fmt : str
+        Name of the file format used in error messages, e.g., "HDF5"
+    writer : str
+        Name of the writer used in error messages
+    stats : boolean, optional, default : False
+        If True, the statistics of the integrator are collected into the group `integrator`
+
+    Returns
+    -------
+    values : list
+        List of tuples of location and value. Values are numbers, strings, arrays, tuples, or lists
+    views : list
+        List of tuples of location and dictionary with the location of the parent, the encoded index, and the
+        shape of the view
+    groups : list
+        Locations of all groups"""
+    values = []
+    views = []
+    groups = []
+    paths = {}
+    pending = []
+    _traverse(obj, "", sep, fmt, writer, values, groups, paths, pending)
+    for name, val in pending:
+        parent, index, shape = val._viewof
+        if id(parent) not in paths:
+            values.append((name, val))
+            continue
+        views.append((name, {"parent": paths[id(parent)],
+                             "index": _encodeindex(index),
+                             "shape": None if shape is None else list(shape)}))
+    if stats and getattr(obj, "integrator", None) is not None:
+        groups.append("integrator")
+        _traverse(obj.integrator.stats, "integrator" + sep, sep, fmt, writer, values, groups, {}, [])
+    return values, views, groups
+
+
+def _traverse(obj, prefix, sep, fmt, writer, values, groups, paths, pending):
+    """Goes through the object tree. Function is called recursively.
+
+    Parameters
+    ----------
+    obj : object
+        the object to be stored in a file
+    prefix : str
+        a prefix prepended to the name of each attribute
+    sep : str
+        Separator of the locations of the groups and their members
+    fmt : str
+        Name of the file format used in error messages
+    writer : str
+        Name of the writer used in error messages
+    values : list
+        List to which tuples of location and value are appended
+    groups : list
+        List to which the locations of the groups are appended
+    paths : dict
+        Locations of the collected fields by their ids
+    pending : list
+        List to which tuples of location and field are appended for fields that are views"""
+    for key, val in obj.__dict__.items():
+
+        # Ignore hidden variables
+        if key.startswith('_'):
+            continue
+        # Skip fields that should not be stored
+        if isinstance(val, Field) and val.save == False:
+            continue
+
+        name = prefix + key
+
+        # Views are resolved after their parents are known
+        if isinstance(val, Field):
+            if val.viewof is not None:
+                pending.append((name, val))
+                continue
+            paths[id(val)] = name
+
+        if isinstance(val, (numbers.Number, np.number, np.ndarray, tuple, list, str)):
+            if type(val) in [tuple, list] and None in val:
+                raise ValueError("{} cannot store None values.".format(fmt))
+            values.append((name, val))
+        # Dicts not implemented, yet
+        elif type(val) == dict:
+            raise NotImplementedError(
+                "Storing dict not yet implemented in {}.".format(writer))
+        # Check for None
+        elif val is None:
+            raise ValueError("{} cannot store None values.".format(fmt))
+        # Other objects
+        else:
+            groups.append(name)
+            _traverse(val, name + sep, sep, fmt, writer, values, groups, paths, pending)
+
+
+def _encodeindex(index):
+    """Converts a normalized index into a JSON compatible list.
+
+    Parameters
+    ----------
+    index : tuple
+        Normalized index
+
+    Returns
+    -------
+    index : list
+        Encoded index"""
+    ret = []
+    for idx in index:
+        if isinstance(idx, slice):
+            ret.append([idx.start, idx.stop, idx.step])
+        elif idx is Ellipsis:
+            ret.append("...")
+        else:
+            ret.append(idx)
+    return ret
+
+
+def _decodeindex(index):
+    """Converts an encoded index back into a tuple.
+
+    Parameters
+    ----------
+    index : list
+        Encoded index
+
+    Returns
+    -------
+    index : tuple
+        Normalized index"""
+    ret = []
+    for idx in index:
+        if isinstance(idx, list):
+            ret.append(slice(*idx))
+        elif idx == "...":
+            ret.append(Ellipsis)
+        else:
+            ret.append(idx)
+    return tuple(ret)
@@ -0,0 +1,449 @@
+import h5py
+import json
+import numpy as np
+import os
+from pathlib import Path
+
+from simframe.io.reader import Reader
+from simframe.io.reader import _index
+from simframe.io.writer import Writer
+from simframe.io.writers.collect import _collect
+from simframe.io.writers.collect import _decodeindex
+from simframe.frame.field import _view
+from simframe.utils.color import colorize
+from simframe.utils.simplenamespace import SimpleNamespace
+
+
+class hdf5serieswriter(Writer):
+    """Class for writing all outputs into a single HDF5 file.
+
+    Every value is stored in a chunked data set with the output number along the first axis. The data sets are
+    extended with every output. The value of the integration variable of every output is stored in the data set
+    ``_intvar``. The data set ``_written`` marks the outputs that were written. Outputs that were not written are
+    skipped when reading.
+
+    Notes
+    -----
+    The shapes and data types of the values must not change between outputs. Fields that are views of other
+    fields are stored as empty data sets with the location of the parent, the index, and the shape of the view
+    as attribute ``view``."""
+
+    def __init__(self, *args, **kwargs):
+        filename = kwargs.pop("filename", "data")
+        extension = kwargs.pop("extension", "hdf5")
+        description = kwargs.pop(
+            "description", "Single HDF5 file with all outputs using h5py")
+        options = kwargs.pop("options", {"com": "lzf", "comopts": None})
+        super().__init__(
+            _hdf5serieswrapper,
+            filename=filename,
+            extension=extension,
+            description=description,
+            options=options,
+            reader=hdf5seriesreader,
+            *args, **kwargs
+        )
+
+    def _getfilename(self, i=None):
+        """This function creates ``<path>/<filename>`` of the data file.
+
+        Parameters
+        ----------
+        i : integer, optional, default : None
+            Not used in this class, since all outputs are written into the same file
+
+        Returns
+        -------
+        filename : str
+            The constructed filename"""
+        ext = self.extension
+        if ext != "":
+            ext = "." + ext
+        return self.datadir.joinpath(self.filename + ext)
+
+    def write(self, owner, i, forceoverwrite, filename=None):
+        """Writes output into the data file
+
+        Parameters
+        ----------
+        owner : Frame
+            Parent ``Frame`` object
+        i : int
+            Number of output
+        forceoverwrite : boolean
+            If ``True`` it will overwrite the output if it already exists independent of the writer attribute
+        filename : string
+            If this is not None the writer will use this filename instead of the standard scheme"""
+        if filename is None:
+            filename = self._getfilename()
+        else:
+            filename = Path(filename)
+        self.checkdatadir(createdir=True)
+        if self.verbosity > 0:
+            msg = f"Writing output {i} to file {colorize(filename, 'blue')}"
+            print(msg)
+        self._func(owner, filename, i, overwrite=(forceoverwrite or self.overwrite),
+                   **self.options)
+        self._dumpifdue(owner)
+
+
+def _hdf5serieswrapper(obj, filename, i, overwrite=False, com="lzf", comopts=None, stats=False):
+    """Wrapper to append an object to the HDF5 file.
+
+    Parameters
+    ----------
+    obj : object
+        the object to be stored in a file
+    filename : string
+        path to file
+    i : int
+        Number of output
+
+    Keywords
+    --------
+    overwrite : boolean
+        If True, an existing output with the same number is overwritten
+    com : string
+        compression method to be used by `h5py`
+    comopt : compression_opts
+        compression options, see `h5py.File`'s `create_dataset` for details
+    stats : boolean
+        If True, the statistics of the integrator are written into the group `integrator`
+    """
+    values, views, _ = _collect(obj, "/", "HDF5", "hdf5serieswriter", stats=stats)
+    items = []
+    for name, val in values:
+        val = np.asarray(val)
+        if val.dtype.kind in "USO":
+            val = np.array(val.tolist(), dtype=h5py.string_dtype())
+        items.append((name, val))
+    integrator = getattr(obj, "integrator", None)
+    x = getattr(integrator, "var", None)
+    x = np.nan if x is None else float(x)
+
+    with h5py.File(filename, "a") as hdf5file:
+        if getattr(obj, "_description", None) is not None:
+            hdf5file.attrs["description"] = obj._description
+        if "_intvar" not in hdf5file:
+            hdf5file.create_dataset("_intvar", shape=(0,), maxshape=(None,), dtype=np.float64,
+                                    chunks=(1024,), fillvalue=np.nan)
+        intvar = hdf5file["_intvar"]
+        N = intvar.shape[0]
+        if "_written" not in hdf5file:
+            hdf5file.create_dataset("_written", data=_written(hdf5file), maxshape=(None,), dtype=np.bool_,
+                                    chunks=(1024,), fillvalue=False)
+        written = hdf5file["_written"]
+        if i < N and written[i] and not overwrite:
+            raise RuntimeError(
+                f"Output {i} already exists in file {str(filename)}.")
+        N = max(N, i+1)
+        intvar.resize((N,))
+        written.resize((N,))
+        for name, val in items:
+            if name in hdf5file:
+                ds = hdf5file[name]
+                if ds.shape[1:] != val.shape:
+                    raise ValueError(
+                        f"Shape of {name} changed from {ds.shape[1:]} to {val.shape}.")
+            else:
+                ds = hdf5file.create_dataset(
+                    name,
+                    shape=(0,) + val.shape,
+                    maxshape=(None,) + val.shape,
+                    dtype=val.dtype,
+                    chunks=_chunks(val),
+                    compression=com,
+                    compression_opts=comopts
+                )
+            ds.resize(N, axis=0)
+            ds[i] = val
+        for name, spec in views:
+            if name not in hdf5file:
+                ds = hdf5file.create_dataset(name, data=h5py.Empty("f8"))
+                ds.attrs["view"] = json.dumps(spec)
+        intvar[i] = x
+        written[i] = True
+
+
+def _chunks(val):
+    """Returns the chunk shape of a data set.
+
+    Chunks hold about 64 KiB. Small values are combined into chunks of complete outputs along the output axis.
+    Values larger than that are split along their own axes, such that reading a part of a field for all outputs
+    does not decompress complete outputs.
+
+    Parameters
+    ----------
+    val : array
+        Value of a single output
+
+    Returns
+    -------
+    chunks : tuple
+        Chunk shape"""
+    target = 65536
+    itemsize = 16 if val.dtype.kind == "O" else val.dtype.itemsize
+    nbytes = max(val.size, 1) * itemsize
+    if nbytes <= target:
+        return (target // nbytes,) + val.shape
+    chunks = list(val.shape)
+    while np.prod(chunks) * itemsize > target:
+        j = int(np.argmax(chunks))
+        chunks[j] = (chunks[j] + 1) // 2
+    return (1,) + tuple(chunks)
+
+
+class hdf5seriesreader(Reader):
+    """Reader class for the HDF5 series writer."""
+
+    def __init__(self, writer):
+        """HDF5 series reader
+
+        Parameters
+        ----------
+        writer : Writer
+            Writer object to which the reader belongs."""
+        super().__init__(writer)
+
+    def listfiles(self):
+        """Method to list the data file
+
+        Returns
+        -------
+        files : list
+            List with the path of the data file if it exists"""
+        filename = str(self._writer._getfilename())
+        return [filename] if os.path.isfile(filename) else []
+
+    def output(self, output):
+        """Reads a single output.
+
+        Parameters
+        ----------
+        output : int
+            Number of output
+
+        Returns
+        -------
+        data : SimpleNamespace
+            Namespace of data of the output."""
+        files = self.listfiles()
+        if files == []:
+            raise RuntimeError("File does not exist.")
+        with h5py.File(files[0], "r") as hdf5file:
+            written = _written(hdf5file)
+            if output >= written.shape[0] or not written[output]:
+                raise RuntimeError("Output {} does not exist.".format(output))
+            return self._readgroup(hdf5file, np.s_[output])
+
+    def sequence(self, field, snapshots=None, index=None):
+        """Reading the entire sequence of a specific field.
+
+        Parameters
+        ----------
+        field : string
+            String with location of requested field
+        snapshots : int, slice, list, or None, optional, default : None
+            Outputs to be read. If None, all outputs are read
+        index : int, slice, tuple, or None, optional, default : None
+            Index of the requested part of the field. If None, the entire field is read
+
+        Returns
+        -------
+        seq : array
+            Array with requested values
+
+        Notes
+        -----
+        ``field`` is addressing the values just as in the parent frame object.
+        E.g. ``"groupA.groupB.fieldC"`` is addressing ``Frame.groupA.groupB.fieldC``.
+        The sequence is read with a single read of the data set."""
+        files = self.listfiles()
+        if files == []:
+            raise RuntimeError("<datadir> does not exist or is empty.")
+        if not isinstance(field, str):
+            raise TypeError("<field> has to be of type string.")
+        loc = field.replace(".", "/")
+        with h5py.File(files[0], "r") as hdf5file:
+            ds = hdf5file[loc]
+            return _readrows(ds, _rows(_written(hdf5file), snapshots), _index(index))
+
+    def all(self, lazy=False, cachesize=16, snapshots=None):
+        """Functions that reads all outputs into a single ``SimpleNamespace``.
+
+        Parameters
+        ----------
+        lazy : boolean, optional, default : False
+            If True, the fields are not read but returned as ``LazySequence`` that reads the data on access
+        cachesize : int, optional, default : 16
+            Number of parts every ``LazySequence`` keeps in its cache. Only used if lazy is True
+        snapshots : int, slice, list, or None, optional, default : None
+            Outputs to be read. If None, all outputs are read
+
+        Returns
+        -------
+        dataset : SimpleNamespace
+            Namespace of data set.
+
+        Notes
+        -----
+        The data file is opened only once."""
+        files = self.listfiles()
+        if files == []:
+            raise RuntimeError("Data directory does not exist or is empty.")
+        with h5py.File(files[0], "r") as hdf5file:
+            written = _written(hdf5file)
+            rows = _rows(written, snapshots)
+            if lazy:
+                selected = np.arange(written.shape[0])[rows].tolist()
+                return self._expandlazy(self._readgroup(hdf5file, selected[0]), selected, cachesize)
+            return self._readgroup(hdf5file, rows)
+
+    def _readitem(self, output, field, index=()):
+        """Reads a part of a field from a single output.
+
+        Parameters
+        ----------
+        output : int
+            Number of output
+        field : str
+            String with location of requested field
+        index : tuple, optional, default : ()
+            Index of the requested part of the field
+
+        Returns
+        -------
+        data : array
+            Requested part of the field"""
+        with h5py.File(self.listfiles()[0], "r") as hdf5file:
+            ds = hdf5file[field.replace(".", "/")]
+            if "view" in ds.attrs:
+                return np.asarray(_readrows(ds, [output], ()))[(0,) + tuple(index)]
+            try:
+                return ds[(output,) + tuple(index)]
+            except (TypeError, ValueError):
+                # Indices that are not supported by h5py, e.g., negative steps
+                return np.asarray(ds[output])[index]
+
+    def _readgroup(self, gr, rows):
+        """Helper function that is iteratively called to get the depth of the data set.
+
+        Parameters
+        ----------
+        gr : Group of type h5py._hl.group.Group
+            The h5py group to be read
+        rows : int, slice, or list
+            Number of a single output or selection of outputs as returned by ``_rows()``
+
+        Returns
+        -------
+        data : SimpleNamespace
+            Namespace of data"""
+        ret = {}
+        for ds in gr.keys():
+            if ds.startswith("_"):
+                continue
+            if isinstance(gr[ds], h5py._hl.group.Group):
+                ret[ds] = self._readgroup(gr[ds], rows)
+            elif isinstance(rows, int):
+                ret[ds] = _readrows(gr[ds], [rows], ())[0] if "view" in gr[ds].attrs else gr[ds][rows]
+            else:
+                ret[ds] = _readrows(gr[ds], rows, ())
+        return SimpleNamespace(**ret)
+
+
+def _written(hdf5file):
+    """Returns which outputs of the data file were written.
+
+    Parameters
+    ----------
+    hdf5file : File of type h5py._hl.files.File
+        The h5py data file
+
+    Returns
+    -------
+    written : array
+        Boolean array that is True for every written output
+
+    Notes
+    -----
+    Files without the data set ``_written`` contain ``NaN`` in ``_intvar`` for outputs that were not written."""
+    if "_written" in hdf5file:
+        return hdf5file["_written"][()].astype(bool)
+    return ~np.isnan(hdf5file["_intvar"][()])
+
+
+def _rows(written, snapshots):
+    """Converts a selection of outputs into an index along the output axis.
+
+    Parameters
+    ----------
+    written : array
+        Boolean array that is True for every written output
+    snapshots : int, slice, list, or None
+        Selection of outputs. If None, all outputs are selected
+
+    Returns
+    -------
+    rows : slice or list
+        Slice if the selection is equally spaced in increasing order, list otherwise
+
+    Notes
+    -----
+    Outputs that were not written are removed from the selection."""
+    if snapshots is None and np.all(written):
+        return slice(None)
+    rows = np.arange(written.shape[0])
+    if snapshots is not None:
+        rows = np.atleast_1d(rows[snapshots])
+    rows = rows[written[rows]]
+    if rows.size == 0:
+        raise RuntimeError("No outputs selected.")
+    if rows.size == 1:
+        return slice(int(rows[0]), int(rows[0])+1)
+    steps = np.diff(rows)
+    if steps[0] > 0 and np.all(steps == steps[0]):
+        return slice(int(rows[0]), int(rows[-1])+1, int(steps[0]))
+    return rows.tolist()
+
+
+def _readrows(ds, rows, index):
+    """Reads a selection of outputs from a data set. Slices are read with a single hyperslab.
+
+    Parameters
+    ----------
+    ds : Dataset of type h5py._hl.dataset.Dataset
+        The h5py data set to be read
+    rows : slice or list
+        Selection of outputs as returned by ``_rows()``
+    index : tuple
+        Index of the requested part of the field
+
+    Returns
+    -------
+    data : array
+        Requested data with the output axis as first axis
+
+    Notes
+    -----
+    Views are read from their parents."""
+    if "view" in ds.attrs:
+        spec = json.loads(ds.attrs["view"])
+        shape = None if spec["shape"] is None else tuple(spec["shape"])
+        index_view = _decodeindex(spec["index"])
+        parent = _readrows(ds.file[spec["parent"]], rows, ())
+        data = np.array([_view(row, index_view, shape) for row in parent])
+        return data[(slice(None),) + index]
+    if isinstance(rows, slice):
+        try:
+            return ds[(rows,) + index]
+        except (TypeError, ValueError):
+            # Indices that are not supported by h5py, e.g., negative steps
+            return np.asarray(ds[rows])[(slice(None),) + index]
+    # h5py requires increasing indices without duplicates
+    unique, inverse = np.unique(rows, return_inverse=True)
+    try:
+        data = ds[(unique.tolist(),) + index]
+    except (TypeError, ValueError):
+        data = np.array([np.asarray(ds[row])[index] for row in unique.tolist()])
+    return data[inverse]
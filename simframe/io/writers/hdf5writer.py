@@ -1,17 +1,30 @@
 import glob
 import h5py
+import json
 import numbers
 import numpy as np
 import os
 
 from simframe.io.reader import Reader
+from simframe.io.reader import _index
+from simframe.io.reader import _select
 from simframe.io.writer import Writer
+from simframe.io.writers.collect import _decodeindex
+from simframe.io.writers.collect import _encodeindex
 from simframe.frame.field import Field
+from simframe.frame.field import _view
 from simframe.utils.simplenamespace import SimpleNamespace
 
 
 class hdf5writer(Writer):
-    """Class for writing HDF5 output files."""
+    """Class for writing HDF5 output files.
+
+    Notes
+    -----
+    Besides "com" and "comopts", ``hdf5writer.options`` can contain "shuffle", "chunks", "threshold", and
+    "fieldopts". Data sets smaller than "threshold" bytes are stored contiguously without compression.
+    "fieldopts" overrides the storage options of individual fields, e.g.,
+    ``{"groupA.fieldB": {"com": "gzip", "comopts": 4, "shuffle": True, "chunks": (100,)}, "fieldC": {"com": None}}``."""
 
     def __init__(self, *args, **kwargs):
         filename = kwargs.pop("filename", "data")
@@ -29,7 +42,8 @@ class hdf5writer(Writer):
         )
 
 
-def _hdf5wrapper(obj, filename, com="lzf", comopts=None):
+def _hdf5wrapper(obj, filename, com="lzf", comopts=None, stats=False, shuffle=False, chunks=None, threshold=0,
+                 fieldopts=None):
     """Wrapper to write object to HDF5 file.
 
     This function recursively calls a another functions thats goes through the object tree.
@@ -47,13 +61,35 @@ def _hdf5wrapper(obj, filename, com="lzf", comopts=None):
         compression method to be used by `h5py`
     comopt : compression_opts
         compression options, see `h5py.File`'s `create_dataset` for details
+    stats : boolean
+        If True, the statistics of the integrator are written into the group `integrator`
+    shuffle : boolean
+        If True, the shuffle filter is applied before compression
+    chunks : tuple, True, or None
+        chunk shape of compressed data sets. If None, `h5py` chooses the chunk shape
+    threshold : int
+        data sets with less bytes are stored contiguously without compression
+    fieldopts : dict or None
+        options for individual fields with their locations, e.g., "groupA.fieldB", as keys and dictionaries with
+        the keys "com", "comopts", "shuffle", and "chunks" as values. These override the global options and the
+        threshold. "com" set to None stores the field uncompressed
     """
 
+    policy = {"shuffle": shuffle, "chunks": chunks,
+              "threshold": threshold, "fieldopts": fieldopts}
     with h5py.File(filename, "w") as hdf5file:
-        _writehdf5(obj, hdf5file, com=com, comopts=comopts)
-
-
-def _writehdf5(obj, file, com="lzf", comopts=None, prefix=""):
+        paths = {}
+        views = []
+        _writehdf5(obj, hdf5file, com=com, comopts=comopts,
+                   paths=paths, views=views, policy=policy)
+        _writeviews(hdf5file, paths, views, com=com,
+                    comopts=comopts, policy=policy)
+        if stats and getattr(obj, "integrator", None) is not None:
+            _writehdf5(obj.integrator.stats, hdf5file,
+                       com=com, comopts=comopts, prefix="integrator/", policy=policy)
+
+
+def _writehdf5(obj, file, com="lzf", comopts=None, prefix="", paths=None, views=None, policy=None):
     """Writes a given object to a h5py file.
 
     By default all attributes of the object are written out, excluding the ones that start with an underscore.
@@ -74,6 +110,12 @@ def _writehdf5(obj, file, com="lzf", comopts=None, prefix=""):
         compression options, see `h5py.File`'s `create_dataset` for details
     prefix : str
         a prefix prepended to the name of each attribute when storing with h5py
+    paths : dict or None
+        if not None, the locations of the written fields are stored in this dictionary by their ids
+    views : list or None
+        if not None, fields that are views of other fields are not written but appended to this list
+    policy : dict or None
+        shuffle, chunks, threshold, and options of individual fields, see `_compression()`
     """
 
     if hasattr(obj, "_description") and obj._description is not None and prefix == "":
@@ -93,6 +135,13 @@ def _writehdf5(obj, file, com="lzf", comopts=None, prefix=""):
 
         name = prefix + key
 
+        # Views are written after their parents are known
+        if isinstance(val, Field) and views is not None:
+            if val.viewof is not None:
+                views.append((name, val))
+                continue
+            paths[id(val)] = name
+
         # Check if numpy.ndarray of strings and convert to list
         if isinstance(val, np.ndarray) and val.dtype.type is np.str_:
             val = val.tolist()
@@ -113,14 +162,12 @@ def _writehdf5(obj, file, com="lzf", comopts=None, prefix=""):
                     name,
                     data=np.array(val, dtype=object),
                     dtype=h5py.special_dtype(vlen=str),
-                    compression=com,
-                    compression_opts=comopts)
+                    **_compression(name, val, com, comopts, policy))
             else:
                 file.create_dataset(
                     name,
                     data=val,
-                    compression=com,
-                    compression_opts=comopts
+                    **_compression(name, val, com, comopts, policy)
                 )
         # Check for string
         elif type(val) is str:
@@ -139,8 +186,7 @@ def _writehdf5(obj, file, com="lzf", comopts=None, prefix=""):
                 file.create_dataset(
                     name,
                     data=val,
-                    compression=com,
-                    compression_opts=comopts
+                    **_compression(name, val, com, comopts, policy)
                 )
         # Dicts not implemented, yet
         elif type(val) == dict:
@@ -152,7 +198,112 @@ def _writehdf5(obj, file, com="lzf", comopts=None, prefix=""):
         # Other objects
         else:
             _writehdf5(val, file, com=com,
-                       comopts=comopts, prefix=name + "/")
+                       comopts=comopts, prefix=name + "/", paths=paths, views=views, policy=policy)
+
+
+def _writeviews(file, paths, views, com="lzf", comopts=None, policy=None):
+    """Writes fields that are views of other fields.
+
+    If the parent was written to the file, only an empty data set with the location of the parent,
+    the index, and the shape of the view as attribute ``view`` is written. Otherwise the data is written.
+
+    Parameters
+    ----------
+    file : hdf5 file
+        open hdf5 file object
+    paths : dict
+        Locations of the written fields by their ids
+    views : list
+        List of tuples with the location and the view
+
+    Keywords
+    --------
+    com : string
+        compression method to be used by `h5py`
+    comopt : compression_opts
+        compression options, see `h5py.File`'s `create_dataset` for details
+    policy : dict or None
+        shuffle, chunks, threshold, and options of individual fields, see `_compression()`
+    """
+    for name, val in views:
+        parent, index, shape = val._viewof
+        if id(parent) not in paths:
+            if val.shape == ():
+                file.create_dataset(name, data=val)
+            else:
+                file.create_dataset(name, data=val,
+                                    **_compression(name, val, com, comopts, policy))
+            continue
+        ds = file.create_dataset(name, data=h5py.Empty("f8"))
+        ds.attrs["view"] = json.dumps({"parent": paths[id(parent)],
+                                       "index": _encodeindex(index),
+                                       "shape": shape})
+
+
+def _compression(name, val, com, comopts, policy=None):
+    """Returns the storage options of a data set.
+
+    Parameters
+    ----------
+    name : str
+        Location of the data set within the file
+    val : object
+        Data to be written
+    com : string
+        compression method to be used by `h5py`
+    comopts : compression_opts
+        compression options, see `h5py.File`'s `create_dataset` for details
+    policy : dict or None
+        Dictionary with the keys "shuffle", "chunks", "threshold", and "fieldopts"
+
+    Returns
+    -------
+    kwargs : dict
+        Keyword arguments for `create_dataset`. Empty if the data set is stored contiguously without compression"""
+    policy = {} if policy is None else policy
+    shuffle = policy.get("shuffle", False)
+    chunks = policy.get("chunks", None)
+    threshold = policy.get("threshold", 0)
+    fieldopts = policy.get("fieldopts", None) or {}
+    field = name.replace("/", ".")
+    if field in fieldopts:
+        opts = fieldopts[field]
+        unknown = set(opts) - {"com", "comopts", "shuffle", "chunks"}
+        if unknown:
+            raise ValueError("Unknown options {} for field {}.".format(
+                sorted(unknown), field))
+        com = opts.get("com", com)
+        comopts = opts.get("comopts", comopts)
+        shuffle = opts.get("shuffle", shuffle)
+        chunks = opts.get("chunks", chunks)
+    elif np.asarray(val).nbytes < threshold:
+        return {}
+    if com is None:
+        return {}
+    ret = {"compression": com, "compression_opts": comopts}
+    if shuffle:
+        ret["shuffle"] = True
+    if chunks is not None:
+        ret["chunks"] = chunks
+    return ret
+
+
+def _readdataset(ds):
+    """Reads a data set. Views are read from their parents.
+
+    Parameters
+    ----------
+    ds : Dataset of type h5py._hl.dataset.Dataset
+        The h5py data set to be read
+
+    Returns
+    -------
+    data : Data of the data set"""
+    if "view" not in ds.attrs:
+        return ds[()]
+    spec = json.loads(ds.attrs["view"])
+    shape = None if spec["shape"] is None else tuple(spec["shape"])
+    return _view(ds.file[spec["parent"]][()], _decodeindex(spec["index"]), shape)
 
 
 class hdf5reader(Reader):
@@ -164,8 +315,13 @@ class hdf5reader(Reader):
         Parameters
         ----------
         writer : Writer
-            Writer object to which the reaer belongs."""
-        super().__init__(writer)
+            Writer object to which the reaer belongs.
+
+        Notes
+        -----
+        h5py serializes all calls with a global lock. Files are therefore read
+        concurrently with processes by default if ``workers`` is larger than 1."""
+        super().__init__(writer, executor="process")
 
     def output(self, output):
         """Reads a single output file.
@@ -189,13 +345,17 @@ class hdf5reader(Reader):
         with h5py.File(output, "r") as hdf5file:
             return self._readgroup(hdf5file)
 
-    def sequence(self, field):
+    def sequence(self, field, snapshots=None, index=None):
         """Reading the entire sequence of a specific field.
 
         Parameters
         ----------
         field : string
             String with location of requested field
+        snapshots : int, slice, list, or None, optional, default : None
+            Outputs to be read. If None, all outputs are read
+        index : int, slice, tuple, or None, optional, default : None
+            Index of the requested part of the field. If None, the entire field is read
 
         Returns
         -------
@@ -205,20 +365,93 @@ class hdf5reader(Reader):
         Notes
         -----
         ``field`` is addressing the values just as in the parent frame object.
-        E.g. ``"groupA.groupB.fieldC"`` is addressing ``Frame.groupA.groupB.fieldC``."""
+        E.g. ``"groupA.groupB.fieldC"`` is addressing ``Frame.groupA.groupB.fieldC``.
+        Only the selected files are opened and only the requested part of the field is read from them.
+        Files are read concurrently if ``Reader.workers`` is larger than 1."""
         files = self.listfiles()
         if files == []:
             raise RuntimeError("<datadir> does not exist or is empty.")
         if not isinstance(field, str):
             raise TypeError("<field> has to be of type string.")
+        files = _select(files, snapshots)
         loc = field.replace(".", "/")
-        ret = []
-        for f in files:
-            with h5py.File(f, "r") as hdf5file:
-                A = np.array(hdf5file[loc][()])
-                ret.append(A)
+        ret = list(self._map(_readfield, files, loc, _index(index)))
         return np.array(ret)
 
+    def all(self, lazy=False, cachesize=16, snapshots=None):
+        """Functions that reads all output files and combines them into a single ``SimpleNamespace``.
+
+        Parameters
+        ----------
+        lazy : boolean, optional, default : False
+            If True, the fields are not read but returned as ``LazySequence`` that reads the data on access
+        cachesize : int, optional, default : 16
+            Number of parts every ``LazySequence`` keeps in its cache. Only used if lazy is True
+        snapshots : int, slice, list, or None, optional, default : None
+            Outputs to be read. If None, all outputs are read
+
+        Returns
+        -------
+        dataset : SimpleNamespace
+            Namespace of data set.
+
+        Notes
+        -----
+        Every output file is opened only once and all fields are read in one pass. Files are read
+        concurrently if ``Reader.workers`` is larger than 1. The structure of the data is taken from the
+        first output file. Numerical values are written into preallocated arrays.
+        Strings and values whose shape or data type changes between outputs are collected in lists and
+        converted to arrays at the end."""
+        files = self.listfiles()
+        if files == []:
+            raise RuntimeError("Data directory does not exist or is empty.")
+        files = _select(files, snapshots)
+        if lazy:
+            return self._expandlazy(self.output(files[0]), files, cachesize)
+        N = len(files)
+        columns = {}
+        # Read first file to get structure
+        with h5py.File(files[0], "r") as hdf5file:
+            data0 = self._readgroup(hdf5file)
+        for loc, val in _leaves(data0):
+            val = np.asarray(val)
+            if val.dtype.kind in "OSU":
+                columns[loc] = [val]
+            else:
+                columns[loc] = np.empty((N,)+val.shape, dtype=val.dtype)
+                columns[loc][0] = val
+        locs = list(columns.keys())
+        for j, values in enumerate(self._map(_readfields, files[1:], locs), start=1):
+            for loc, A in zip(locs, values):
+                col = columns[loc]
+                if isinstance(col, np.ndarray):
+                    if A.shape == col.shape[1:] and A.dtype == col.dtype:
+                        col[j] = A
+                        continue
+                    col = list(col[:j])
+                    columns[loc] = col
+                col.append(A)
+        return _stack(data0, columns)
+
+    def _readitem(self, output, field, index=()):
+        """Reads a part of a field from a single output file.
+
+        Parameters
+        ----------
+        output : str
+            Path to file
+        field : str
+            String with location of requested field
+        index : tuple, optional, default : ()
+            Index of the requested part of the field
+
+        Returns
+        -------
+        data : array
+            Requested part of the field"""
+        with h5py.File(output, "r") as hdf5file:
+            return _readpart(hdf5file[field.replace(".", "/")], index)
+
     def _readgroup(self, gr):
         """Helper function that is iteratively called to get the depth of the data set.
 
@@ -236,5 +469,118 @@ class hdf5reader(Reader):
             if isinstance(gr[ds], h5py._hl.group.Group):
                 ret[ds] = self._readgroup(gr[ds])
             else:
-                ret[ds] = gr[ds][()]
+                ret[ds] = _readdataset(gr[ds])
         return SimpleNamespace(**ret)
+
+
+def _readpart(ds, index):
+    """Reads a part of a data set. Only the requested part is read from file if possible.
+
+    Parameters
+    ----------
+    ds : Dataset of type h5py._hl.dataset.Dataset
+        The h5py data set to be read
+    index : tuple
+        Index of the requested part
+
+    Returns
+    -------
+    data : Requested part of the data set"""
+    if "view" in ds.attrs:
+        return np.asarray(_readdataset(ds))[index]
+    try:
+        return ds[index]
+    except (TypeError, ValueError):
+        # Indices that are not supported by h5py, e.g., negative steps
+        return np.asarray(ds[()])[index]
+
+
+def _readfield(filename, loc, index=()):
+    """Reads a single data set from a file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to file
+    loc : str
+        Location of the data set within the file
+    index : tuple, optional, default : ()
+        Index of the requested part of the data set
+
+    Returns
+    -------
+    data : array
+        Data of the data set"""
+    with h5py.File(filename, "r") as hdf5file:
+        return np.array(_readpart(hdf5file[loc], index))
+
+
+def _readfields(filename, locs):
+    """Reads several data sets from a file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to file
+    locs : list
+        Locations of the data sets within the file
+
+    Returns
+    -------
+    data : list
+        List with the data of the data sets"""
+    with h5py.File(filename, "r") as hdf5file:
+        return [np.asarray(_readdataset(hdf5file[loc])) for loc in locs]
+
+
+def _leaves(ns, prefix=""):
+    """Returns the locations and values of all data sets in a namespace. Function is called recursively.
+
+    Parameters
+    ----------
+    ns : SimpleNamespace
+        Namespace of a single output
+    prefix : str, optional, default : ""
+        Location of the namespace within the data file
+
+    Returns
+    -------
+    leaves : list
+        List of tuples with the location and the value of the data sets"""
+    ret = []
+    for key, val in ns.__dict__.items():
+        loc = "/".join(filter(None, [prefix, key]))
+        if isinstance(val, SimpleNamespace):
+            ret += _leaves(val, prefix=loc)
+        else:
+            ret.append((loc, val))
+    return ret
+
+
+def _stack(ns, columns, prefix=""):
+    """Builds a namespace with the same structure as a given namespace from sequences. Function is called
+    recursively.
+
+    Parameters
+    ----------
+    ns : SimpleNamespace
+        Namespace that defines the structure
+    columns : dict
+        Sequences of the data sets by their locations
+    prefix : str, optional, default : ""
+        Location of the namespace within the data file
+
+    Returns
+    -------
+    data : SimpleNamespace
+        Namespace with sequences"""
+    ret = {}
+    for key, val in ns.__dict__.items():
+        loc = "/".join(filter(None, [prefix, key]))
+        if isinstance(val, SimpleNamespace):
+            ret[key] = _stack(val, columns, prefix=loc)
+        else:
+            col = columns[loc]
+            # Preallocated columns are used without copying
+            ret[key] = np.asarray(col) if isinstance(col, np.ndarray) else np.array(col)
+    return SimpleNamespace(**ret)
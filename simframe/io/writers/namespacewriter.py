@@ -1,22 +1,29 @@
 from simframe.frame.field import Field
+from simframe.frame.field import _view
 from simframe.io.reader import Reader
+from simframe.io.reader import _index
 from simframe.io.writer import Writer
 from simframe.utils.color import colorize
 from simframe.utils.simplenamespace import SimpleNamespace
 
-from collections import deque
-import copy
+import bisect
 import numbers
 import numpy as np
 
 
 class namespacewriter(Writer):
-    """Class to write ``Frame`` object to namespace"""
+    """Class to write ``Frame`` object to namespace
+
+    Notes
+    -----
+    The data is stored in columns. Every field has a single array with the output number as first axis that grows
+    geometrically. Fields that are views of other fields are not stored, but are views into the columns of their
+    parents. If the shape of a field changes, its column falls back to a list of arrays."""
 
     def __init__(self, *args, **kwargs):
         super().__init__(_writeframetonamespace, dumping=False, description="Temporary namespace writer",
                          reader=namespacereader, *args, **kwargs)
-        self._buffer = deque([])
+        self.reset()
 
     def __repr__(self):
         ret = self.__str__()+"\n"
@@ -44,13 +51,13 @@ class namespacewriter(Writer):
             Not used in this class
         filename : string
             Not used in this class"""
-        self._buffer.append(self._func(owner))
+        tree, leaves, values = self._func(owner, **self.options)
+        self._append(tree, leaves, values)
         if self.verbosity > 0:
             num = str(i).zfill(self._zfill)
             msg = "Saving frame {}".format(num)
             print(msg)
-        if self.dumping:
-            self.writedump(owner)
+        self._dumpifdue(owner)
 
     def reset(self):
         """This resets the namespace.
@@ -58,7 +65,126 @@ class namespacewriter(Writer):
         Notes
         -----
         WARNING: This cannot be undone."""
-        self._buffer.clear()
+        # New objects are created. Sequences that were read before are not changed.
+        self._columns = {}
+        self._segments = []
+        self._starts = []
+        self._N = 0
+
+    def _append(self, tree, leaves, values):
+        """Appends a single output to the columns.
+
+        Parameters
+        ----------
+        tree : dict
+            Nested dictionaries with the structure of the output. Leaves are the locations of the values
+        leaves : dict
+            None for values with own column or tuple of parent location, index, and shape for views
+        values : dict
+            Values with own column by their locations
+
+        Notes
+        -----
+        Consecutive outputs with the same structure share a segment. Within a segment the row of an output in
+        a column is the output number minus the first output of the segment plus the offset of the column."""
+        if self._segments == [] or self._segments[-1]["leaves"] != leaves:
+            offsets = {loc: self._columns[loc].n if loc in self._columns else 0
+                       for loc, view in leaves.items() if view is None}
+            self._segments.append(
+                {"tree": tree, "leaves": leaves, "offsets": offsets})
+            self._starts.append(self._N)
+        for loc, val in values.items():
+            if loc not in self._columns:
+                self._columns[loc] = _Column()
+            self._columns[loc].append(val)
+        self._N += 1
+
+    def _locate(self, outputs):
+        """Returns the segment containing all requested outputs.
+
+        Parameters
+        ----------
+        outputs : range or array
+            Output numbers
+
+        Returns
+        -------
+        segment : dict or None
+            Segment or None if the outputs are not in a single segment
+        start : int
+            First output of the segment"""
+        lo = bisect.bisect_right(self._starts, int(np.min(outputs))) - 1
+        hi = bisect.bisect_right(self._starts, int(np.max(outputs))) - 1
+        if lo != hi:
+            return None, None
+        return self._segments[lo], self._starts[lo]
+
+
+class _Column(object):
+    """Array of the values of a single field in all outputs. The first axis is the row and grows geometrically."""
+
+    def __init__(self):
+        self.data = None
+        self.n = 0
+
+    def __getstate__(self):
+        # Unused rows are not pickled
+        data = self.data[:self.n] if isinstance(self.data, np.ndarray) else self.data
+        return {"data": data, "n": self.n}
+
+    def append(self, val):
+        """Appends a value as new row.
+
+        Parameters
+        ----------
+        val : array
+            Value to be appended. The value is copied"""
+        val = np.asarray(val)
+        if isinstance(self.data, list):
+            self.data.append(np.array(val))
+        elif self.data is None:
+            self.data = np.empty((4,) + val.shape, dtype=val.dtype)
+        elif val.shape != self.data.shape[1:] or not _promotable(self.data.dtype, val.dtype):
+            # Values with changing shape or incompatible data type are stored as list
+            self.data = [row for row in self.data[:self.n]]
+            self.data.append(np.array(val))
+        else:
+            dtype = np.result_type(self.data.dtype, val.dtype)
+            if dtype != self.data.dtype:
+                self.data = self.data.astype(dtype)
+            if self.n == len(self.data):
+                data = np.empty(
+                    (2*self.n,) + self.data.shape[1:], dtype=self.data.dtype)
+                data[:self.n] = self.data[:self.n]
+                self.data = data
+        if not isinstance(self.data, list):
+            self.data[self.n] = val
+        self.n += 1
+
+    def rows(self, rows):
+        """Returns the requested rows.
+
+        Parameters
+        ----------
+        rows : int, slice, or array
+            Rows to be returned
+
+        Returns
+        -------
+        data : array
+            Requested rows. Views into the column are read-only"""
+        if isinstance(self.data, list):
+            if isinstance(rows, numbers.Integral):
+                return self.data[rows]
+            return np.array([self.data[j] for j in np.arange(self.n)[rows]])
+        if isinstance(rows, numbers.Integral):
+            ret = self.data[rows, ...]
+        else:
+            ret = self.data[:self.n][rows]
+        if np.may_share_memory(ret, self.data):
+            ret = ret.view()
+            ret.flags.writeable = False
+        return ret
 
 
 class namespacereader(Reader):
@@ -67,9 +193,18 @@ class namespacereader(Reader):
     def __init__(self, writer):
         super().__init__(writer)
 
-    def all(self):
+    def all(self, lazy=False, cachesize=16, snapshots=None):
         """Functions that reads all output files and combines them into a single ``SimpleNamespace``.
 
+        Parameters
+        ----------
+        lazy : boolean, optional, default : False
+            If True, the fields are not read but returned as ``LazySequence`` that reads the data on access
+        cachesize : int, optional, default : 16
+            Number of parts every ``LazySequence`` keeps in its cache. Only used if lazy is True
+        snapshots : int, slice, list, or None, optional, default : None
+            Outputs to be read. If None, all outputs are read
+
         Returns
         -------
         dataset : SimpleNamespace
@@ -77,13 +212,17 @@ class namespacereader(Reader):
 
         Notes
         -----
-        This function is reading one output files to get the structure of the data and
-        calls ``read.sequence()`` for every field in the data structure."""
-        if self._writer._buffer == deque([]):
+        This function is reading one output to get the structure of the data and
+        calls ``read.sequence()`` for every field in the data structure. The sequences are
+        read-only views into the columns of the writer if possible."""
+        if self._writer._N == 0:
             raise RuntimeError("Writer buffer is empty.")
-        # Read first file to get structure
-        data0 = self._writer._buffer[0]
-        return self._expand(data0)
+        # Read first output to get structure
+        selected = _outputs(self._writer._N, snapshots)
+        data0 = self.output(int(selected[0]))
+        if lazy:
+            return self._expandlazy(data0, [int(i) for i in selected], cachesize)
+        return self._expand(data0, snapshots=snapshots)
 
     def output(self, i):
         """Reading a single output
@@ -96,19 +235,34 @@ class namespacereader(Reader):
         Returns
         -------
         n : SimpleNamespace
-            Namespace of desired output"""
-        if i >= len(self._writer._buffer):
+            Namespace of desired output. Values are read-only views into the columns of the writer"""
+        N = self._writer._N
+        if not -N <= i < N:
             raise RuntimeError("Output {} does not exist.".format(i))
-
-        return self._writer._buffer[i]
-
-    def sequence(self, field):
+        i %= N
+        segment, start = self._writer._locate(range(i, i+1))
+        values = {}
+        for loc, view in segment["leaves"].items():
+            if view is None:
+                values[loc] = self._writer._columns[loc].rows(
+                    segment["offsets"][loc] + i - start)
+        for loc, view in segment["leaves"].items():
+            if view is not None:
+                parent, index, shape = view
+                values[loc] = _view(values[parent], index, shape)
+        return _tonamespace(segment["tree"], values)
+
+    def sequence(self, field, snapshots=None, index=None):
         """Reading the entire sequence of a specific field.
 
         Parameters
         ----------
         field : string
             String with location of requested field
+        snapshots : int, slice, list, or None, optional, default : None
+            Outputs to be read. If None, all outputs are read
+        index : int, slice, tuple, or None, optional, default : None
+            Index of the requested part of the field. If None, the entire field is read
 
         Returns
         -------
@@ -118,62 +272,196 @@ class namespacereader(Reader):
         Notes
         -----
         ``field`` is addressing the values just as in the parent frame object.
-        E.g. ``"groupA.groupB.fieldC"`` is addressing ``Frame.groupA.groupB.fieldC``."""
-        if self._writer._buffer == deque([]):
+        E.g. ``"groupA.groupB.fieldC"`` is addressing ``Frame.groupA.groupB.fieldC``.
+        If the outputs are selected with a slice and the index is a basic index, a read-only
+        view into the column of the field is returned without copying."""
+        if self._writer._N == 0:
             raise RuntimeError("Writer buffer is empty.")
         if not isinstance(field, str):
             raise TypeError("<field> has to be string.")
-        loc = field.split(".")
-        N = len(self._writer._buffer)
-        ret = []
-        for i in range(N):
-            A = np.array(_getvaluefrombuffer(self._writer._buffer[i], loc))
-            ret.append(A)
-        return np.array(ret)
+        index = _index(index)
+        selected = _outputs(self._writer._N, snapshots)
+        segment, start = self._writer._locate(selected)
+        if segment is None:
+            # Outputs with different structure are read one by one
+            return np.array([self._readitem(int(i), field, index) for i in selected])
+        if field not in segment["leaves"]:
+            raise RuntimeError("Requested <field> does not exist.")
+        view = segment["leaves"][field]
+        if view is None:
+            loc = field
+        else:
+            loc = view[0]
+        rows = _shift(selected, segment["offsets"][loc] - start)
+        ret = self._writer._columns[loc].rows(rows)
+        if view is not None:
+            ret = _viewrows(ret, view[1], view[2])
+        return ret[(slice(None),) + index]
 
+    def _readitem(self, output, field, index=()):
+        """Reads a part of a field from a single output.
 
-def _getvaluefrombuffer(buf, loc):
-    """Returns a requested value from buffer.
-    Function is called recursively.
+        Parameters
+        ----------
+        output : int
+            Number of output
+        field : str
+            String with location of requested field
+        index : tuple, optional, default : ()
+            Index of the requested part of the field
+
+        Returns
+        -------
+        data : array
+            Copy of the requested part of the field"""
+        segment, start = self._writer._locate(range(output, output+1))
+        if field not in segment["leaves"]:
+            raise RuntimeError("Requested <field> does not exist.")
+        view = segment["leaves"][field]
+        loc = field if view is None else view[0]
+        data = self._writer._columns[loc].rows(
+            segment["offsets"][loc] + output - start)
+        if view is not None:
+            data = _view(data, view[1], view[2])
+        return np.array(np.asarray(data)[index])
+
+
+def _promotable(a, b):
+    """Checks if two data types have a common data type.
 
     Parameters
     ----------
-    buf : dict
-        Buffer object
-    loc : list
-        List of strings with the requested location within buf
+    a : data type
+        First data type
+    b : data type
+        Second data type
 
     Returns
     -------
-    ret : object
-        Reqested value in buf at position loc"""
-    if len(loc) > 1:
-        return _getvaluefrombuffer(buf.__dict__[loc[0]], loc[1:])
-    if not hasattr(buf, loc[0]):
-        raise RuntimeError("Requested <field> does not exist.")
-    return buf.__dict__[loc[0]]
+    promotable : boolean
+        True if the data types can be promoted to a common data type"""
+    try:
+        np.result_type(a, b)
+    except TypeError:
+        return False
+    # Strings and numbers would be promoted to strings
+    return (a.kind in "US") == (b.kind in "US")
 
 
-def _converttonamespace(o):
-    """Converts an object into a namespace
+def _outputs(N, snapshots):
+    """Selects outputs without creating a list if possible.
 
     Parameters
     ----------
-    o : object
-        object
+    N : int
+        Number of outputs
+    snapshots : int, slice, list, or None
+        Index of the outputs to be selected. If None, all outputs are selected
+
+    Returns
+    -------
+    selected : range or array
+        Selected output numbers"""
+    if snapshots is None:
+        selected = range(N)
+    elif isinstance(snapshots, slice):
+        selected = range(N)[snapshots]
+    else:
+        selected = np.atleast_1d(np.arange(N)[snapshots])
+    if len(selected) == 0:
+        raise RuntimeError("No outputs selected.")
+    return selected
+
+
+def _shift(selected, offset):
+    """Converts selected outputs into rows of a column.
+
+    Parameters
+    ----------
+    selected : range or array
+        Selected output numbers
+    offset : int
+        Offset that is added to the output numbers
+
+    Returns
+    -------
+    rows : slice or array
+        Rows of the column. Ranges are converted into slices"""
+    if isinstance(selected, range):
+        start = selected.start + offset
+        stop = selected[-1] + offset + selected.step
+        return slice(start, stop if stop >= 0 else None, selected.step)
+    return selected + offset
+
+
+def _viewrows(rows, index, shape):
+    """Applies a view to every row.
+
+    Parameters
+    ----------
+    rows : array
+        Rows of the parent column
+    index : tuple
+        Normalized index of the view
+    shape : tuple or None
+        Shape of the view
+
+    Returns
+    -------
+    seq : array
+        Sequence of the view"""
+    ret = rows[(slice(None),) + index]
+    if shape is not None:
+        ret = ret.reshape((len(ret),) + tuple(shape))
+    # Views with a single element are squeezed just as in ``_view()``
+    if ret[0].size == 1:
+        ret = ret.reshape(len(ret))
+    return ret
+
+
+def _tonamespace(tree, values):
+    """Converts the structure of an output into a namespace. Function is called recursively.
+
+    Parameters
+    ----------
+    tree : dict
+        Nested dictionaries with the locations of the values as leaves
+    values : dict
+        Values by their locations
 
     Returns
     -------
     ns : SimpleNamespace
-        Nested namespace with the data in Frame object
+        Nested namespace"""
+    return SimpleNamespace(**{key: _tonamespace(val, values) if isinstance(val, dict) else values[val]
+                              for key, val in tree.items()})
+
+
+def _collect(o, tree, leaves, values, ids, prefix=""):
+    """Collects the values of an object. Function is called recursively.
+
+    Parameters
+    ----------
+    o : object
+        object
+    tree : dict
+        Dictionary to which the structure of the object is added
+    leaves : dict
+        Dictionary to which the locations of the values are added. Views have the tuple of parent location,
+        index, and shape as value. Values with own column have None
+    values : dict
+        Dictionary to which the values are added
+    ids : dict
+        Locations of fields by their ids
+    prefix : str
+        Location of the object
 
     Notes
     -----
     Attributes beginning with underscore _ are being ignored.
     So are fields with Field.save == False."""
-    ret = {}
 
-    # These things are written directy into the dictionary.
+    # These things are written directy into the columns.
     direct = (numbers.Number, np.number, tuple,
               list, np.ndarray, str)
 
@@ -186,25 +474,62 @@ def _converttonamespace(o):
         if isinstance(val, Field) and val.save == False:
             continue
 
-        if val is not None and isinstance(val, direct):
-            ret[key] = copy.copy(val)
+        loc = ".".join(filter(None, [prefix, key]))
+
+        if isinstance(val, Field) and val.viewof is not None:
+            parent, index, shape = val._viewof
+            leaves[loc] = (id(parent), index, shape)
+            values[loc] = val
+            tree[key] = loc
+        elif isinstance(val, Field) and id(val) in ids:
+            # The same field at different locations is stored once
+            leaves[loc] = (id(val), (Ellipsis,), None)
+            values[loc] = val
+            tree[key] = loc
+        elif val is not None and isinstance(val, direct):
+            if isinstance(val, Field):
+                ids[id(val)] = loc
+            leaves[loc] = None
+            values[loc] = val
+            tree[key] = loc
         else:
-            ret[key] = _converttonamespace(val)
-
-    return SimpleNamespace(**ret)
+            tree[key] = {}
+            _collect(val, tree[key], leaves, values, ids, prefix=loc)
 
 
-def _writeframetonamespace(frame):
-    """Takes a list of dicts and a frame, stitches them together and returns namespace.
+def _writeframetonamespace(frame, stats=False):
+    """Takes a frame and collects the values that are appended to the columns.
 
     Paramters
     ---------
     frame : Frame
         Frame object to add
+    stats : boolean, optional, default : False
+        If True, the statistics of the integrator are added as namespace `integrator`
 
     Returns
     -------
-    n : SimpleNamespace
-        Namespace with data"""
-    d = _converttonamespace(frame)
-    return d
+    tree : dict
+        Nested dictionaries with the structure of the output. Leaves are the locations of the values
+    leaves : dict
+        None for values with own column or tuple of parent location, index, and shape for views
+    values : dict
+        Values with own column by their locations"""
+    tree, leaves, values, ids = {}, {}, {}, {}
+    _collect(frame, tree, leaves, values, ids)
+    if stats and getattr(frame, "integrator", None) is not None:
+        tree["integrator"] = {}
+        _collect(frame.integrator.stats,
+                 tree["integrator"], leaves, values, ids, prefix="integrator")
+    # Views are resolved after all fields are known
+    for loc, view in leaves.items():
+        if view is None:
+            continue
+        parent, index, shape = view
+        if parent in ids:
+            leaves[loc] = (ids[parent], index, shape)
+            del values[loc]
+        else:
+            # Views of parents that are not stored get their own column
+            leaves[loc] = None
+    return tree, leaves, values
@@ -0,0 +1,509 @@
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import json
+import numbers
+import numpy as np
+import os
+import shutil
+import zlib
+
+from simframe.io.reader import Reader
+from simframe.io.reader import _index
+from simframe.io.reader import _select
+from simframe.io.writer import Writer
+from simframe.io.writers.collect import _collect
+from simframe.io.writers.collect import _decodeindex
+from simframe.frame.field import _view
+from simframe.utils.simplenamespace import SimpleNamespace
+
+
+class zarrwriter(Writer):
+    """Class for writing chunked output directories.
+
+    Every output is written into a directory store with the layout of Zarr version 2. Groups are directories with
+    ``.zgroup`` and ``.zattrs`` files. Arrays are directories with a ``.zarray`` file and one file per chunk. Strings
+    are stored in the ``.zattrs`` file of their group.
+
+    Notes
+    -----
+    ``zarrwriter.options`` can contain "level", "chunksize", "workers", and "stats". The chunks are compressed
+    with zlib of the given level on a thread pool with the given number of workers. If "level" is None, the chunks
+    are stored uncompressed. Arrays are split into chunks of about "chunksize" bytes, first along their first axis
+    and along the following axes if a single row is larger than that. The description of the frame is stored as
+    metadata in the root ``.zattrs`` file and is not part of the data.
+    Only the local file system is supported. Fields that are views of other fields are stored in the attribute
+    ``_views`` of their group with the location of their parent, the index, and the shape of the view."""
+
+    def __init__(self, *args, **kwargs):
+        filename = kwargs.pop("filename", "data")
+        extension = kwargs.pop("extension", "zarr")
+        description = kwargs.pop(
+            "description", "Zarr directory store with zlib compressed chunks")
+        options = kwargs.pop(
+            "options", {"level": 1, "chunksize": 2**20, "workers": None})
+        super().__init__(
+            _zarrwrapper,
+            filename=filename,
+            extension=extension,
+            description=description,
+            options=options,
+            reader=zarrreader,
+            *args, **kwargs
+        )
+
+
+def _zarrwrapper(obj, filename, level=1, chunksize=2**20, workers=None, stats=False):
+    """Wrapper to write object to directory store.
+
+    Parameters
+    ----------
+    obj : object
+        the object to be stored in a directory
+    filename : string
+        path to directory
+
+    Keywords
+    --------
+    level : int or None
+        zlib compression level of the chunks. If None, the chunks are not compressed
+    chunksize : int
+        approximate size of the chunks in bytes
+    workers : int or None
+        number of threads compressing and writing the chunks. If None, Python chooses the number of threads
+    stats : boolean
+        If True, the statistics of the integrator are written into the group `integrator`
+    """
+    if os.path.isdir(filename):
+        shutil.rmtree(filename)
+    values, views, paths = _collect(obj, "/", "Zarr stores", "zarrwriter", stats=stats)
+    items = []
+    groups = {path: {} for path in [""] + paths}
+    if getattr(obj, "_description", None) is not None:
+        groups[""]["_description"] = obj._description
+    for path, val in values:
+        group, _, key = path.rpartition("/")
+        arr = np.asarray(val)
+        if arr.dtype.kind in "US":
+            groups[group][key] = arr.tolist()
+        elif arr.dtype.hasobject:
+            raise ValueError(
+                "Zarr stores cannot store objects in {}.".format(path))
+        else:
+            items.append((path, np.ascontiguousarray(arr).reshape(arr.shape)))
+    for path, spec in views:
+        group, _, key = path.rpartition("/")
+        groups[group].setdefault("_views", {})[key] = spec
+
+    for path, attrs in groups.items():
+        os.makedirs(os.path.join(filename, path), exist_ok=True)
+        _writejson(os.path.join(filename, path, ".zgroup"),
+                   {"zarr_format": 2})
+        _writejson(os.path.join(filename, path, ".zattrs"), attrs)
+
+    compressor = None if level is None else {"id": "zlib", "level": level}
+    tasks = []
+    for path, val in items:
+        chunks = _chunks(val.shape, val.dtype.itemsize, chunksize)
+        meta = {
+            "zarr_format": 2,
+            "shape": list(val.shape),
+            "chunks": list(chunks),
+            "dtype": val.dtype.str,
+            "compressor": compressor,
+            "fill_value": None,
+            "order": "C",
+            "filters": None,
+            "dimension_separator": ".",
+        }
+        os.makedirs(os.path.join(filename, path))
+        _writejson(os.path.join(filename, path, ".zarray"), meta)
+        for key, block in _blocks(val, chunks):
+            tasks.append((os.path.join(filename, path, key), block))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # zlib and file operations release the GIL
+        list(pool.map(lambda task: _writechunk(*task, level), tasks))
+
+
+def _chunks(shape, itemsize, chunksize):
+    """Returns the chunk shape of an array.
+
+    Arrays are split along their first axis. If a single row is larger than <chunksize>, the rows are split
+    along the following axes as well.
+
+    Parameters
+    ----------
+    shape : tuple
+        Shape of the array
+    itemsize : int
+        Size of one element in bytes
+    chunksize : int
+        Approximate size of the chunks in bytes
+
+    Returns
+    -------
+    chunks : tuple
+        Shape of the chunks"""
+    chunks = []
+    for k in range(len(shape)):
+        inner = max(1, int(np.prod(shape[k+1:])) * itemsize)
+        n = min(max(1, chunksize // inner), shape[k])
+        chunks.append(max(1, n))
+        if inner <= chunksize:
+            return tuple(chunks) + tuple(max(1, m) for m in shape[k+1:])
+    return tuple(chunks)
+
+
+def _blocks(val, chunks):
+    """Splits an array into its chunks.
+
+    Parameters
+    ----------
+    val : array
+        Contiguous array
+    chunks : tuple
+        Shape of the chunks
+
+    Returns
+    -------
+    blocks : generator
+        Tuples of chunk key and chunk. Chunks at the edge are padded with zeros"""
+    if val.ndim == 0:
+        yield "0", val
+        return
+    grid = [range(-(-N // n)) for N, n in zip(val.shape, chunks)]
+    for js in itertools.product(*grid):
+        block = val[tuple(slice(j*n, (j+1)*n) for j, n in zip(js, chunks))]
+        if block.shape != tuple(chunks):
+            padded = np.zeros(chunks, dtype=val.dtype)
+            padded[tuple(slice(0, m) for m in block.shape)] = block
+            block = padded
+        yield ".".join(str(j) for j in js), np.ascontiguousarray(block)
+
+
+def _writechunk(filename, block, level):
+    """Compresses and writes a single chunk.
+
+    Parameters
+    ----------
+    filename : str
+        Path to chunk file
+    block : array
+        Contiguous chunk
+    level : int or None
+        zlib compression level. If None, the chunk is not compressed"""
+    data = block.reshape(-1).view(np.uint8)
+    if level is not None:
+        data = zlib.compress(data, level)
+    with open(filename, "wb") as f:
+        f.write(data)
+
+
+def _writejson(filename, d):
+    """Writes a dictionary into a JSON file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to file
+    d : dict
+        Dictionary to be written"""
+    with open(filename, "w") as f:
+        json.dump(d, f)
+
+
+def _readjson(filename):
+    """Reads a dictionary from a JSON file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to file
+
+    Returns
+    -------
+    d : dict
+        Dictionary in file"""
+    with open(filename, "r") as f:
+        return json.load(f)
+
+
+def _readchunk(filename, meta):
+    """Reads and decompresses a single chunk.
+
+    Parameters
+    ----------
+    filename : str
+        Path to chunk file
+    meta : dict
+        Metadata of the array
+
+    Returns
+    -------
+    block : array
+        Chunk with the chunk shape of the array"""
+    with open(filename, "rb") as f:
+        data = f.read()
+    compressor = meta["compressor"]
+    if compressor is not None:
+        if compressor["id"] != "zlib":
+            raise NotImplementedError(
+                "Compressor {} not supported by zarrreader.".format(compressor["id"]))
+        data = zlib.decompress(data)
+    return np.frombuffer(data, dtype=np.dtype(meta["dtype"])).reshape(meta["chunks"])
+
+
+def _rows(index, N):
+    """Returns the rows of an array that are required for an index.
+
+    Parameters
+    ----------
+    index : tuple
+        Index of the requested part of the array
+    N : int
+        Length of the first axis of the array
+
+    Returns
+    -------
+    rows : range
+        Rows to be read
+    index : tuple
+        Index relative to the first row to be read"""
+    if len(index) == 0:
+        return range(N), index
+    first = index[0]
+    if isinstance(first, (numbers.Integral, np.integer)) and not isinstance(first, (bool, np.bool_)):
+        i = range(N)[first]
+        return range(i, i+1), (0,) + index[1:]
+    if isinstance(first, slice):
+        rows = range(N)[first]
+        if len(rows) == 0:
+            return range(0), index
+        lo = min(rows[0], rows[-1])
+        stop = rows[-1] - lo + rows.step
+        shifted = slice(rows[0] - lo, stop if stop >= 0 else None, rows.step)
+        return range(lo, max(rows[0], rows[-1]) + 1), (shifted,) + index[1:]
+    # Other indices, e.g., lists or Ellipsis, require all rows
+    return range(N), index
+
+
+def _readarray(path, index=(), workers=None):
+    """Reads a part of an array from a directory store. Only the required chunks are read.
+
+    Parameters
+    ----------
+    path : str
+        Path to array directory
+    index : tuple, optional, default : ()
+        Index of the requested part of the array
+    workers : int or None, optional, default : None
+        Number of threads reading the chunks
+
+    Returns
+    -------
+    data : array
+        Requested part of the array"""
+    meta = _readjson(os.path.join(path, ".zarray"))
+    shape = tuple(meta["shape"])
+    if shape == ():
+        return np.array(_readchunk(os.path.join(path, "0"), meta).reshape(())[index])
+    rows, index = _rows(index, shape[0])
+    ret = np.empty((len(rows),) + shape[1:], dtype=np.dtype(meta["dtype"]))
+    if len(rows) == 0:
+        return np.array(ret[index])
+    n = meta["chunks"][0]
+    grid = [range(rows[0] // n, (rows[-1] // n) + 1)]
+    grid += [range(-(-N // m)) for N, m in zip(shape[1:], meta["chunks"][1:])]
+    chunks = list(itertools.product(*grid))
+    files = [os.path.join(path, ".".join(str(j) for j in js)) for js in chunks]
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            blocks = list(pool.map(lambda f: _readchunk(f, meta), files))
+    else:
+        blocks = [_readchunk(f, meta) for f in files]
+    for js, block in zip(chunks, blocks):
+        lo = max(js[0]*n, rows[0])
+        hi = min((js[0]+1)*n, rows[-1]+1)
+        dst = [slice(lo-rows[0], hi-rows[0])]
+        src = [slice(lo-js[0]*n, hi-js[0]*n)]
+        for j, N, m in zip(js[1:], shape[1:], meta["chunks"][1:]):
+            dst.append(slice(j*m, min((j+1)*m, N)))
+            src.append(slice(0, min((j+1)*m, N) - j*m))
+        ret[tuple(dst)] = block[tuple(src)]
+    return np.array(ret[index])
+
+
+def _makeview(parent, spec):
+    """Returns a view into the data of the parent.
+
+    Parameters
+    ----------
+    parent : array
+        Data of the parent
+    spec : dict
+        Location of the parent, index, and shape of the view
+
+    Returns
+    -------
+    data : array
+        View of the field"""
+    shape = None if spec["shape"] is None else tuple(spec["shape"])
+    return _view(parent, _decodeindex(spec["index"]), shape)
+
+
+def _readzarrfield(filename, field, index=()):
+    """Reads a part of a field from a directory store.
+
+    Parameters
+    ----------
+    filename : str
+        Path to directory store
+    field : str
+        Location of the field
+    index : tuple, optional, default : ()
+        Index of the requested part of the field
+
+    Returns
+    -------
+    data : array
+        Requested part of the field"""
+    loc = field.split(".")
+    path = os.path.join(filename, *loc)
+    if os.path.isfile(os.path.join(path, ".zarray")):
+        return _readarray(path, index)
+    attrs = os.path.join(filename, *loc[:-1], ".zattrs")
+    if os.path.isfile(attrs):
+        attrs = _readjson(attrs)
+        if loc[-1] in attrs and not loc[-1].startswith("_"):
+            return np.array(np.asarray(attrs[loc[-1]])[index])
+        if loc[-1] in attrs.get("_views", {}):
+            spec = attrs["_views"][loc[-1]]
+            parent = _readarray(os.path.join(filename, *spec["parent"].split("/")))
+            return np.array(np.asarray(_makeview(parent, spec))[index])
+    raise KeyError("Requested <field> {} does not exist.".format(field))
+
+
+class zarrreader(Reader):
+    """Reader class for the zarr writer."""
+
+    def __init__(self, writer):
+        """Zarr reader
+
+        Parameters
+        ----------
+        writer : Writer
+            Writer object to which the reader belongs."""
+        super().__init__(writer)
+
+    def output(self, output):
+        """Reads a single output directory.
+
+        Parameters
+        ----------
+        output : str or int
+            Path to directory to be read or number of output
+
+        Returns
+        -------
+        data : SimpleNamespace
+            Namespace of data in directory."""
+
+        if not isinstance(output, str):
+            output = self._writer._getfilename(output)
+
+        if not os.path.isfile(os.path.join(output, ".zgroup")):
+            raise RuntimeError("File does not exist.")
+
+        views = []
+        data = self._readgroup(output, views)
+        for loc, spec in views:
+            group = data
+            for key in loc[:-1]:
+                group = group.__dict__[key]
+            parent = data
+            for key in spec["parent"].split("/"):
+                parent = parent.__dict__[key]
+            group.__dict__[loc[-1]] = _makeview(parent, spec)
+        return data
+
+    def sequence(self, field, snapshots=None, index=None):
+        """Reading the entire sequence of a specific field.
+
+        Parameters
+        ----------
+        field : string
+            String with location of requested field
+        snapshots : int, slice, list, or None, optional, default : None
+            Outputs to be read. If None, all outputs are read
+        index : int, slice, tuple, or None, optional, default : None
+            Index of the requested part of the field. If None, the entire field is read
+
+        Returns
+        -------
+        seq : array
+            Array with requested values
+
+        Notes
+        -----
+        ``field`` is addressing the values just as in the parent frame object.
+        E.g. ``"groupA.groupB.fieldC"`` is addressing ``Frame.groupA.groupB.fieldC``.
+        Only the chunks that contain the requested part of the field are read."""
+        files = self.listfiles()
+        if files == []:
+            raise RuntimeError("<datadir> does not exist or is empty.")
+        if not isinstance(field, str):
+            raise TypeError("<field> has to be of type string.")
+        files = _select(files, snapshots)
+        ret = list(self._map(_readzarrfield, files, field, _index(index)))
+        return np.array(ret)
+
+    def _readitem(self, output, field, index=()):
+        """Reads a part of a field from a single output directory.
+
+        Parameters
+        ----------
+        output : str
+            Path to directory
+        field : str
+            String with location of requested field
+        index : tuple, optional, default : ()
+            Index of the requested part of the field
+
+        Returns
+        -------
+        data : array
+            Requested part of the field"""
+        return _readzarrfield(output, field, index)
+
+    def _readgroup(self, path, views, loc=()):
+        """Helper function that is iteratively called to get the depth of the data set.
+
+        Parameters
+        ----------
+        path : str
+            Path to group directory
+        views : list
+            List to which tuples of location and specification of the views are appended.
+            Views are created after all arrays have been read
+        loc : tuple, optional, default : ()
+            Location of the group
+
+        Returns
+        -------
+        data : SimpleNamespace
+            Namespace of data"""
+        ret = {}
+        attrs = os.path.join(path, ".zattrs")
+        if os.path.isfile(attrs):
+            attrs = _readjson(attrs)
+            # Hidden attributes are metadata, e.g., the description of the frame
+            ret.update({key: val for key, val in attrs.items() if not key.startswith("_")})
+            for key, spec in attrs.get("_views", {}).items():
+                views.append((loc + (key,), spec))
+        for entry in sorted(os.listdir(path)):
+            sub = os.path.join(path, entry)
+            if os.path.isfile(os.path.join(sub, ".zarray")):
+                ret[entry] = _readarray(sub)
+            elif os.path.isfile(os.path.join(sub, ".zgroup")):
+                ret[entry] = self._readgroup(sub, views, loc + (entry,))
+        return SimpleNamespace(**ret)
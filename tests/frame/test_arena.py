@@ -0,0 +1,69 @@
+# Tests for the Arena class
+
+
+import dill
+import numpy as np
+import pytest
+from simframe import Frame
+from simframe.frame import Arena
+
+
+def test_arena_attributes():
+    with pytest.raises(TypeError):
+        Arena(capacity=1.)
+    with pytest.raises(ValueError):
+        Arena(capacity=0)
+    with pytest.raises(TypeError):
+        Arena(alignment=1.)
+    with pytest.raises(ValueError):
+        Arena(alignment=3)
+    with pytest.raises(TypeError):
+        Arena(path=1)
+    a = Arena()
+    with pytest.raises(TypeError):
+        a.description = 1
+    assert isinstance(repr(a), str)
+    assert isinstance(str(a), str)
+    with pytest.raises(TypeError):
+        Frame(arena=1)
+
+
+def test_arena_fields():
+    f = Frame(arena=Arena(capacity=128, alignment=32))
+    f.addfield("A", np.arange(4.))
+    f.addfield("B", 1)
+    f.addfield("C", "text")
+    f.addgroup("G")
+    f.G.addfield("D", np.ones(100))
+    f.addfield("E", [None, 1])
+    assert len(f.arena.blocks) == 2
+    for field in [f.A, f.B, f.C, f.G.D]:
+        assert field.ctypes.data % 32 == 0
+        assert any(np.shares_memory(field, block)
+                   for block in f.arena.blocks)
+    assert not any(np.shares_memory(f.E, block) for block in f.arena.blocks)
+    assert f.A.dtype == np.float64
+    assert f.C == "text"
+    snapshot = f.arena.snapshot()
+    f.A = np.zeros(4)
+    f.G.D = np.zeros(100)
+    assert np.all(f.A == 0.)
+    version = f.G.D.version
+    f.arena.restore(snapshot)
+    # Updaters that depend on restored fields have to be executed again
+    assert f.G.D.version > version
+    assert np.all(f.A == np.arange(4.))
+    assert np.all(f.G.D == 1.)
+    with pytest.raises(ValueError):
+        f.arena.restore(snapshot + snapshot)
+    f2 = dill.loads(dill.dumps(f))
+    assert f2.arena.blocks == []
+    assert np.all(f2.A == np.arange(4.))
+
+
+def test_arena_memmap(tmp_path):
+    path = str(tmp_path / "arena")
+    f = Frame(arena=Arena(path=path))
+    f.addfield("A", np.arange(4.))
+    f.arena.blocks[0].flush()
+    assert (tmp_path / "arena.0").exists()
@@ -103,3 +103,21 @@ def test_field_derivative():
         return [[2., 0], [0., 2.]]
     f.Y.jacobinator = jac
     assert np.all(f.Y.derivative() == [2., 0.])
+
+
+def test_field_version():
+    f = Frame()
+    f.addfield("Y", 1.)
+    assert f.Y.version == 0
+    with pytest.raises(RuntimeError):
+        f.Y.version = 1
+    f.Y._setvalue(2.)
+    assert f.Y.version == 1
+    f.Y.updater = lambda f: 3.
+    f.Y.update()
+    assert f.Y.version == 2
+    f.Y.updater = lambda f: None
+    f.Y.update()
+    assert f.Y.version == 2
+    f.Y.touch()
+    assert f.Y.version == 3
@@ -1,10 +1,17 @@
 # Test for Frame class
 
 
+import json
 import numpy as np
 import pytest
+import tracemalloc
 from simframe import Frame
+from simframe import Instruction
 from simframe import Integrator
+from simframe import schemes
+from simframe import writers
+from simframe.frame import MemoryTracker
+from simframe.frame import Profiler
 from simframe.io import Progressbar
 
 
@@ -56,3 +63,243 @@ def test_frame_iter():
             assert field == 0.
         if name == "B":
             assert field == 1.
+
+
+def test_frame_restart():
+
+    def dYdx(f, x, Y):
+        return -Y
+
+    def dx(f):
+        return 0.1
+
+    def setup(snapshots):
+        f = Frame()
+        f.verbosity = 0
+        f.addfield("Y", [1., 2.])
+        f.addgroup("A")
+        f.A.addfield("B", 0., constant=True)
+        f.Y.differentiator = dYdx
+        f.addintegrationvariable("x", 0., snapshots=snapshots)
+        f.x.updater = dx
+        f.integrator = Integrator(f.x)
+        f.integrator.instructions = [Instruction(schemes.expl_1_euler, f.Y)]
+        f.writer = writers.hdf5writer(verbosity=0, dumping=False)
+        return f
+
+    f = setup([0., 1., 2.])
+    f.run()
+    Y = f.Y.copy()
+    f.writer._getfilename(2).unlink()
+
+    g = setup([0., 1., 2.])
+    with pytest.raises(RuntimeError):
+        g.restart(2)
+    g.restart(1)
+    assert g.x == 1.
+    assert np.all(g.Y == f.writer.read.sequence("Y")[1])
+    g.run()
+    assert np.all(g.Y == Y)
+    assert np.all(g.writer.read.sequence("x") == [0., 1., 2.])
+
+    g.writer = None
+    with pytest.raises(RuntimeError):
+        g.restart(1)
+
+    # Nothing is restored if the output already passed the largest snapshot
+    h = setup([0., 1.])
+    with pytest.raises(RuntimeError):
+        h.restart(1)
+    assert h.x == 0.
+    assert np.all(h.Y == [1., 2.])
+
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_frame_profiler():
+    f = Frame()
+    f.verbosity = 0
+    with pytest.raises(TypeError):
+        f.profiler = 1
+    f.addfield("Y", 1.)
+    f.addfield("Z", 0.)
+    f.addintegrationvariable("x", 0., snapshots=[1.])
+
+    def dYdx(f, x, Y):
+        return -Y
+
+    def dx(f):
+        return 0.1
+
+    def upd(f):
+        return f.Y
+
+    f.Y.differentiator = dYdx
+    f.x.updater = dx
+    f.updater = ["Z"]
+    f.integrator = Integrator(f.x)
+    f.integrator.instructions = [Instruction(schemes.expl_1_euler, f.Y)]
+    f.profiler = Profiler()
+    assert isinstance(repr(f.profiler), str)
+    # Updater is assigned after the profiler
+    f.Z.updater = upd
+    f.run()
+    report = f.profiler.report(print_output=False)
+    names = [r[0] for r in report]
+    assert "Frame (updater)" in names
+    assert "Z (updater)" in names
+    assert "Y (differentiator)" in names
+    calls = {r[0]: r[1] for r in report}
+    assert calls["Z (updater)"] == calls["Y (differentiator)"]
+    f.profiler.report()
+    f.profiler.reset()
+    assert f.profiler.report(print_output=False) == []
+    f.profiler = None
+    assert "update" not in f.Z.updater.updater.__dict__
+
+
+def test_frame_memorytracker(tmp_path):
+    with pytest.raises(TypeError):
+        Frame(memorytracker=1)
+    with pytest.raises(TypeError):
+        MemoryTracker(filename=1)
+    filename = str(tmp_path / "log" / "memory.jsonl")
+    f = Frame(memorytracker=MemoryTracker(filename=filename))
+    f.verbosity = 0
+    f.addfield("Y", np.ones(1000))
+    f.addfield("Z", np.zeros(1000))
+    f.Y.differentiator = lambda f, x, Y: -Y
+    f.Z.updater = lambda f: np.concatenate([f.Y, f.Y])[:1000]
+    f.updater = ["Z"]
+    f.addintegrationvariable("x", 0., snapshots=[0., 0.5, 1.])
+    f.x.updater = lambda f: 0.1
+    f.integrator = Integrator(f.x)
+    f.integrator.instructions = [Instruction(schemes.expl_4_runge_kutta, f.Y)]
+    f.writer = writers.namespacewriter()
+    assert isinstance(repr(f.memorytracker), str)
+    f.run()
+    assert not tracemalloc.is_tracing()
+    log = f.memorytracker.report(print_output=False)
+    assert [entry["snapshot"] for entry in log] == [0, 1, 2]
+    assert sum(entry["steps"] for entry in log) == len(f.memorytracker.peaks)
+    # Stage temporaries and update temporaries are larger than a single field
+    assert log[-1]["scheme"] >= f.Y.nbytes
+    assert log[-1]["updater"] >= 2*f.Y.nbytes
+    assert log[-1]["writer"] > 0
+    assert log[-1]["peak"] >= log[-1]["scheme"]
+    with open(filename) as file:
+        assert [json.loads(line) for line in file] == log
+    f.memorytracker.report()
+    f.memorytracker.reset()
+    assert f.memorytracker.log == []
+    assert f.memorytracker.peaks == []
+    # Memory tracing is stopped if the simulation fails
+    f.x.snapshots = [3.]
+
+    def fail(f):
+        raise ValueError
+    f.Z.updater = fail
+    with pytest.raises(ValueError):
+        f.run()
+    assert not tracemalloc.is_tracing()
+
+
+def test_frame_compiled_update():
+    f = Frame()
+    f.addfield("Y", 1.)
+    f.addgroup("G")
+    f.G.addfield("A", 0.)
+    f.G.addfield("B", 0.)
+    f.G.A.updater = lambda f: 2.*f.Y
+    f.G.B.updater = lambda f: f.G.A + 1.
+    f.G.updater = ["A", "B"]
+    f.updater = ["G"]
+    f.Y.differentiator = lambda f, x, Y: -Y
+    f.addintegrationvariable("x", 0.)
+    f.x.updater = lambda f: 0.1
+    f.x.snapshots = [1.]
+    f.integrator = Integrator(f.x)
+    f.integrator.instructions = [Instruction(schemes.expl_1_euler, f.Y)]
+    f.verbosity = 0
+    f.run()
+    # Only the two field updaters remain
+    assert len(f._compiled[1]) == 2
+    assert np.isclose(f.G.B, 2.*f.Y + 1.)
+    compiled = f._compiled
+    f.x.snapshots = [1., 2.]
+    f.run()
+    assert f._compiled is compiled
+    f.G.B.updater = lambda f: f.G.A - 1.
+    f.x.snapshots = [1., 2., 3.]
+    f.run()
+    assert f._compiled is not compiled
+    assert np.isclose(f.G.B, 2.*f.Y - 1.)
+    # Changes in other frames do not invalidate the compiled updates
+    compiled = f._compiled
+    g = Frame()
+    g.addfield("Z", 0.)
+    g.Z.updater = lambda g: 1.
+    f._update()
+    assert f._compiled is compiled
+    # Changing the inputs of an updater of a list invalidates the compiled updates
+    f.G.updater.updater.inputs = [f.Y]
+    f._update()
+    assert f._compiled is not compiled
+    assert len(f._compiled[1]) == 1
+
+
+def test_frame_compiled_update_readd():
+    f = Frame()
+    f.addgroup("G")
+    f.G.addfield("A", 1.)
+    f.G.A.updater = lambda f: 0.
+    f.G.updater = ["A"]
+    f.updater = ["G"]
+    f._update()
+    assert f.G.A == 0.
+    # Re-adding members invalidates the compiled updates
+    f.G.addfield("A", 1.)
+    f.G.A.updater = lambda f: 5.
+    f._update()
+    assert f.G.A == 5.
+    f.addgroup("G")
+    f.G.addfield("A", 1.)
+    f.G.A.updater = lambda f: 3.
+    f.G.updater = ["A"]
+    f._update()
+    assert f.G.A == 3.
+
+
+def test_frame_dtype():
+    with pytest.raises(TypeError):
+        Frame(dtype="nodtype")
+    with pytest.raises(ValueError):
+        Frame(dtype=int)
+
+    def run(dtype, scheme):
+        f = Frame(dtype=dtype)
+        f.addfield("Y", [1., 2.])
+        f.addfield("N", 1)
+        f.Y.differentiator = lambda f, x, Y: -Y
+        f.Y.jacobinator = lambda f, x: -np.eye(2)
+        f.addintegrationvariable("x", 0.)
+        f.x.updater = lambda f: 0.1
+        f.x.snapshots = [1.]
+        f.integrator = Integrator(f.x)
+        f.integrator.instructions = [Instruction(scheme, f.Y)]
+        f.verbosity = 0
+        f.run()
+        assert f.N.dtype.kind == "i"
+        assert f.x.dtype == np.float64
+        return f
+    for scheme in [schemes.expl_4_runge_kutta, schemes.expl_5_cash_karp_adptv, schemes.impl_2_midpoint_direct]:
+        f32 = run(np.float32, scheme)
+        f64 = run(None, scheme)
+        assert f32.Y.dtype == np.float32
+        assert f32.Y.derivative().dtype == np.float32
+        assert f32.Y.jacobian().dtype == np.float32
+        assert f64.Y.dtype == np.float64
+        assert np.allclose(f32.Y, f64.Y, rtol=1.e-5)
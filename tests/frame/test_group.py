@@ -1,6 +1,8 @@
 # Tests for Group class
 
 
+import dill
+import numpy as np
 import pytest
 import sys
 from simframe import Frame
@@ -104,3 +106,34 @@ def test_group_memory_usage():
     assert f.memory_usage() == mem
     assert f.memory_usage(skip_hidden=True) == 8.
     f.memory_usage(print_output=True)
+
+
+def test_group_addfield_view():
+    f = Frame()
+    f.addfield("Y", np.arange(6.))
+    with pytest.raises(TypeError):
+        f.addfield("a", np.arange(6.), view=0)
+    with pytest.raises(ValueError):
+        f.addfield("a", f.Y, view=[0, 1])
+    with pytest.raises(ValueError):
+        f.addfield("a", f.Y, view=slice(0., 1.))
+    f.addgroup("G")
+    f.G.addfield("gas", f.Y, view=slice(0, 4), shape=(2, 2))
+    f.G.addfield("T", f.Y, view=5)
+    with pytest.raises(ValueError):
+        f.addfield("a", f.G.gas, view=0)
+    f.addfield("M", np.zeros((2, 3)))
+    with pytest.raises(ValueError):
+        f.addfield("a", f.M, view=(slice(None), slice(0, 2)), shape=(4,))
+    assert f.G.gas.shape == (2, 2)
+    assert f.G.gas.viewof is f.Y
+    assert f.G.T.shape == ()
+    with pytest.raises(RuntimeError):
+        f.G.T.viewof = f.Y
+    f.Y = np.ones(6)
+    assert np.all(f.G.gas == 1.)
+    f.G.T = 5.
+    assert f.Y[5] == 5.
+    f2 = dill.loads(dill.dumps(f))
+    f2.G.T = 3.
+    assert f2.Y[5] == 3.
@@ -0,0 +1,96 @@
+# Tests for the Scheduler class
+
+
+import dill
+import numpy as np
+import pytest
+from simframe import Frame
+from simframe.frame import Scheduler
+
+
+def test_scheduler_attributes():
+    with pytest.raises(TypeError):
+        Scheduler(1)
+    with pytest.raises(ValueError):
+        Scheduler({"A": "B"})
+    with pytest.raises(ValueError):
+        Scheduler({"A": ["B"]})
+    with pytest.raises(ValueError):
+        Scheduler({"A": ["B"], "B": ["A"]})
+    with pytest.raises(TypeError):
+        Scheduler({}, workers=1.)
+    with pytest.raises(ValueError):
+        Scheduler({}, workers=0)
+    s = Scheduler({})
+    with pytest.raises(TypeError):
+        s.description = 1
+    with pytest.raises(RuntimeError):
+        s(None)
+    assert isinstance(str(s), str)
+    assert isinstance(repr(s), str)
+
+
+def test_scheduler_levels():
+    s = Scheduler({"C": ["A", "B"], "A": [], "B": ["A"], "D": []})
+    assert s.levels == [["A", "D"], ["B"], ["C"]]
+    assert s.order == ["A", "D", "B", "C"]
+
+
+def test_scheduler_group_update():
+    f = Frame()
+    f.addfield("A", np.zeros(1000))
+    f.addfield("B", np.zeros(1000))
+    f.addfield("C", np.zeros(1000))
+    f.A.updater = lambda f: np.ones(1000)
+    f.B.updater = lambda f: 2.*f.A
+    f.C.updater = lambda f: f.A + f.B
+    with pytest.raises(RuntimeError):
+        f.updater = {"A": [], "D": []}
+    f.updater = {"C": ["A", "B"], "B": ["A"], "A": []}
+    assert f.updateorder == ["A", "B", "C"]
+    f.update()
+    assert np.all(f.C == 3.)
+    f.updater = Scheduler({"A": [], "B": []}, workers=1)
+    f.update()
+    assert np.all(f.B == 2.)
+    f2 = dill.loads(dill.dumps(f))
+    f2.update()
+    assert np.all(f2.B == 2.)
+
+
+def test_scheduler_exception_order():
+    f = Frame()
+    f.addfield("A", 0.)
+    f.addfield("B", 0.)
+
+    def updA(f):
+        raise ValueError("A")
+
+    def updB(f):
+        raise KeyError("B")
+    f.A.updater = updA
+    f.B.updater = updB
+    f.updater = {"B": [], "A": []}
+    with pytest.raises(KeyError):
+        f.update()
+
+
+def test_scheduler_shutdown():
+    f = Frame()
+    f.addfield("A", 0.)
+    f.addfield("B", 0.)
+    f.A.updater = lambda f: 1.
+    f.B.updater = lambda f: 2.
+    s = Scheduler({"A": [], "B": []}, workers=2)
+    f.updater = s
+    f.update()
+    pool = s._pool
+    assert pool is not None
+    f.updater = s
+    assert s._pool is None
+    assert pool._shutdown
+    f.update()
+    pool = s._pool
+    f.updater = None
+    del s
+    assert pool._shutdown
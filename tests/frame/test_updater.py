@@ -1,6 +1,7 @@
 # Tests for Updater class
 
 
+import pytest
 from simframe.frame.frame import Frame
 from simframe.frame import Updater
 
@@ -18,3 +19,34 @@ def test_updater_repr_str():
     f.updater = func
     assert isinstance(repr(f.updater.updater), str)
     assert isinstance(str(f.updater.updater), str)
+
+
+def test_updater_inputs():
+    with pytest.raises(TypeError):
+        Updater(inputs=1)
+    with pytest.raises(TypeError):
+        Updater(inputs=[1])
+
+    f = Frame()
+    f.addfield("A", 1.)
+    f.addfield("B", 0.)
+    calls = []
+
+    def func(f):
+        calls.append(1)
+        return 2.*f.A
+    f.B.updater = Updater(func, inputs=[f.A])
+    f.B.update()
+    f.B.update()
+    assert len(calls) == 1
+    assert f.B == 2.
+    f.A._setvalue(2.)
+    f.B.update()
+    assert len(calls) == 2
+    assert f.B == 4.
+    f.A[...] = 3.
+    f.B.update()
+    assert f.B == 4.
+    f.A.touch()
+    f.B.update()
+    assert f.B == 6.
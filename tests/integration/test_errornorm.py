@@ -0,0 +1,103 @@
+# Tests for the ErrorNorm class
+
+
+import numpy as np
+import pytest
+from simframe import Frame
+from simframe import Instruction
+from simframe import Integrator
+from simframe import schemes
+from simframe.integration import ErrorNorm
+
+
+def test_errornorm_attributes():
+    with pytest.raises(TypeError):
+        ErrorNorm(norm=1)
+    with pytest.raises(ValueError):
+        ErrorNorm(norm="l1")
+    with pytest.raises(TypeError):
+        ErrorNorm(atol="a")
+    with pytest.raises(ValueError):
+        ErrorNorm(atol=-1.)
+    with pytest.raises(TypeError):
+        ErrorNorm(rtol="a")
+    with pytest.raises(ValueError):
+        ErrorNorm(rtol=0.)
+    e = ErrorNorm()
+    with pytest.raises(TypeError):
+        e.description = 1
+    assert isinstance(repr(e), str)
+    assert isinstance(str(e), str)
+    f = Frame()
+    f.addintegrationvariable("x", 0.)
+    with pytest.raises(TypeError):
+        Integrator(f.x, errornorm=1)
+
+
+def _run(errornorm, scheme=schemes.expl_3_bogacki_shampine_adptv, controller={}):
+    f = Frame()
+    f.addfield("A", np.ones(10))
+    f.addfield("B", np.linspace(1., 2., 10))
+    f.A.differentiator = lambda f, x, Y: -Y
+    f.B.differentiator = lambda f, x, Y: -10.*Y
+    f.addintegrationvariable("x", 0.)
+
+    def dx(f):
+        return f.x.suggested
+    f.x.updater = dx
+    f.x.snapshots = [1.]
+    f.x.suggest(0.1)
+    f.integrator = Integrator(f.x, errornorm=errornorm)
+    f.integrator.instructions = [Instruction(scheme, f.A, controller=controller),
+                                 Instruction(scheme, f.B, controller=controller)]
+    f.verbosity = 0
+    f.run()
+    return f
+
+
+def test_errornorm_max():
+    for scheme in [schemes.expl_2_fehlberg_adptv,
+                   schemes.expl_2_heun_euler_adptv,
+                   schemes.expl_3_bogacki_shampine_adptv,
+                   schemes.expl_3_gottlieb_shu_adptv,
+                   schemes.expl_5_cash_karp_adptv,
+                   schemes.expl_5_dormand_prince_adptv]:
+        f0 = _run(None, scheme=scheme)
+        f1 = _run(ErrorNorm(), scheme=scheme)
+        # The max norm reproduces the control of the individual schemes
+        assert f1.integrator.stats.naccepted == f0.integrator.stats.naccepted
+        assert np.allclose(f1.A, f0.A, rtol=1.e-12)
+        assert np.allclose(f1.B, f0.B, rtol=1.e-12)
+        assert f1.integrator.errornorm.value <= 1.
+
+
+def test_errornorm_rms():
+    fmax = _run(ErrorNorm(norm="max", rtol=1.e-3))
+    frms = _run(ErrorNorm(norm="rms", rtol=1.e-3))
+    assert frms.integrator.stats.naccepted <= fmax.integrator.stats.naccepted
+    assert np.allclose(frms.A, np.exp(-1.), rtol=1.e-2)
+
+
+def test_errornorm_tolerances():
+    f0 = _run(ErrorNorm(rtol=0.1))
+    f1 = _run(ErrorNorm(rtol=0.1), controller={"rtol": 1.e-4})
+    f2 = _run(ErrorNorm(rtol=1.e-4, atol=1.))
+    assert f1.integrator.stats.naccepted > f0.integrator.stats.naccepted
+    assert f2.integrator.stats.naccepted < f1.integrator.stats.naccepted
+
+
+def test_errornorm_zero_crossing():
+    f = Frame()
+    f.addintegrationvariable("x", 0., snapshots=[1.])
+    e = np.array([1.e-2, 1.e-2])
+    Yscale = np.array([0., 1.])
+    # Elements with zero scale are controlled by the absolute tolerance
+    errornorm = ErrorNorm(atol=1.e-3)
+    errornorm._register(e, Yscale, 0.1, 0.1, 1.e-4, -0.2, -0.25, 0.9)
+    assert not errornorm._accept(f.x)
+    assert np.isclose(errornorm.value, 10.)
+    # Without absolute tolerance they are not controlled
+    errornorm = ErrorNorm()
+    errornorm._register(e, Yscale, 0.1, 0.1, 1.e-4, -0.2, -0.25, 0.9)
+    assert errornorm._accept(f.x)
+    assert np.isclose(errornorm.value, 0.1)
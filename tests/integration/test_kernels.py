@@ -0,0 +1,59 @@
+# Tests for the Runge-Kutta stage kernels
+
+
+import numpy as np
+import pytest
+from simframe.integration import kernels
+
+
+def test_kernels_numpy():
+    Y0 = np.linspace(0., 1., 10)
+    k0 = -Y0
+    k1 = np.ones(10)
+    dx = 0.1
+    assert kernels.backend in ["numba", "numpy"]
+    assert np.allclose(kernels.stage(Y0, dx, (0.5, 0.25), (k0, k1)),
+                       Y0 + (0.5*k0 + 0.25*k1)*dx)
+    assert np.allclose(kernels.delta(Y0, dx, (0.5, 0.25), (k0, k1)),
+                       dx*(0.5*k0 + 0.25*k1))
+    Yscale = np.abs(Y0) + np.abs(dx*k0)
+    Yscale[0] = 1.e100
+    emax = np.max(np.abs(dx*(0.5*k0 + 0.25*k1)/Yscale))
+    assert np.isclose(kernels.errormax(Y0, k0, dx, (0.5, 0.25), (k0, k1)), emax)
+
+
+def test_kernels_loops():
+    Y0 = np.linspace(0., 1., 5)
+    k0 = -Y0
+    k1 = np.ones(5)
+    coeffs = np.array([0.5, 0.25])
+    out = np.empty(5)
+    kernels._stageloop(out, Y0, 0.1, coeffs, (k0, k1))
+    assert np.allclose(out, Y0 + (0.5*k0 + 0.25*k1)*0.1)
+    kernels._deltaloop(out, 0.1, coeffs, (k0, k1))
+    assert np.allclose(out, 0.1*(0.5*k0 + 0.25*k1))
+    emax = kernels._errorloop(Y0, k0, 0.1, coeffs, (k0, k1))
+    assert np.isclose(emax, kernels.errormax(Y0, k0, 0.1, coeffs, (k0, k1)))
+
+
+def test_kernels_numba(monkeypatch):
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(0)
+    Y0 = rng.normal(size=(4, 5))
+    Y0[1, 2] = 0.
+    k0 = rng.normal(size=(4, 5))
+    k0[1, 2] = 0.
+    ks = (k0, rng.normal(size=(4, 5)), rng.normal(size=(4, 5)))
+    coeffs = (0.2, -0.5, 0.3)
+    dx = 0.1
+    assert kernels.backend == "numba"
+    assert kernels._fusable(Y0, (k0,) + ks)
+    fused = (kernels.stage(Y0, dx, coeffs, ks),
+             kernels.delta(Y0, dx, coeffs, ks),
+             kernels.errormax(Y0, k0, dx, coeffs, ks))
+    # Without numba the kernels fall back to numpy
+    monkeypatch.setattr(kernels, "_numba", None)
+    assert not kernels._fusable(Y0, (k0,) + ks)
+    assert np.allclose(fused[0], kernels.stage(Y0, dx, coeffs, ks))
+    assert np.allclose(fused[1], kernels.delta(Y0, dx, coeffs, ks))
+    assert np.isclose(fused[2], kernels.errormax(Y0, k0, dx, coeffs, ks))
@@ -0,0 +1,68 @@
+# Tests for the Memo class
+
+
+import pytest
+from simframe import Frame
+from simframe import Instruction
+from simframe import Integrator
+from simframe import schemes
+from simframe.integration import Memo
+
+
+def test_memo_attributes():
+    m = Memo()
+    with pytest.raises(TypeError):
+        m.description = 1
+    assert isinstance(repr(m), str)
+    assert isinstance(str(m), str)
+    m["a"] = 1
+    assert "a" in m
+    assert m["a"] == 1
+    assert m.get("b", 2) == 2
+    assert len(m) == 1
+    m.clear()
+    assert len(m) == 0
+    f = Frame()
+    f.addintegrationvariable("x", 0.)
+    f.integrator = Integrator(f.x)
+    with pytest.raises(TypeError):
+        f.integrator.memo = 1
+
+
+def _coupledframe(scheme):
+    f = Frame()
+    f.addfield("A", 1.)
+    f.addfield("B", 1.)
+    f.addintegrationvariable("x", 0.)
+    f.x.updater = lambda f: 0.1
+    f.x.snapshots = [1.]
+    calls = []
+
+    def flux(f, A, B):
+        memo = f.integrator.memo
+        if "flux" not in memo:
+            calls.append(1)
+            memo["flux"] = A - B
+        return memo["flux"]
+    f.A.differentiator = lambda f, x, Y: -flux(f, Y, f.B)
+    f.B.differentiator = lambda f, x, Y: flux(f, f.A, Y)
+    f.integrator = Integrator(f.x)
+    f.integrator.instructions = [Instruction(scheme, f.A),
+                                 Instruction(scheme, f.B)]
+    f.verbosity = 0
+    return f, calls
+
+
+def test_memo_shared_at_beginning_of_step():
+    f, calls = _coupledframe(schemes.expl_1_euler)
+    f.run()
+    assert f.integrator.stats.nfev == 2*len(calls)
+    assert len(f.integrator.memo) == 0
+
+
+def test_memo_intermediate_stages():
+    f, calls = _coupledframe(schemes.expl_2_heun)
+    f.run()
+    # Only the first stage is shared
+    assert f.integrator.stats.nfev == 4*f.integrator.stats.naccepted
+    assert len(calls) == 3*f.integrator.stats.naccepted
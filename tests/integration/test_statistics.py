@@ -0,0 +1,103 @@
+# Tests for the Statistics class
+
+
+import numpy as np
+import pickle
+import pytest
+from simframe import Frame
+from simframe import Instruction
+from simframe import Integrator
+from simframe import schemes
+from simframe import writers
+from simframe.integration import Memo
+from simframe.integration import Statistics
+
+
+def test_statistics_attributes():
+    s = Statistics()
+    with pytest.raises(TypeError):
+        s.description = 1
+    assert isinstance(repr(s), str)
+    assert isinstance(str(s), str)
+    f = Frame()
+    f.addintegrationvariable("x", 0.)
+    f.integrator = Integrator(f.x)
+    with pytest.raises(TypeError):
+        f.integrator.stats = 1
+
+
+def test_statistics_explicit():
+    f = Frame()
+    f.addfield("Y", 1.)
+
+    def dYdx(f, x, Y):
+        return -Y
+    f.Y.differentiator = dYdx
+    f.addintegrationvariable("x", 0.)
+
+    def dx(f):
+        return f.x.suggested
+    f.x.updater = dx
+    f.x.snapshots = [0., 10.]
+    f.x.suggest(100.)
+
+    f.integrator = Integrator(f.x)
+    f.integrator.instructions = [Instruction(
+        schemes.expl_5_cash_karp_adptv, f.Y)]
+    f.writer = writers.namespacewriter(options={"stats": True})
+    f.writer.verbosity = 0
+    f.run()
+    stats = f.integrator.stats
+    assert stats.naccepted > 0
+    assert stats.nrejected > 0
+    assert stats.nfev == 6 * (stats.naccepted + stats.nrejected)
+    assert stats.njev == 0
+    assert stats.nsolve == 0
+    nfev = f.writer.read.sequence("integrator.nfev")
+    assert nfev[0] == 0
+    assert nfev[-1] == stats.nfev
+    stats.reset()
+    assert stats.nfev == 0
+    f.writer.reset()
+
+
+def test_statistics_implicit():
+    f = Frame()
+    f.addfield("Y", [1., 1.])
+
+    def jac(f, x):
+        return -np.eye(2)
+    f.Y.jacobinator = jac
+    f.addintegrationvariable("x", 0.)
+
+    def dx(f):
+        return 0.1
+    f.x.updater = dx
+    f.x.snapshots = [1.]
+
+    f.integrator = Integrator(f.x)
+    f.integrator.instructions = [Instruction(
+        schemes.impl_1_euler_direct, f.Y)]
+    f.verbosity = 0
+    f.run()
+    stats = f.integrator.stats
+    assert stats.nsolve == stats.naccepted
+    assert stats.njev == stats.naccepted
+    f.Y.derivative()
+    assert stats.nfev == 0
+    assert stats.njev == stats.naccepted + 1
+
+
+def test_statistics_old_pickle():
+    f = Frame()
+    f.addfield("Y", 1.)
+    f.addintegrationvariable("x", 0.)
+    f.integrator = Integrator(f.x)
+    # Integrators pickled before statistics, memo, and error norm existed
+    for key in ["_errornorm", "_memo", "_stats"]:
+        del f.integrator.__dict__[key]
+    f = pickle.loads(pickle.dumps(f))
+    assert f.integrator.errornorm is None
+    f.Y.derivative()
+    assert f.integrator.stats.nfev == 0
+    assert isinstance(f.integrator.memo, Memo)
@@ -0,0 +1,101 @@
+# Tests for the binarywriter writer
+
+
+import numpy as np
+import pytest
+from simframe import Frame
+from simframe import Instruction
+from simframe import Integrator
+from simframe import schemes
+from simframe import writers
+from simframe.io.writers.binarywriter import _readheader
+
+
+def test_binarywriter_run():
+    f = Frame(description="binary")
+    f.addgroup("G")
+    f.addfield("Y", [1., 2.])
+    f.G.addfield("A", np.arange(6, dtype=np.int32).reshape(2, 3))
+    f.G.addfield("gas", f.Y, view=0)
+    f.G.s = "test"
+    f.G.l = ["a", "b"]
+    f.flag = True
+    f.Y.differentiator = lambda f, x, Y: -Y
+    f.addintegrationvariable("x", 0., snapshots=[0., 0.5, 1.])
+    f.x.updater = lambda f: 0.1
+    f.integrator = Integrator(f.x)
+    f.integrator.instructions = [Instruction(schemes.expl_1_euler, f.Y)]
+    f.writer = writers.binarywriter(options={"stats": True})
+    f.writer.verbosity = 0
+    f.verbosity = 0
+    f.run()
+    assert len(f.writer.read.listfiles()) == 3
+    data = f.writer.read.output(2)
+    assert isinstance(data.Y, np.memmap)
+    assert not data.Y.flags.writeable
+    assert np.all(data.Y == f.Y)
+    assert data.G.A.dtype == np.int32
+    assert np.all(data.G.A == f.G.A)
+    assert data.G.gas == f.Y[0]
+    # Views are stored as metadata and read from their parents
+    header = _readheader(f.writer._getfilename(2))[0]
+    assert header["views"]["G.gas"]["parent"] == "Y"
+    assert "G.gas" not in header["fields"]
+    assert np.shares_memory(data.G.gas, data.Y)
+    assert np.all(f.writer.read.sequence("G.gas") == f.writer.read.sequence("Y")[:, 0])
+    assert data.G.s == "test"
+    assert data.G.l == ["a", "b"]
+    assert data.flag
+    # The description is kept apart from the data
+    assert "description" not in data.__dict__
+    assert _readheader(f.writer.read.listfiles()[2])[0]["description"] == "binary"
+    assert data.integrator.nfev > 0
+    assert data.Y.ctypes.data % 64 == 0
+    Y = f.writer.read.sequence("Y")
+    assert Y.shape == (3, 2)
+    assert np.allclose(Y[-1], f.Y)
+    assert np.all(f.writer.read.sequence("G.A", snapshots=[0, 2], index=(1, 2)) == [5, 5])
+    alldata = f.writer.read.all()
+    assert np.allclose(alldata.x, [0., 0.5, 1.])
+    assert np.all(alldata.G.s == "test")
+    lazy = f.writer.read.all(lazy=True)
+    assert np.allclose(lazy.Y[1:], Y[1:])
+    with pytest.raises(KeyError):
+        f.writer.read.sequence("Z")
+    with pytest.raises(RuntimeError):
+        f.writer.read.output(3)
+    # Fields named description do not collide with the description
+    f.addfield("description", [3., 4.])
+    f.writeoutput(3)
+    assert np.all(f.writer.read.output(3).description == [3., 4.])
+    assert _readheader(f.writer._getfilename(3))[0]["description"] == "binary"
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_binarywriter_errors():
+    f = Frame()
+    f.writer = writers.binarywriter()
+    f.writer.verbosity = 0
+    f.n = None
+    with pytest.raises(ValueError):
+        f.writeoutput(0)
+    f.n = [1, None]
+    with pytest.raises(ValueError):
+        f.writeoutput(0)
+    f.n = {1: 1}
+    with pytest.raises(NotImplementedError):
+        f.writeoutput(0)
+    f.n = 1
+    f.writeoutput(0)
+    filename = f.writer._getfilename(0)
+    with open(filename, "wb") as file:
+        file.write(b"corrupt")
+    with pytest.raises(RuntimeError):
+        f.writer.read.output(0)
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
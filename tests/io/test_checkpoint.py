@@ -0,0 +1,80 @@
+# Tests for the Checkpoint class
+
+
+import pytest
+from simframe import Frame
+from simframe import writers
+from simframe.io import Checkpoint
+
+
+def test_checkpoint_attributes():
+    cp = Checkpoint()
+    with pytest.raises(TypeError):
+        cp.every = 1.
+    with pytest.raises(ValueError):
+        cp.every = 0
+    with pytest.raises(TypeError):
+        cp.interval = "_"
+    with pytest.raises(ValueError):
+        cp.interval = -1.
+    with pytest.raises(TypeError):
+        cp.keep = None
+    with pytest.raises(ValueError):
+        cp.keep = 0
+    with pytest.raises(TypeError):
+        cp.description = 1
+    assert isinstance(repr(cp), str)
+    assert isinstance(str(cp), str)
+    f = Frame()
+    f.writer = writers.hdf5writer()
+    with pytest.raises(TypeError):
+        f.writer.checkpoint = 1
+
+
+def test_checkpoint_due():
+    cp = Checkpoint(every=3)
+    assert [cp.due() for i in range(6)] == [
+        False, False, True, False, False, True]
+    cp = Checkpoint()
+    assert all([cp.due() for i in range(6)])
+    cp = Checkpoint(interval=600.)
+    assert not any([cp.due() for i in range(6)])
+    cp = Checkpoint(every=None, interval=0.)
+    assert all([cp.due() for i in range(6)])
+
+
+def test_checkpoint_rotation():
+    f = Frame()
+    f.addfield("x", 0.)
+    f.writer = writers.hdf5writer(checkpoint=Checkpoint(every=2, keep=3))
+    f.writer.verbosity = 0
+    for i in range(8):
+        f.x = i
+        f.writeoutput(i)
+    dumps = sorted(file.name for file in f.writer.datadir.glob("frame.dmp*"))
+    assert dumps == ["frame.dmp", "frame.dmp.1", "frame.dmp.2"]
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_checkpoint_signal_only():
+    f = Frame()
+    f.addfield("x", 0.)
+    f.writer = writers.hdf5writer(dumping=False, checkpoint=Checkpoint(keep=2))
+    f.writer.verbosity = 0
+    for i in range(3):
+        f.writeoutput(i)
+    assert list(f.writer.datadir.glob("frame.dmp*")) == []
+    # Dump files are only written on request
+    for i in range(2):
+        f.writer.datadir.joinpath("DUMP").touch()
+        f.listener.listen()
+        assert not f.writer.datadir.joinpath("DUMP").exists()
+    dumps = sorted(file.name for file in f.writer.datadir.glob("frame.dmp*"))
+    assert dumps == ["frame.dmp", "frame.dmp.1"]
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
@@ -1,10 +1,14 @@
 # This unit test writes and reads a dump file
 
 
+import numpy as np
 import os
 from simframe import Frame
 from simframe import writers
+from simframe.frame import Field
+from simframe.io import Checkpoint
 from simframe.io import readdump
+from simframe.io.dump import _readtable
 
 
 def test_write_read_dump():
@@ -24,3 +28,33 @@ def test_write_read_dump():
     for file in files:
         file.unlink()
     f.writer.datadir.rmdir()
+
+
+def test_write_read_dump_outofband():
+    f = Frame()
+    f.addfield("x", [0., 1., 2.])
+    f.addgroup("A")
+    f.A.addfield("x", 1.)
+    f.addfield("s", ["a", "b"])
+    f.addfield("v", f.x, view=slice(1, 3))
+    f.writer = writers.hdf5writer(checkpoint=Checkpoint(outofband=True))
+    f.writer.verbosity = 0
+    f.writer.writedump(f)
+    dumpfile = os.path.join(f.writer.datadir, "frame.dmp")
+    with open(dumpfile, "rb") as file:
+        assert len(_readtable(file)) > 0
+    for mmap in [True, False]:
+        d = readdump(dumpfile, mmap=mmap)
+        assert isinstance(d.x, Field)
+        assert isinstance(d.x.base, np.memmap) == mmap
+        assert np.all(d.x == [0., 1., 2.])
+        assert d.A.x == 1.
+        assert d.x._owner is d
+        d.x = [2., 1., 0.]
+        assert np.all(d.x == [2., 1., 0.])
+        assert np.all(d.v == [1., 0.])
+    assert np.all(readdump(dumpfile).x == [0., 1., 2.])
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
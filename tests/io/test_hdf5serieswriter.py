@@ -0,0 +1,178 @@
+# Tests for the hdf5serieswriter writer
+
+
+import h5py
+import numpy as np
+import pytest
+from simframe import Frame
+from simframe import Instruction
+from simframe import Integrator
+from simframe import schemes
+from simframe import writers
+from simframe.io.writers.hdf5serieswriter import _chunks
+
+
+def test_hdf5serieswriter_run():
+    f = Frame()
+    f.addgroup("G")
+    f.addfield("Y", [1., 2.])
+    f.G.addfield("s", "test")
+    f.G.l = ["a", "b"]
+    f.n = 1
+    f.Y.differentiator = lambda f, x, Y: -Y
+    f.addintegrationvariable("x", 0., snapshots=[0., 0.5, 1.])
+    f.x.updater = lambda f: 0.1
+    f.integrator = Integrator(f.x)
+    f.integrator.instructions = [Instruction(schemes.expl_1_euler, f.Y)]
+    f.writer = writers.hdf5serieswriter(options={"com": "lzf", "comopts": None, "stats": True})
+    f.writer.verbosity = 0
+    f.verbosity = 0
+    assert isinstance(repr(f.writer), str)
+    f.run()
+    files = list(f.writer.datadir.glob("*.hdf5"))
+    assert len(files) == 1
+    with h5py.File(files[0], "r") as hdf5file:
+        assert hdf5file["Y"].shape == (3, 2)
+        assert hdf5file["Y"].maxshape == (None, 2)
+        assert np.allclose(hdf5file["_intvar"][()], [0., 0.5, 1.])
+    data = f.writer.read.output(1)
+    assert np.isclose(data.x, 0.5)
+    assert data.G.s == b"test"
+    Y = f.writer.read.sequence("Y")
+    assert Y.shape == (3, 2)
+    assert np.allclose(Y[-1], f.Y)
+    data = f.writer.read.all()
+    assert np.allclose(data.x, [0., 0.5, 1.])
+    assert np.all(data.G.l == [b"a", b"b"])
+    assert np.all(data.n == [1, 1, 1])
+    assert np.all(np.diff(data.integrator.nfev) > 0)
+    with pytest.raises(RuntimeError):
+        f.writer.read.output(3)
+    with pytest.raises(RuntimeError):
+        f.writeoutput(2)
+    f.writeoutput(2, forceoverwrite=True)
+    # Restart from output
+    f.Y[...] = 0.
+    f.restart(1)
+    assert np.allclose(f.Y, Y[1])
+    assert np.isclose(f.x, 0.5)
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_hdf5serieswriter_errors():
+    f = Frame()
+    f.addfield("Y", [1., 2.])
+    f.writer = writers.hdf5serieswriter()
+    f.writer.verbosity = 0
+    with pytest.raises(RuntimeError):
+        f.writer.read.all()
+    f.writeoutput(0)
+    f.addfield("Y", [1., 2., 3.])
+    with pytest.raises(ValueError):
+        f.writeoutput(1)
+    f.n = None
+    with pytest.raises(ValueError):
+        f.writeoutput(2)
+    f.n = {1: 1}
+    with pytest.raises(NotImplementedError):
+        f.writeoutput(2)
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_hdf5serieswriter_partial_sequence():
+    f = Frame()
+    f.addfield("Y", np.arange(12.).reshape(3, 4))
+    f.writer = writers.hdf5serieswriter()
+    f.writer.verbosity = 0
+    for i in range(6):
+        f.Y += 1.
+        f.writeoutput(i)
+    Y = f.writer.read.sequence("Y")
+    assert np.all(f.writer.read.sequence("Y", snapshots=slice(0, None, 2), index=(1, 2)) == Y[::2, 1, 2])
+    assert np.all(f.writer.read.sequence("Y", snapshots=-1) == Y[-1:])
+    assert np.all(f.writer.read.sequence("Y", snapshots=[4, 1, 4], index=np.s_[:, ::-1]) == Y[[4, 1, 4], :, ::-1])
+    assert np.all(f.writer.read.sequence("Y", snapshots=slice(None, None, -1)) == Y[::-1])
+    data = f.writer.read.all(snapshots=slice(3, None))
+    assert np.all(data.Y == Y[3:])
+    lazy = f.writer.read.all(lazy=True, snapshots=[1, 2])
+    assert np.all(lazy.Y[:] == Y[1:3])
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_hdf5serieswriter_missing_outputs():
+    f = Frame()
+    f.addfield("Y", [1., 2.])
+    f.writer = writers.hdf5serieswriter()
+    f.writer.verbosity = 0
+    for i in [0, 3, 4]:
+        f.Y += 1.
+        f.writeoutput(i)
+    assert np.all(f.writer.read.output(0).Y == [2., 3.])
+    with pytest.raises(RuntimeError):
+        f.writer.read.output(1)
+    Y = f.writer.read.sequence("Y")
+    assert np.all(Y == [[2., 3.], [3., 4.], [4., 5.]])
+    assert np.all(f.writer.read.sequence("Y", snapshots=slice(2, None), index=0) == [3., 4.])
+    assert np.all(f.writer.read.all().Y == Y)
+    lazy = f.writer.read.all(lazy=True)
+    assert lazy.Y.shape == (3, 2)
+    assert np.all(lazy.Y[:] == Y)
+    with pytest.raises(RuntimeError):
+        f.writer.read.sequence("Y", snapshots=[1, 2])
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_hdf5serieswriter_chunks():
+    assert _chunks(np.zeros(10)) == (819, 10)
+    chunks = _chunks(np.zeros((3, 10**7)))
+    assert chunks[0] == 1
+    assert np.prod(chunks) * 8 <= 65536
+    assert np.prod(chunks) * 8 > 32768
+    assert _chunks(np.zeros((), dtype=np.int8)) == (65536,)
+
+
+def test_hdf5serieswriter_views():
+    f = Frame()
+    f.addfield("Y", np.arange(6.))
+    f.addgroup("G")
+    f.G.addfield("gas", f.Y, view=slice(0, 4), shape=(2, 2))
+    f.G.addfield("T", f.Y, view=5)
+    f.addfield("Z", np.arange(3.), save=False)
+    f.addfield("z", f.Z, view=slice(1, 3))
+    f.writer = writers.hdf5serieswriter()
+    f.writer.verbosity = 0
+    for i in range(3):
+        f.Y += 1.
+        f.Z += 1.
+        f.writeoutput(i)
+    with h5py.File(f.writer._getfilename(), "r") as hdf5file:
+        assert "view" in hdf5file["G/gas"].attrs
+        assert "view" not in hdf5file["z"].attrs
+    data = f.writer.read.output(2)
+    assert np.all(data.G.gas == f.G.gas)
+    assert data.G.T == f.Y[5]
+    assert np.all(data.z == f.z)
+    Y = f.writer.read.sequence("Y")
+    assert np.all(f.writer.read.sequence("G.gas") == Y[:, :4].reshape(3, 2, 2))
+    assert np.all(f.writer.read.sequence("G.gas", snapshots=[2, 0], index=(1, 0)) == Y[[2, 0], 2])
+    assert np.all(f.writer.read.sequence("G.T") == Y[:, 5])
+    alldata = f.writer.read.all()
+    assert np.all(alldata.G.gas == Y[:, :4].reshape(3, 2, 2))
+    lazy = f.writer.read.all(lazy=True)
+    assert np.all(lazy.G.gas[1:, 0] == Y[1:, :2])
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
@@ -1,10 +1,13 @@
 # Tests for the hdf5writer writer
 
 
+import h5py
 import numpy as np
 import pytest
 from simframe import Frame
 from simframe import writers
+from simframe.io.writers.hdf5writer import _stack
+from simframe.utils.simplenamespace import SimpleNamespace
 
 
 def test_hdf5writer_skip():
@@ -128,3 +131,136 @@ def test_hdf5writer_list():
     for file in files:
         file.unlink()
     f.writer.datadir.rmdir()
+
+
+def test_hdf5writer_view():
+    f = Frame()
+    f.addgroup("G")
+    f.addfield("Y", np.arange(6.))
+    f.G.addfield("gas", f.Y, view=slice(0, 4), shape=(2, 2))
+    f.addfield("Z", np.arange(3.), save=False)
+    f.addfield("z", f.Z, view=0)
+    f.writer = writers.hdf5writer()
+    f.writer.verbosity = 0
+    f.writeoutput(0)
+    with h5py.File(f.writer._getfilename(0), "r") as hdf5file:
+        assert "view" in hdf5file["G/gas"].attrs
+        assert hdf5file["G/gas"].shape is None
+        assert "view" not in hdf5file["z"].attrs
+    data = f.writer.read.output(0)
+    assert np.all(data.G.gas == [[0., 1.], [2., 3.]])
+    assert data.z == 0.
+    seq = f.writer.read.sequence("G.gas")
+    assert seq.shape == (1, 2, 2)
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_hdf5writer_all_batched(monkeypatch):
+    f = Frame()
+    f.addgroup("G")
+    f.addfield("Y", np.arange(3.))
+    f.G.addfield("A", np.ones((2, 2)))
+    f.G.s = "test"
+    f.n = 1
+    f.writer = writers.hdf5writer()
+    f.writer.verbosity = 0
+    for i in range(4):
+        f.Y += 1.
+        f.writeoutput(i)
+        # Data type changes
+        f.n = 1.5
+    opened = []
+    File = h5py.File
+
+    def countingfile(name, *args, **kwargs):
+        opened.append(str(name))
+        return File(name, *args, **kwargs)
+    monkeypatch.setattr(h5py, "File", countingfile)
+    data = f.writer.read.all()
+    assert sorted(opened) == sorted(f.writer.read.listfiles())
+    monkeypatch.undo()
+    assert np.all(data.Y == f.writer.read.sequence("Y"))
+    assert data.G.A.shape == (4, 2, 2)
+    assert np.all(data.G.s == b"test")
+    assert np.all(data.n == [1., 1.5, 1.5, 1.5])
+    # Preallocated columns are not copied again
+    column = np.zeros(4)
+    ns = SimpleNamespace(Y=0., G=SimpleNamespace(l=0.))
+    stacked = _stack(ns, {"Y": column, "G/l": [1., 2.]})
+    assert stacked.Y is column
+    assert np.all(stacked.G.l == [1., 2.])
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_hdf5writer_partial_sequence(monkeypatch):
+    f = Frame()
+    f.addfield("Y", np.arange(12.).reshape(3, 4))
+    f.writer = writers.hdf5writer()
+    f.writer.verbosity = 0
+    for i in range(6):
+        f.Y += 1.
+        f.writeoutput(i)
+    Y = f.writer.read.sequence("Y")
+    opened = []
+    File = h5py.File
+
+    def countingfile(name, *args, **kwargs):
+        opened.append(str(name))
+        return File(name, *args, **kwargs)
+    monkeypatch.setattr(h5py, "File", countingfile)
+    seq = f.writer.read.sequence("Y", snapshots=slice(0, None, 2), index=(1, 2))
+    assert len(opened) == 3
+    monkeypatch.undo()
+    assert np.all(seq == Y[::2, 1, 2])
+    assert np.all(f.writer.read.sequence("Y", snapshots=-1) == Y[-1:])
+    assert np.all(f.writer.read.sequence("Y", snapshots=[4, 1], index=np.s_[:, ::-1]) == Y[[4, 1], :, ::-1])
+    assert np.all(f.writer.read.sequence("Y", index=0) == Y[:, 0])
+    data = f.writer.read.all(snapshots=slice(3, None))
+    assert np.all(data.Y == Y[3:])
+    with pytest.raises(RuntimeError):
+        f.writer.read.sequence("Y", snapshots=slice(10, None))
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_hdf5writer_storage_options():
+    f = Frame()
+    f.addgroup("G")
+    f.addfield("small", np.arange(3.))
+    f.addfield("large", np.arange(1000.))
+    f.G.addfield("hot", np.arange(1000.))
+    f.G.addfield("grid", np.arange(1000.).reshape(10, 100))
+    f.writer = writers.hdf5writer()
+    f.writer.verbosity = 0
+    f.writer.options = {"com": "lzf", "comopts": None, "shuffle": True, "threshold": 1024,
+                        "fieldopts": {"G.hot": {"com": None},
+                                      "G.grid": {"com": "gzip", "comopts": 4, "chunks": (5, 100)}}}
+    f.writeoutput(0)
+    with h5py.File(f.writer._getfilename(0), "r") as hdf5file:
+        assert hdf5file["small"].chunks is None
+        assert hdf5file["small"].compression is None
+        assert hdf5file["large"].compression == "lzf"
+        assert hdf5file["large"].shuffle
+        assert hdf5file["G/hot"].chunks is None
+        assert hdf5file["G/hot"].compression is None
+        assert hdf5file["G/grid"].compression == "gzip"
+        assert hdf5file["G/grid"].compression_opts == 4
+        assert hdf5file["G/grid"].chunks == (5, 100)
+    data = f.writer.read.output(0)
+    assert np.all(data.G.grid == f.G.grid)
+    assert np.all(data.small == f.small)
+    f.writer.options["fieldopts"] = {"G.hot": {"level": 1}}
+    with pytest.raises(ValueError):
+        f.writeoutput(1)
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
@@ -0,0 +1,105 @@
+# Tests for the LazySequence class
+
+
+import numpy as np
+import pytest
+from simframe import Frame
+from simframe import writers
+from simframe.io import LazySequence
+
+
+def _frame(writer):
+    f = Frame()
+    f.addgroup("G")
+    f.addfield("Y", np.arange(6.).reshape(2, 3))
+    f.G.addfield("A", 0.)
+    f.G.s = "test"
+    f.writer = writer
+    f.writer.verbosity = 0
+    for i in range(5):
+        f.Y += 1.
+        f.G.A += 1.
+        f.writeoutput(i)
+    return f
+
+
+def test_lazysequence_hdf5writer():
+    f = _frame(writers.hdf5writer())
+    data = f.writer.read.all()
+    lazy = f.writer.read.all(lazy=True, cachesize=2)
+    assert isinstance(lazy.Y, LazySequence)
+    assert isinstance(repr(lazy.Y), str)
+    assert lazy.Y.shape == (5, 2, 3)
+    assert lazy.Y.dtype == np.float64
+    assert lazy.Y.ndim == 3
+    assert lazy.Y.size == 30
+    assert len(lazy.Y) == 5
+    assert np.all(lazy.Y[2] == data.Y[2])
+    assert np.all(lazy.Y[1:4, 0, ::2] == data.Y[1:4, 0, ::2])
+    assert np.all(lazy.Y[::-1, :, ::-1] == data.Y[::-1, :, ::-1])
+    assert np.all(lazy.Y[[0, 3]] == data.Y[[0, 3]])
+    assert np.all(lazy.Y[..., 1] == data.Y[..., 1])
+    assert np.all(np.asarray(lazy.Y) == data.Y)
+    assert np.all(lazy.G.A[:] == data.G.A)
+    assert np.all(lazy.G.s[:] == data.G.s)
+    assert len(lazy.Y._cache) == 2
+    # Cached parts cannot be modified by the caller
+    lazy.Y[2][...] = -1.
+    assert np.all(lazy.Y[2] == data.Y[2])
+    assert lazy.Y[5:].shape == (0, 2, 3)
+    assert lazy.Y[5:, 1].shape == (0, 3)
+    # Large index arrays are not confused by shortened representations
+    big = np.zeros(2000, dtype=int)
+    other = big.copy()
+    other[1000] = 2
+    assert repr(big) == repr(other)
+    assert np.all(lazy.Y[1, 0, big] == data.Y[1, 0, big])
+    assert np.all(lazy.Y[1, 0, other] == data.Y[1, 0, other])
+    lazy.Y.clear()
+    assert len(lazy.Y._cache) == 0
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_lazysequence_cache(monkeypatch):
+    f = _frame(writers.hdf5writer())
+    lazy = f.writer.read.all(lazy=True)
+    reads = []
+    readitem = f.writer.read._readitem
+
+    def countingreaditem(output, field, index=()):
+        reads.append(output)
+        return readitem(output, field, index)
+    monkeypatch.setattr(f.writer.read, "_readitem", countingreaditem)
+    lazy.Y[1:3, 0]
+    assert len(reads) == 2
+    lazy.Y[1:4, 0]
+    assert len(reads) == 3
+    lazy.Y[1]
+    assert len(reads) == 4
+    monkeypatch.undo()
+    with pytest.raises(TypeError):
+        LazySequence(f.writer.read, [], "Y", (), float, cachesize=1.)
+    with pytest.raises(ValueError):
+        LazySequence(f.writer.read, [], "Y", (), float, cachesize=-1)
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_lazysequence_writers():
+    for writer in [writers.namespacewriter(), writers.hdf5serieswriter()]:
+        f = _frame(writer)
+        data = f.writer.read.all()
+        lazy = f.writer.read.all(lazy=True)
+        assert lazy.Y.shape == data.Y.shape
+        assert np.all(lazy.Y[1:, 1] == data.Y[1:, 1])
+        assert np.all(lazy.G.A[-1] == data.G.A[-1])
+        if f.writer.datadir.exists():
+            files = f.writer.datadir.glob("*")
+            for file in files:
+                file.unlink()
+            f.writer.datadir.rmdir()
@@ -92,3 +92,80 @@ def test_namespacewriter_read_sequence():
     Y = f.writer.read.sequence("Y")
     assert np.all(Y == [1., 0.])
     f.writer.reset()
+
+
+def test_namespacewriter_view():
+    f = Frame()
+    f.addfield("Y", np.arange(4.))
+    f.addfield("y", f.Y, view=slice(2, 4))
+    f.writer = writers.namespacewriter()
+    f.writer.verbosity = 0
+    f.writeoutput(0)
+    data = f.writer.read.output(0)
+    assert np.shares_memory(data.Y, data.y)
+    assert np.all(data.y == [2., 3.])
+    f.Y = 0.
+    assert np.all(data.y == [2., 3.])
+
+
+def test_namespacewriter_partial_sequence():
+    f = Frame()
+    f.addfield("Y", np.arange(12.).reshape(3, 4))
+    f.writer = writers.namespacewriter()
+    f.writer.verbosity = 0
+    for i in range(6):
+        f.Y += 1.
+        f.writeoutput(i)
+    Y = f.writer.read.sequence("Y")
+    assert np.all(f.writer.read.sequence("Y", snapshots=slice(0, None, 2), index=(1, 2)) == Y[::2, 1, 2])
+    assert np.all(f.writer.read.sequence("Y", snapshots=[4, 1], index=0) == Y[[4, 1], 0])
+    data = f.writer.read.all(snapshots=slice(3, None))
+    assert np.all(data.Y == Y[3:])
+    f.writer.reset()
+
+
+def test_namespacewriter_columns():
+    f = Frame()
+    f.addfield("Y", np.arange(4.))
+    f.addfield("y", f.Y, view=slice(1, 3))
+    f.addfield("n", 0)
+    f.s = "a"
+    f.writer = writers.namespacewriter()
+    f.writer.verbosity = 0
+    for i in range(10):
+        f.Y += 1.
+        f.n += 1
+        f.s += "a"
+        f.writeoutput(i)
+    assert "y" not in f.writer._columns
+    Y = f.writer.read.sequence("Y")
+    assert Y.shape == (10, 4)
+    assert np.shares_memory(Y, f.writer._columns["Y"].data)
+    assert not Y.flags.writeable
+    assert np.all(Y[:, 0] == np.arange(1., 11.))
+    assert np.shares_memory(f.writer.read.sequence(
+        "Y", snapshots=slice(None, None, -3), index=slice(1, None)), Y)
+    y = f.writer.read.sequence("y")
+    assert np.shares_memory(y, Y)
+    assert np.all(y == Y[:, 1:3])
+    assert np.all(f.writer.read.sequence("n") == np.arange(1, 11))
+    assert f.writer.read.sequence("s")[-1] == "a" * 11
+    data = f.writer.read.output(-1)
+    assert np.all(data.Y == Y[-1])
+    assert np.shares_memory(data.y, data.Y)
+    assert np.all(f.writer.read.all().y == y)
+    f.addfield("Z", 0.)
+    f.addfield("Y", np.arange(3.))
+    f.writeoutput(10)
+    assert isinstance(f.writer._columns["Y"].data, list)
+    with pytest.raises(RuntimeError):
+        f.writer.read.sequence("Z")
+    assert np.all(f.writer.read.sequence("Z", snapshots=[10]) == 0.)
+    assert np.all(f.writer.read.output(10).Y == [0., 1., 2.])
+    assert np.all(f.writer.read.sequence(
+        "Y", snapshots=slice(8, 10), index=0) == [9., 10.])
+    assert np.all(f.writer.read.all(lazy=True, snapshots=[0, 9]).y[:, 0] == Y[[0, 9], 1])
+    f.writer.reset()
+    with pytest.raises(RuntimeError):
+        f.writer.read.output(0)
+    assert np.all(Y[:, 0] == np.arange(1., 11.))
@@ -11,6 +11,7 @@ from simframe import schemes
 from simframe import writers
 from simframe.io import Reader
 from simframe.io import Writer
+from simframe.io import reader
 
 
 def test_reader_attributes():
@@ -29,6 +30,14 @@ def test_reader_attributes():
         reader.output(string)
     with pytest.raises(NotImplementedError):
         reader.sequence(string)
+    with pytest.raises(TypeError):
+        reader.workers = 1.
+    with pytest.raises(ValueError):
+        reader.workers = 0
+    with pytest.raises(TypeError):
+        reader.executor = 1
+    with pytest.raises(ValueError):
+        reader.executor = "mpi"
 
 
 def test_not_implemented_functions():
@@ -96,3 +105,97 @@ def test_simple_read_files():
     with pytest.raises(RuntimeError):
         f.writer.read.sequence("x")
     f.writer.datadir = "data"
+
+
+def test_reader_workers():
+    f = Frame()
+    f.addgroup("G")
+    f.addfield("Y", np.arange(3.))
+    f.G.addfield("A", np.ones((2, 2)))
+    f.writer = writers.hdf5writer()
+    f.writer.verbosity = 0
+    for i in range(6):
+        f.Y += 1.
+        f.writeoutput(i)
+    assert f.writer.read.executor == "process"
+    data = f.writer.read.all()
+    for executor in ["thread", "process"]:
+        f.writer.read.workers = 3
+        f.writer.read.executor = executor
+        assert np.all(f.writer.read.sequence("Y") == data.Y)
+        dataw = f.writer.read.all()
+        assert np.all(dataw.Y == data.Y)
+        assert np.all(dataw.G.A == data.G.A)
+    # Corrupt files are reported in the order of the files
+    files = f.writer.read.listfiles()
+    for i in [2, 4]:
+        with open(files[i], "w") as file:
+            file.write("corrupt")
+    for workers in [1, 2, 3]:
+        f.writer.read.workers = workers
+        with pytest.raises(OSError) as excinfo:
+            f.writer.read.sequence("Y")
+        assert files[2] in "".join(getattr(excinfo.value, "__notes__", [files[2]]))
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_reader_manifest(monkeypatch):
+    f = Frame()
+    f.addgroup("G")
+    f.G.addfield("A", np.ones((2, 3)))
+    f.addfield("Y", 0.)
+    f.addintegrationvariable("x", 0.)
+    f.integrator = Integrator(f.x)
+    f.writer = writers.hdf5writer(zfill=1)
+    f.writer.verbosity = 0
+    for i in range(12):
+        f.Y += 1.
+        f.x += 1.
+        f.writeoutput(i)
+    f.writeoutput(filename=str(f.writer.datadir.joinpath("data_extra.hdf5")))
+    entries = f.writer.read.manifest()
+    assert [entry["output"] for entry in entries] == list(range(12))
+    assert entries[3]["x"] == 4.
+    assert entries[0]["fields"]["G.A"] == {"shape": [2, 3], "dtype": "<f8"}
+    assert np.all(f.writer.read.sequence("Y") == np.arange(1., 13.))
+    # The data directory is not searched if there is a manifest
+    with monkeypatch.context() as m:
+        m.setattr(reader.glob, "glob", None)
+        assert f.writer.read.listfiles() == [str(f.writer._getfilename(i)) for i in range(12)]
+    # Rewritten outputs and incomplete lines
+    f.Y[...] = 0.
+    f.writeoutput(2, forceoverwrite=True)
+    with open(f.writer._getmanifestname(), "a") as file:
+        file.write('{"output": 12, "fi')
+    assert len(f.writer.read.manifest()) == 12
+    assert f.writer.read.sequence("Y")[2] == 0.
+    # Stale manifests are ignored
+    f.writer._getfilename(11).unlink()
+    files = f.writer.read.listfiles()
+    assert len(files) == 12
+    assert str(f.writer._getfilename(11)) not in files
+    # Outputs missing in the manifest are found in the data directory
+    f.writer.manifest = False
+    f.writeoutput(12)
+    files = f.writer.read.listfiles()
+    assert len(files) == 13
+    assert str(f.writer._getfilename(12)) in files
+    # Writers with different filenames have their own manifests
+    f.writer.filename = "other"
+    f.writer.manifest = True
+    f.writeoutput(0)
+    assert len(f.writer.read.listfiles()) == 1
+    assert f.writer._getmanifestname().name == "other.manifest.jsonl"
+    f.writer.filename = "data"
+    assert len(f.writer.read.manifest()) == 12
+    # Without manifest the files are sorted by their numbers
+    f.writer._getmanifestname().unlink()
+    files = f.writer.read.listfiles()
+    assert files[:12] == [str(f.writer._getfilename(i)) for i in list(range(11)) + [12]]
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
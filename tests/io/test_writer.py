@@ -38,6 +38,10 @@ def test_writer_attributes():
         writer.dumping = string
     writer.dumping = False
     assert not writer.dumping
+    with pytest.raises(TypeError):
+        writer.manifest = string
+    writer.manifest = False
+    assert not writer.manifest
     with pytest.raises(TypeError):
         writer.verbosity = string
     with pytest.raises(TypeError):
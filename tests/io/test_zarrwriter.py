@@ -0,0 +1,124 @@
+# Tests for the zarrwriter writer
+
+
+import json
+import numpy as np
+import os
+import pytest
+import shutil
+from simframe import Frame
+from simframe import Instruction
+from simframe import Integrator
+from simframe import schemes
+from simframe import writers
+
+
+def test_zarrwriter_run():
+    f = Frame(description="zarr")
+    f.addgroup("G")
+    f.addfield("Y", np.arange(20.).reshape(10, 2))
+    f.G.addfield("A", np.arange(6, dtype=np.int32).reshape(3, 2))
+    f.G.addfield("gas", f.Y, view=(0, 1))
+    f.G.s = "test"
+    f.G.l = ["a", "b"]
+    f.flag = True
+    f.Y.differentiator = lambda f, x, Y: -Y
+    f.addintegrationvariable("x", 0., snapshots=[0., 0.5, 1.])
+    f.x.updater = lambda f: 0.1
+    f.integrator = Integrator(f.x)
+    f.integrator.instructions = [Instruction(schemes.expl_1_euler, f.Y)]
+    f.writer = writers.zarrwriter(
+        options={"level": 1, "chunksize": 48, "workers": 2, "stats": True})
+    f.writer.verbosity = 0
+    f.verbosity = 0
+    f.run()
+    files = f.writer.read.listfiles()
+    assert len(files) == 3
+    meta = json.load(open(os.path.join(files[2], "Y", ".zarray")))
+    assert meta["chunks"] == [3, 2]
+    assert meta["compressor"] == {"id": "zlib", "level": 1}
+    assert os.path.isfile(os.path.join(files[2], "Y", "3.0"))
+    assert os.path.isfile(os.path.join(files[2], "x", "0"))
+    data = f.writer.read.output(2)
+    assert np.all(data.Y == f.Y)
+    assert data.G.A.dtype == np.int32
+    assert np.all(data.G.A == f.G.A)
+    assert data.G.gas == f.Y[0, 1]
+    # Views are stored as metadata and read from their parents
+    attrs = json.load(open(os.path.join(files[2], "G", ".zattrs")))
+    assert attrs["_views"]["gas"]["parent"] == "Y"
+    assert not os.path.exists(os.path.join(files[2], "G", "gas"))
+    assert data.G.s == "test"
+    assert data.G.l == ["a", "b"]
+    assert data.flag
+    # The description is metadata and not part of the data
+    assert "description" not in data.__dict__
+    assert json.load(open(os.path.join(files[2], ".zattrs")))["_description"] == "zarr"
+    assert data.integrator.nfev > 0
+    Y = f.writer.read.sequence("Y")
+    assert Y.shape == (3, 10, 2)
+    assert np.allclose(Y[-1], f.Y)
+    assert np.all(f.writer.read.sequence("G.gas") == Y[:, 0, 1])
+    for index in [4, -1, slice(2, 8, 3), slice(None, None, -2), slice(8, 1, -4), (slice(5, 5), 0), [1, 7], (..., 1)]:
+        assert np.all(f.writer.read.sequence("Y", index=index)
+                      == Y[(slice(None),) + (index if isinstance(index, tuple) else (index,))])
+    assert np.all(f.writer.read.sequence(
+        "G.A", snapshots=[0, 2], index=(2, 1)) == [5, 5])
+    assert np.all(f.writer.read.sequence("G.l", index=1) == "b")
+    alldata = f.writer.read.all()
+    assert np.allclose(alldata.x, [0., 0.5, 1.])
+    assert np.all(alldata.G.s == "test")
+    lazy = f.writer.read.all(lazy=True)
+    assert np.allclose(lazy.Y[1:, 2:5], Y[1:, 2:5])
+    with pytest.raises(KeyError):
+        f.writer.read.sequence("Z")
+    with pytest.raises(RuntimeError):
+        f.writer.read.output(3)
+    f.writer.overwrite = True
+    f.writer.options["level"] = None
+    f.writeoutput(2)
+    assert np.all(f.writer.read.output(2).Y == f.Y)
+    shutil.rmtree(f.writer.datadir)
+
+
+def test_zarrwriter_errors():
+    f = Frame()
+    f.writer = writers.zarrwriter()
+    f.writer.verbosity = 0
+    f.n = None
+    with pytest.raises(ValueError):
+        f.writeoutput(0)
+    f.n = [1, None]
+    with pytest.raises(ValueError):
+        f.writeoutput(0)
+    f.n = {1: 1}
+    with pytest.raises(NotImplementedError):
+        f.writeoutput(0)
+    shutil.rmtree(f.writer.datadir)
+
+
+def test_zarrwriter_chunks():
+    f = Frame()
+    f.addfield("Y", np.arange(1000.).reshape(1, 1000))
+    f.addfield("Z", np.arange(60.).reshape(3, 4, 5))
+    f.writer = writers.zarrwriter(options={"level": 1, "chunksize": 800, "workers": 2})
+    f.writer.verbosity = 0
+    f.writeoutput(0)
+    filename = f.writer._getfilename(0)
+    meta = json.load(open(os.path.join(filename, "Y", ".zarray")))
+    assert meta["chunks"] == [1, 100]
+    assert len(os.listdir(os.path.join(filename, "Y"))) == 11
+    meta = json.load(open(os.path.join(filename, "Z", ".zarray")))
+    assert meta["chunks"] == [3, 4, 5]
+    f.writer.options["chunksize"] = 48
+    f.writeoutput(1)
+    meta = json.load(open(os.path.join(f.writer._getfilename(1), "Z", ".zarray")))
+    assert meta["chunks"] == [1, 1, 5]
+    for i in [0, 1]:
+        data = f.writer.read.output(i)
+        assert np.all(data.Y == f.Y)
+        assert np.all(data.Z == f.Z)
+    for index in [(0, slice(95, 205)), (slice(None), 999), (..., slice(None, None, -7))]:
+        assert np.all(f.writer.read.sequence("Y", index=index)[0] == f.Y[index])
+    assert np.all(f.writer.read.sequence("Z", index=(1, slice(1, 3), 4))[1] == f.Z[1, 1:3, 4])
+    shutil.rmtree(f.writer.datadir)